@@ -3,6 +3,7 @@ from .models import (
     User,
     TeacherProfile,
     StudentProfile,
+    RollNumberSequence,
     Homework,
     Notice
 )
@@ -134,6 +135,34 @@ class StudentProfileAdmin(admin.ModelAdmin):
     get_last_name.short_description = 'Last Name'
 
 
+# ==================================================
+# 🔢 ROLL NUMBER SEQUENCE ADMIN
+# ==================================================
+@admin.register(RollNumberSequence)
+class RollNumberSequenceAdmin(admin.ModelAdmin):
+    """
+    Class + section wise last allotted roll number
+    """
+
+    list_display = (
+        'student_class',
+        'section',
+        'last_roll_no',
+    )
+
+    list_filter = (
+        'student_class',
+        'section',
+    )
+
+    ordering = (
+        'student_class',
+        'section',
+    )
+
+    list_per_page = 25
+
+
 # ==================================================
 # 📚 HOMEWORK ADMIN
 # ==================================================
@@ -0,0 +1,92 @@
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .models import User
+from .synthetic import generate_school
+
+
+# ==================================================
+# 📏 BENCHMARK SCHOOL SIZE
+# ==================================================
+# Itna data ki N+1 query turant budget tod de (har section 15
+# students), par suite phir bhi kuch seconds me chale
+BENCHMARK_SCHOOL = {
+    'classes': 2,
+    'students_per_section': 15,
+    'days': 90,
+    'exams': 2,
+    'months': 3,
+}
+
+
+def latency_scale():
+    """
+    Slow CI machine par settings.BENCHMARK_LATENCY_SCALE = 2 / 3 ...
+    (query budgets kabhi scale nahi hote)
+    """
+    return getattr(settings, 'BENCHMARK_LATENCY_SCALE', 1.0)
+
+
+# ==================================================
+# ⏱️ PERFORMANCE REGRESSION BASE CLASS
+# ==================================================
+class BenchmarkTestCase(TestCase):
+    """
+    Synthetic school ek baar per class (setUpTestData), har test
+    se pehle cache clear → cold path (worst case) measure hota hai.
+
+        with self.assertWithinBudget('fees_report', queries=8, ms=500):
+            response = self.client.get(url)
+    """
+
+    school_size = BENCHMARK_SCHOOL
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.school = generate_school(prefix='bench', **cls.school_size)
+        cls.admin = cls.school.admin
+        cls.teacher = User.objects.get(username='bench_t1a')
+        cls.student = User.objects.get(username='bench_s1a001')
+
+    def setUp(self):
+        cache.clear()
+
+    def login(self, user):
+        self.client.force_login(user)
+
+    @contextmanager
+    def assertWithinBudget(self, name, queries, ms):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            yield captured
+            elapsed = (time.perf_counter() - start) * 1000
+
+        self.assertLessEqual(
+            len(captured),
+            queries,
+            f"{name}: {len(captured)} queries (budget {queries})\n"
+            + "\n".join(query['sql'] for query in captured.captured_queries)
+        )
+
+        limit = ms * latency_scale()
+        self.assertLessEqual(
+            elapsed,
+            limit,
+            f"{name}: {elapsed:.0f}ms (budget {limit:.0f}ms)"
+        )
+
+
+def consume(response):
+    """
+    Streaming / FileResponse ki queries iterate karne par chalti hain
+    – budget ke andar poora body padho
+    """
+    if response.streaming:
+        return response.getvalue()
+    return response.content
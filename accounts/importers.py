@@ -0,0 +1,412 @@
+import csv
+import io
+from collections import Counter
+from datetime import date, datetime
+from itertools import islice
+from typing import NamedTuple
+from zipfile import BadZipFile
+
+import openpyxl
+from django.db import IntegrityError, transaction
+from openpyxl.utils.exceptions import InvalidFileException
+
+from .models import StudentProfile
+from .provisioning import Credentials, prepare_credentials, provision_users
+from .services import (
+    USERNAME_RETRIES,
+    allocate_usernames,
+    reserve_roll_numbers,
+)
+from .signals import students_bulk_created
+
+
+IMPORT_CHUNK_SIZE = 500
+
+IMPORT_COLUMNS = (
+    'first_name',
+    'middle_name',
+    'last_name',
+    'father_name',
+    'mother_name',
+    'contact_number',
+    'address',
+    'dob',
+    'admission_number',
+    'student_class',
+    'section',
+)
+
+# student_register wale hi required fields
+REQUIRED_COLUMNS = (
+    'first_name',
+    'last_name',
+    'father_name',
+    'mother_name',
+    'contact_number',
+    'address',
+    'dob',
+    'student_class',
+    'section',
+)
+
+# bulk_create full_clean nahi chalata – SQLite lambi value chup-chaap
+# rakh leta hai, baaki DB DataError (import beech me abort). Isliye
+# CharField limits clean_row me hi (class / section choices se check hote hain)
+MAX_LENGTHS = {
+    field.name: field.max_length
+    for field in map(StudentProfile._meta.get_field, IMPORT_COLUMNS)
+    if field.max_length and not field.choices
+}
+
+CLASSES = {c for c, _ in StudentProfile.CLASS_CHOICES}
+SECTIONS = {s for s, _ in StudentProfile.SECTION_CHOICES}
+
+
+# Corrupt XLSX (zip nahi / workbook parts missing), non UTF-8 CSV
+FILE_READ_ERRORS = (
+    BadZipFile,
+    InvalidFileException,
+    KeyError,
+    UnicodeDecodeError,
+    csv.Error,
+)
+
+
+class ImportFileError(Exception):
+    """
+    Upload padha hi nahi ja saka. result: is point tak ka ImportResult
+    (pehle ke chunks already save ho chuke hote hain)
+    """
+
+    def __init__(self, message, result):
+        super().__init__(message)
+        self.result = result
+
+
+class _UsernameTaken(IntegrityError):
+    """
+    User bulk INSERT par username collision (concurrent registration)
+    """
+
+
+class ImportRowError(NamedTuple):
+    row_number: int
+    message: str
+
+
+class ImportedStudent(NamedTuple):
+    row_number: int
+    username: str
+    password: str
+    student_class: str
+    section: str
+    roll_no: int
+
+
+class ImportResult:
+    """
+    Import ka running summary (progress callback ko bhi yahi milta hai)
+    """
+
+    def __init__(self):
+        self.rows_read = 0
+        self.created = []
+        self.errors = []
+
+    @property
+    def created_count(self):
+        return len(self.created)
+
+    @property
+    def error_count(self):
+        return len(self.errors)
+
+
+# ==================================================
+# 📄 STREAMING ROW READERS (CSV / XLSX)
+# ==================================================
+def _normalize_header(header):
+    return [
+        str(name or '').strip().lower().replace(' ', '_')
+        for name in header
+    ]
+
+
+def _read_csv(file):
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    reader = csv.reader(text)
+
+    header = _normalize_header(next(reader, []))
+    for values in reader:
+        yield dict(zip(header, values))
+
+
+def _read_xlsx(file):
+    wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+
+        header = _normalize_header(next(rows, ()))
+        for values in rows:
+            yield dict(zip(header, values))
+    finally:
+        wb.close()
+
+
+def read_rows(file, filename):
+    """
+    (row_number, row_dict) ek-ek karke – poori file memory me nahi.
+    row_number spreadsheet wala hai (header = 1)
+    """
+    reader = _read_xlsx if filename.lower().endswith('.xlsx') else _read_csv
+
+    for row_number, row in enumerate(reader(file), start=2):
+        if any(value not in (None, '') for value in row.values()):
+            yield row_number, row
+
+
+# ==================================================
+# 🔍 ROW VALIDATION
+# ==================================================
+def _parse_dob(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    value = str(value or '').strip()
+    for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def clean_row(row):
+    """
+    Returns (cleaned_dict, None) ya (None, error_message)
+    """
+
+    cleaned = {}
+    for column in IMPORT_COLUMNS:
+        value = row.get(column)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # Excel numbers: 5.0 → "5"
+        cleaned[column] = value if column == 'dob' else str(value or '').strip()
+
+    missing = [
+        column for column in REQUIRED_COLUMNS
+        if cleaned[column] in ('', None)
+    ]
+    if missing:
+        return None, f"Missing required fields: {', '.join(missing)}"
+
+    too_long = [
+        f"{column} (max {limit})"
+        for column, limit in MAX_LENGTHS.items()
+        if len(cleaned[column]) > limit
+    ]
+    if too_long:
+        return None, f"Too long: {', '.join(too_long)}"
+
+    cleaned['dob'] = _parse_dob(cleaned['dob'])
+    if cleaned['dob'] is None:
+        return None, "Invalid Date of Birth"
+
+    cleaned['section'] = cleaned['section'].upper()
+
+    if cleaned['student_class'] not in CLASSES:
+        return None, f"Invalid class: {cleaned['student_class']}"
+
+    if cleaned['section'] not in SECTIONS:
+        return None, f"Invalid section: {cleaned['section']}"
+
+    cleaned['admission_number'] = cleaned['admission_number'] or None
+    return cleaned, None
+
+
+# ==================================================
+# 💾 CHUNK WRITE (bulk_create, signal bypass)
+# ==================================================
+def _write_chunk(rows, credentials):
+    """
+    Ek chunk ke users (provision_users, pehle se hashed credentials) +
+    profiles – ek transaction, do bulk INSERT.
+    bulk_create post_save nahi bhejta, isliye create_user_profile
+    signal ka duplicate get_or_create bhi nahi chalta.
+    """
+
+    with transaction.atomic():
+        usernames = allocate_usernames([
+            f"{row['first_name'].lower()}{row['last_name'].lower()}{row['dob'].day}"
+            for _, row in rows
+        ])
+
+        roll_numbers = {
+            key: iter(reserve_roll_numbers(*key, count=count))
+            for key, count in Counter(
+                (row['student_class'], row['section']) for _, row in rows
+            ).items()
+        }
+
+        # User table par sirf username unique hai
+        try:
+            provisioned = provision_users(usernames, credentials, role='STUDENT')
+        except IntegrityError as exc:
+            raise _UsernameTaken(*exc.args) from exc
+
+        profiles = []
+        for (user, _), (_, row) in zip(provisioned, rows):
+            profile = StudentProfile(
+                user=user,
+                roll_no=next(roll_numbers[(row['student_class'], row['section'])]),
+                **{column: row[column] for column in IMPORT_COLUMNS}
+            )
+            profile.update_search_fields()
+            profiles.append(profile)
+
+        StudentProfile.objects.bulk_create(profiles)
+
+    return profiles
+
+
+def _drop_registered_admissions(rows, result):
+    """
+    Already registered admission numbers wali rows → result.errors
+    (ek query per chunk). Returns baaki rows.
+    """
+    existing = set(
+        StudentProfile.objects.filter(
+            admission_number__in=[
+                row['admission_number'] for _, row in rows
+                if row['admission_number']
+            ]
+        ).values_list('admission_number', flat=True)
+    )
+
+    remaining = []
+    for row_number, row in rows:
+        if row['admission_number'] in existing:
+            result.errors.append(ImportRowError(
+                row_number,
+                f"Admission number already registered: {row['admission_number']}"
+            ))
+        else:
+            remaining.append((row_number, row))
+    return remaining
+
+
+def _import_chunk(chunk, result, seen_admissions, workers):
+    valid = []
+    for row_number, row in chunk:
+        cleaned, error = clean_row(row)
+        if error:
+            result.errors.append(ImportRowError(row_number, error))
+            continue
+
+        admission = cleaned['admission_number']
+        if admission and admission in seen_admissions:
+            result.errors.append(ImportRowError(
+                row_number, f"Duplicate admission number in file: {admission}"
+            ))
+            continue
+        if admission:
+            seen_admissions.add(admission)
+
+        valid.append((row_number, cleaned))
+
+    rows = _drop_registered_admissions(valid, result)
+
+    if not rows:
+        return
+
+    # student_register wala password rule; hashing transaction ke bahar
+    # (retry par dobara hash nahi)
+    credentials = prepare_credentials(
+        [f"{row['first_name'].lower()}@{row['dob'].year}" for _, row in rows],
+        workers=workers
+    )
+
+    attempt = 0
+    while True:
+        try:
+            profiles = _write_chunk(rows, credentials)
+            break
+        except _UsernameTaken:
+            # Concurrent registration ne username le liya – dobara allocate
+            attempt += 1
+            if attempt == USERNAME_RETRIES:
+                raise
+        except IntegrityError:
+            # Beech me kisi ne same admission number register kar diya →
+            # wo rows error, baaki dobara likho. Koi aur conflict → raise
+            remaining = _drop_registered_admissions(rows, result)
+            if len(remaining) == len(rows):
+                raise
+
+            keep = {row_number for row_number, _ in remaining}
+            kept = [index for index, (row_number, _) in enumerate(rows) if row_number in keep]
+            rows = [rows[index] for index in kept]
+            credentials = Credentials(*(
+                [values[index] for index in kept] for values in credentials
+            ))
+            if not rows:
+                return
+
+    for (row_number, _), password, profile in zip(rows, credentials.passwords, profiles):
+        result.created.append(ImportedStudent(
+            row_number,
+            profile.user.username,
+            password,
+            profile.student_class,
+            profile.section,
+            profile.roll_no,
+        ))
+
+    students_bulk_created.send(
+        sender=StudentProfile,
+        count=len(profiles),
+        sections={(profile.student_class, profile.section) for profile in profiles},
+    )
+
+
+# ==================================================
+# 📥 BULK STUDENT IMPORT
+# ==================================================
+def import_students(file, filename, chunk_size=IMPORT_CHUNK_SIZE,
+                    workers=None, progress=None):
+    """
+    Bulk Admission Import Pipeline
+    ------------------------------
+    - CSV / XLSX stream hota hai, chunk_size rows ek baar me
+    - Har chunk: validate → passwords process pool me hash →
+      usernames + roll numbers batch me allocate → bulk_create
+    - Invalid rows ImportResult.errors me (row number ke saath)
+    - File padhi na ja sake (corrupt XLSX / non UTF-8 CSV) → ImportFileError
+    - progress(result) har chunk ke baad call hota hai
+    """
+
+    result = ImportResult()
+    seen_admissions = set()
+    rows = read_rows(file, filename)
+
+    while True:
+        try:
+            chunk = list(islice(rows, chunk_size))
+        except FILE_READ_ERRORS as exc:
+            raise ImportFileError(
+                f"Could not read {filename} after row {result.rows_read + 1}: "
+                f"file is corrupt or not UTF-8 CSV / XLSX ({exc.__class__.__name__})",
+                result
+            ) from exc
+        if not chunk:
+            break
+
+        result.rows_read += len(chunk)
+        _import_chunk(chunk, result, seen_admissions, workers)
+
+        if progress:
+            progress(result)
+
+    return result
@@ -0,0 +1,150 @@
+import hashlib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Homework, Notice
+from .pagination import decode_cursor, keyset_paginate
+from .utils import configured_cache
+
+
+# ==================================================
+# ⚙️ SETTINGS
+# ==================================================
+# Safety net: signal miss ho jaye (queryset.update / dusra process with
+# local-memory cache) to bhi itni der me fresh page
+LISTING_CACHE_TIMEOUT = getattr(settings, 'LISTING_CACHE_TIMEOUT', 60 * 60)
+
+KEY_PREFIX = 'accounts:listing:'
+
+NOTICES = 'notices'
+HOMEWORK = 'homework'
+
+NOTICE_PAGE_SIZE = 20
+NOTICE_KEYS = ['-created_at', '-id']
+
+HOMEWORK_PAGE_SIZE = 20
+HOMEWORK_DUE_WINDOW_DAYS = 14
+
+# Window: jo jaldi due hai pehle; "all": latest due date pehle
+HOMEWORK_WINDOW_KEYS = ['due_date', 'id']
+HOMEWORK_ALL_KEYS = ['-due_date', '-id']
+
+
+def get_cache():
+    return configured_cache('LISTING_CACHE_ALIAS')
+
+
+# ==================================================
+# 🔢 VERSIONED KEYS
+# ==================================================
+# Har listing (notices / homework) ka ek version number. Page keys me
+# version hota hai – Notice / Homework change → version bump → saare
+# purane pages ek saath invalid (delete_pattern ki zaroorat nahi).
+
+def _version_key(name):
+    return f"{KEY_PREFIX}{name}:version"
+
+
+def _fresh_version():
+    # Version key evict ho jaye to bhi 1 se restart nahi – purane
+    # pages ka key dobara match na ho
+    return time.time_ns()
+
+
+def listing_version(name):
+    cache = get_cache()
+    version = cache.get(_version_key(name))
+    if version is None:
+        version = _fresh_version()
+        cache.add(_version_key(name), version, None)
+        version = cache.get(_version_key(name), version)
+    return version
+
+
+def bump_version(name):
+    """
+    post_save / post_delete ke commit ke baad (accounts.signals)
+    """
+    cache = get_cache()
+    try:
+        cache.incr(_version_key(name))
+    except ValueError:
+        cache.set(_version_key(name), _fresh_version(), None)
+
+
+def page_key(name, version, params):
+    digest = hashlib.md5(repr(params).encode()).hexdigest()
+    return f"{KEY_PREFIX}{name}:v{version}:{digest}"
+
+
+def cached_page(name, queryset, keys, cursor, page_size, extra=None):
+    """
+    Cache-aside: hit → KeysetPage bina DB query, miss → keyset_paginate + set
+
+    Key decoded cursor values se bunta hai, raw ?after= string se nahi –
+    invalid / tampered cursor pehle page ki key par hi jaata hai (waise bhi
+    pehla page milta), har random string ek naya cache entry nahi banati
+    """
+    values = decode_cursor(queryset, keys, cursor)
+    if values is None:
+        cursor = None
+
+    cache = get_cache()
+    key = page_key(name, listing_version(name), (values, extra))
+
+    page = cache.get(key)
+    if page is None:
+        page = keyset_paginate(queryset, keys, cursor=cursor, page_size=page_size)
+        cache.set(key, page, LISTING_CACHE_TIMEOUT)
+    return page
+
+
+# ==================================================
+# 📢 NOTICES
+# ==================================================
+def notice_page(cursor=None):
+    """
+    Active notices, latest pehle (keyset pages)
+    """
+    return cached_page(
+        NOTICES,
+        Notice.objects.filter(is_active=True).only('title', 'message', 'created_at'),
+        NOTICE_KEYS,
+        cursor,
+        NOTICE_PAGE_SIZE
+    )
+
+
+# ==================================================
+# 📚 HOMEWORK
+# ==================================================
+def homework_window(today=None, days=HOMEWORK_DUE_WINDOW_DAYS):
+    today = today or timezone.localdate()
+    return today, today + timedelta(days=days)
+
+
+def homework_page(cursor=None, show_all=False, today=None):
+    """
+    - Default: aaj se agle HOMEWORK_DUE_WINDOW_DAYS din me due
+      (due_date range scan – (due_date, id) index)
+    - show_all: poori history, latest due date pehle
+    Window bounds cache key me hain – din badle to naya page
+    """
+    if show_all:
+        keys, window = HOMEWORK_ALL_KEYS, None
+        homework = Homework.objects.all()
+    else:
+        keys, window = HOMEWORK_WINDOW_KEYS, homework_window(today)
+        homework = Homework.objects.filter(due_date__range=window)
+
+    return cached_page(
+        HOMEWORK,
+        homework.only('title', 'description', 'due_date'),
+        keys,
+        cursor,
+        HOMEWORK_PAGE_SIZE,
+        extra=window
+    )
@@ -0,0 +1,55 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.provisioning import generate_password, hash_passwords
+
+
+class Command(BaseCommand):
+    help = "Measure password hashing throughput against number of worker processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=64,
+            help="Passwords hashed per run"
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Benchmark 1, 2, 4 ... up to this many workers"
+        )
+
+    def handle(self, *args, **options):
+        if options['count'] < 1:
+            raise CommandError("--count must be at least 1")
+        if options['max_workers'] < 1:
+            raise CommandError("--max-workers must be at least 1")
+
+        passwords = [generate_password() for _ in range(options['count'])]
+
+        worker_counts = []
+        workers = 1
+        while workers < options['max_workers']:
+            worker_counts.append(workers)
+            workers *= 2
+        worker_counts.append(options['max_workers'])
+
+        self.stdout.write(f"{'workers':>8} {'seconds':>9} {'hashes/s':>10} {'speedup':>8}")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            hash_passwords(passwords, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            throughput = len(passwords) / elapsed
+            baseline = baseline or throughput
+
+            self.stdout.write(
+                f"{workers:>8} {elapsed:>9.2f} {throughput:>10.1f} "
+                f"{throughput / baseline:>7.2f}x"
+            )
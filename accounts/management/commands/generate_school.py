@@ -0,0 +1,102 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import StudentProfile, User
+from accounts.synthetic import SYNTHETIC_BATCH_SIZE, SYNTHETIC_PASSWORD, generate_school
+
+
+class Command(BaseCommand):
+    help = "Generate a synthetic school (students, attendance, marks, fees) for benchmarking"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--classes',
+            type=int,
+            default=3,
+            help="Number of classes (1-12), each with 3 sections"
+        )
+        parser.add_argument(
+            '--students',
+            type=int,
+            default=30,
+            help="Students per section"
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help="Calendar days of attendance ending today (Sundays skipped)"
+        )
+        parser.add_argument(
+            '--exams',
+            type=int,
+            default=3,
+            help="Exams with marks for every subject"
+        )
+        parser.add_argument(
+            '--months',
+            type=int,
+            default=12,
+            help="Fee months ending this month (1-12)"
+        )
+        parser.add_argument(
+            '--paid-ratio',
+            type=float,
+            default=0.6,
+            help="Fraction of fees marked PAID"
+        )
+        parser.add_argument(
+            '--prefix',
+            default='syn',
+            help="Username prefix (syn_admin, syn_t8a, syn_s8a001 ...)"
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help="Random seed (same seed → same data)"
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SYNTHETIC_BATCH_SIZE,
+            help="Rows per bulk_create batch"
+        )
+
+    def handle(self, *args, **options):
+        if not 1 <= options['classes'] <= len(StudentProfile.CLASS_CHOICES):
+            raise CommandError("--classes must be between 1 and 12")
+        if not 1 <= options['months'] <= 12:
+            raise CommandError("--months must be between 1 and 12")
+        if User.objects.filter(username__startswith=f"{options['prefix']}_").exists():
+            raise CommandError(
+                f"Users with prefix '{options['prefix']}_' already exist – use another --prefix"
+            )
+
+        start = time.perf_counter()
+        try:
+            school = generate_school(
+                classes=options['classes'],
+                students_per_section=options['students'],
+                days=options['days'],
+                exams=options['exams'],
+                months=options['months'],
+                paid_ratio=options['paid_ratio'],
+                prefix=options['prefix'],
+                seed=options['seed'],
+                batch_size=options['batch_size'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"Teachers: {school.teachers} | students: {school.students} | "
+            f"attendance: {school.attendance} | marks: {school.marks} | "
+            f"fees: {school.fees} ({school.paid_fees} paid)"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Synthetic school generated in {elapsed:.1f}s "
+            f"(login: {school.admin.username} / {SYNTHETIC_PASSWORD})"
+        ))
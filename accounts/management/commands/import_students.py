@@ -0,0 +1,68 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.importers import IMPORT_CHUNK_SIZE, ImportFileError, import_students
+
+
+class Command(BaseCommand):
+    help = "Bulk import students from a CSV / XLSX admission sheet"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or XLSX file")
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Rows validated + inserted per batch"
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help="Password hashing processes (default: all cores)"
+        )
+        parser.add_argument(
+            '--credentials',
+            help="Write generated username / password list to this CSV"
+        )
+
+    def handle(self, *args, **options):
+        def progress(result):
+            self.stdout.write(
+                f"Rows read: {result.rows_read} | "
+                f"created: {result.created_count} | "
+                f"errors: {result.error_count}"
+            )
+
+        try:
+            with open(options['path'], 'rb') as file:
+                result = import_students(
+                    file,
+                    options['path'],
+                    chunk_size=options['chunk_size'],
+                    workers=options['workers'],
+                    progress=progress
+                )
+        except ImportFileError as exc:
+            raise CommandError(
+                f"{exc} ({exc.result.created_count} students imported before the error)"
+            )
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for error in result.errors:
+            self.stderr.write(f"Row {error.row_number}: {error.message}")
+
+        if options['credentials']:
+            with open(options['credentials'], 'w', newline='') as out:
+                writer = csv.writer(out)
+                writer.writerow([
+                    'row', 'username', 'password', 'class', 'section', 'roll_no'
+                ])
+                writer.writerows(result.created)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.created_count} students "
+            f"({result.error_count} rows rejected)"
+        ))
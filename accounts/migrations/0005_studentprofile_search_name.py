@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:25
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def normalize_search_text(*parts):
+    # accounts.models.normalize_search_text ki frozen copy – migration
+    # live code par depend na kare
+    text = " ".join(part for part in parts if part)
+    text = unicodedata.normalize('NFKD', text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().split())
+
+
+def populate_search_name(apps, schema_editor):
+    StudentProfile = apps.get_model('accounts', 'StudentProfile')
+
+    profiles = list(StudentProfile.objects.only(
+        'id', 'first_name', 'middle_name', 'last_name'
+    ))
+    for profile in profiles:
+        profile.search_name = normalize_search_text(
+            profile.first_name,
+            profile.middle_name,
+            profile.last_name
+        )
+
+    StudentProfile.objects.bulk_update(profiles, ['search_name'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_homework_options_alter_notice_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='search_name',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=160),
+        ),
+        migrations.RunPython(populate_search_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:28
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def seed_sequences(apps, schema_editor):
+    StudentProfile = apps.get_model('accounts', 'StudentProfile')
+    RollNumberSequence = apps.get_model('accounts', 'RollNumberSequence')
+
+    current = (
+        StudentProfile.objects
+        .filter(student_class__isnull=False, section__isnull=False)
+        .values('student_class', 'section')
+        .annotate(last=Max('roll_no'))
+    )
+
+    RollNumberSequence.objects.bulk_create([
+        RollNumberSequence(
+            student_class=row['student_class'],
+            section=row['section'],
+            last_roll_no=row['last'] or 0
+        )
+        for row in current
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_studentprofile_search_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollNumberSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student_class', models.CharField(choices=[('1', 'Class 1'), ('2', 'Class 2'), ('3', 'Class 3'), ('4', 'Class 4'), ('5', 'Class 5'), ('6', 'Class 6'), ('7', 'Class 7'), ('8', 'Class 8'), ('9', 'Class 9'), ('10', 'Class 10'), ('11', 'Class 11'), ('12', 'Class 12')], max_length=2)),
+                ('section', models.CharField(choices=[('A', 'Section A'), ('B', 'Section B'), ('C', 'Section C')], max_length=1)),
+                ('last_roll_no', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['student_class', 'section'],
+                'unique_together': {('student_class', 'section')},
+            },
+        ),
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop),
+    ]
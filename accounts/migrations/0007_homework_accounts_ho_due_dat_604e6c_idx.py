@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_rollnumbersequence'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='homework',
+            index=models.Index(fields=['due_date', 'id'], name='accounts_ho_due_dat_604e6c_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:06
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def normalize_search_text(*parts):
+    # accounts.models.normalize_search_text ki frozen copy
+    text = " ".join(part for part in parts if part)
+    text = unicodedata.normalize('NFKD', text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().split())
+
+
+def populate_search_tokens(apps, schema_editor):
+    StudentProfile = apps.get_model('accounts', 'StudentProfile')
+
+    profiles = list(StudentProfile.objects.only('id', 'middle_name', 'last_name'))
+    for profile in profiles:
+        profile.search_middle_name = normalize_search_text(profile.middle_name)[:50]
+        profile.search_last_name = normalize_search_text(profile.last_name)[:50]
+
+    StudentProfile.objects.bulk_update(
+        profiles,
+        ['search_middle_name', 'search_last_name'],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_homework_accounts_ho_due_dat_604e6c_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='search_last_name',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=50),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='search_middle_name',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=50),
+        ),
+        migrations.RunPython(populate_search_tokens, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,25 @@
+import unicodedata
+
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
 from django.utils import timezone
 
 
+# ==================================================
+# SEARCH HELPERS
+# ==================================================
+def normalize_search_text(*parts):
+    """
+    "  Rāhul   KUMAR " → "rahul kumar"
+    (lowercase, accents removed, single spaces)
+    """
+    text = " ".join(part for part in parts if part)
+    text = unicodedata.normalize('NFKD', text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().split())
+
+
 # ==================================================
 # CUSTOM USER MODEL
 # ==================================================
@@ -186,6 +202,35 @@ class StudentProfile(models.Model):
 
     fees_paid = models.BooleanField(default=False)
 
+    # Normalized "first middle last" – indexed prefix search ke liye
+    # (save() me auto maintain hota hai)
+    search_name = models.CharField(
+        max_length=160,
+        blank=True,
+        default='',
+        editable=False,
+        db_index=True
+    )
+
+    # Middle / last name alag se – sirf surname se bhi prefix search
+    search_middle_name = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+        editable=False,
+        db_index=True
+    )
+
+    search_last_name = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+        editable=False,
+        db_index=True
+    )
+
+    SEARCH_FIELDS = ('search_name', 'search_middle_name', 'search_last_name')
+
     class Meta:
         ordering = ['student_class', 'section', 'roll_no']
         unique_together = ('student_class', 'section', 'roll_no')
@@ -193,6 +238,60 @@ class StudentProfile(models.Model):
     def __str__(self):
         return self.user.username
 
+    def build_search_name(self):
+        return normalize_search_text(
+            self.first_name,
+            self.middle_name,
+            self.last_name
+        )
+
+    def update_search_fields(self):
+        """
+        search_name + per-token columns (bulk_create se pehle bhi call karo)
+        """
+        self.search_name = self.build_search_name()
+        self.search_middle_name = normalize_search_text(self.middle_name)[:50]
+        self.search_last_name = normalize_search_text(self.last_name)[:50]
+
+    def save(self, *args, **kwargs):
+        self.update_search_fields()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *self.SEARCH_FIELDS}
+
+        super().save(*args, **kwargs)
+
+
+# ==================================================
+# ROLL NUMBER SEQUENCE (PER CLASS + SECTION)
+# ==================================================
+class RollNumberSequence(models.Model):
+    """
+    Har class + section ka last allotted roll number.
+    accounts.services.reserve_roll_numbers() isko atomically
+    aage badhata hai (ORDER BY roll_no DESC query ki jagah).
+    """
+
+    student_class = models.CharField(
+        max_length=2,
+        choices=StudentProfile.CLASS_CHOICES
+    )
+
+    section = models.CharField(
+        max_length=1,
+        choices=StudentProfile.SECTION_CHOICES
+    )
+
+    last_roll_no = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('student_class', 'section')
+        ordering = ['student_class', 'section']
+
+    def __str__(self):
+        return f"Class {self.student_class}-{self.section}: {self.last_roll_no}"
+
 
 # ==================================================
 # HOMEWORK
@@ -212,6 +311,10 @@ class Homework(models.Model):
 
     class Meta:
         ordering = ['due_date']
+        indexes = [
+            # "Agle 14 din me due" window + keyset order (due_date, id)
+            models.Index(fields=['due_date', 'id']),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,139 @@
+import base64
+import datetime
+import json
+from typing import NamedTuple, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+
+
+class KeysetPage(NamedTuple):
+    object_list: list
+    next_cursor: Optional[str]
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+# ==================================================
+# 🔑 CURSOR ENCODE / DECODE
+# ==================================================
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder datetime / time ko milliseconds tak kaat deta hai –
+    same millisecond wali rows cursor ke baad skip ho jaati. Yahan full
+    microsecond precision (to_python wapas exact value deta hai)
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, cls=CursorEncoder)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(queryset, keys, cursor):
+    """
+    Cursor ko wapas field values me convert karta hai.
+    Invalid / tampered cursor → None (first page)
+    """
+    if not cursor:
+        return None
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        return None
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        return None
+
+    opts = queryset.model._meta
+    try:
+        return [
+            None if value is None
+            else opts.get_field(key.lstrip('-')).to_python(value)
+            for key, value in zip(keys, values)
+        ]
+    except Exception:
+        return None
+
+
+# ==================================================
+# ⚙️ KEYSET FILTER + ORDERING
+# ==================================================
+def _order_by(keys):
+    """
+    ASC → NULLS FIRST, DESC → NULLS LAST
+    (SQLite / Postgres dono par same order)
+    """
+    ordering = []
+    for key in keys:
+        if key.startswith('-'):
+            ordering.append(F(key[1:]).desc(nulls_last=True))
+        else:
+            ordering.append(F(key).asc(nulls_first=True))
+    return ordering
+
+
+def _after(keys, values):
+    """
+    (k1, k2, ...) > (v1, v2, ...) ka Q – NULL aware
+    """
+    condition = Q(pk__in=[])
+    equal_so_far = Q()
+
+    for key, value in zip(keys, values):
+        name = key.lstrip('-')
+        descending = key.startswith('-')
+
+        if value is None:
+            # NULL: ASC me sabse pehle, DESC me sabse last
+            greater = Q(**{f'{name}__isnull': False}) if not descending else None
+            equal = Q(**{f'{name}__isnull': True})
+        else:
+            lookup = 'lt' if descending else 'gt'
+            greater = Q(**{f'{name}__{lookup}': value})
+            if descending:
+                greater |= Q(**{f'{name}__isnull': True})
+            equal = Q(**{name: value})
+
+        if greater is not None:
+            condition |= equal_so_far & greater
+        equal_so_far &= equal
+
+    return condition
+
+
+def keyset_paginate(queryset, keys, cursor=None, page_size=50):
+    """
+    Keyset (cursor) Pagination
+    --------------------------
+    - keys: ordering fields, e.g. ['student_class', 'section', 'roll_no', 'id']
+      (last key unique hona chahiye – usually 'id')
+    - OFFSET nahi, isliye deep pages bhi index range scan se aate hain
+    - Returns KeysetPage(object_list, next_cursor)
+    """
+
+    queryset = queryset.order_by(*_order_by(keys))
+
+    values = decode_cursor(queryset, keys, cursor)
+    if values is not None:
+        queryset = queryset.filter(_after(keys, values))
+
+    rows = list(queryset[:page_size + 1])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor([
+            getattr(last, key.lstrip('-')) for key in keys
+        ])
+
+    return KeysetPage(object_list=rows, next_cursor=next_cursor)
@@ -0,0 +1,130 @@
+import os
+import secrets
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+
+# Isse chhote batch ke liye process pool start karna mehenga padta hai
+PARALLEL_HASH_THRESHOLD = 8
+
+GENERATED_PASSWORD_LENGTH = 10
+
+
+class Credentials(NamedTuple):
+    passwords: list        # raw (diye hue ya generated)
+    password_hashes: list
+
+
+class ProvisionedUser(NamedTuple):
+    user: 'User'           # accounts.models.User (lazy import)
+    password: str
+
+
+def hash_workers():
+    """
+    settings.PASSWORD_HASH_WORKERS (default: saare CPU cores)
+    """
+    return getattr(settings, 'PASSWORD_HASH_WORKERS', None) or os.cpu_count() or 1
+
+
+def generate_password(length=GENERATED_PASSWORD_LENGTH):
+    alphabet = string.ascii_letters + string.digits
+    return ''.join(secrets.choice(alphabet) for _ in range(length))
+
+
+# ==================================================
+# 🔐 PARALLEL PASSWORD HASHING
+# ==================================================
+def _init_hash_worker(settings_module):
+    # spawn / forkserver workers me settings load karni padti hain
+    # (fork me already configured hote hain). Parent wala hi module –
+    # test / production settings hardcode nahi
+    from django.apps import apps
+    if not apps.ready:
+        if settings_module:
+            os.environ['DJANGO_SETTINGS_MODULE'] = settings_module
+        django.setup()
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    PBKDF2 CPU-bound hai – bade batch ko ProcessPoolExecutor me
+    saare cores par hash karo. Order same rehta hai.
+    """
+
+    passwords = list(passwords)
+    workers = workers or hash_workers()
+
+    if workers == 1 or len(passwords) < PARALLEL_HASH_THRESHOLD:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_hash_worker,
+        initargs=(os.environ.get('DJANGO_SETTINGS_MODULE'),)
+    ) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+# ==================================================
+# 👥 BULK ACCOUNT PROVISIONING
+# ==================================================
+def build_users(usernames, password_hashes, role='STUDENT', **fields):
+    """
+    Unsaved User objects (already-hashed passwords ke saath)
+    – bulk_create ke liye
+    """
+    # Lazy import: spawn workers ye module django.setup() se pehle
+    # import karte hain (initializer unpickle karne ke liye)
+    from .models import User
+
+    return [
+        User(username=username, password=password_hash, role=role, **fields)
+        for username, password_hash in zip(usernames, password_hashes)
+    ]
+
+
+def prepare_credentials(passwords, workers=None):
+    """
+    passwords: [raw_password_or_None, ...] (None → generate_password())
+    → Credentials, sab process pool me hash. Kisi transaction ke bahar
+    call karo – hashing me seconds lagte hain
+    """
+    passwords = [password or generate_password() for password in passwords]
+    return Credentials(passwords, hash_passwords(passwords, workers=workers))
+
+
+def provision_users(usernames, credentials=None, role='STUDENT', workers=None,
+                    batch_size=500, **fields):
+    """
+    Account Provisioning Service
+    ----------------------------
+    - usernames: already allocated (accounts.services.allocate_usernames)
+    - credentials: prepare_credentials() ka result, same order; None →
+      har user ka random password yahin generate + hash
+    - Ek bulk_create (User unique username par IntegrityError caller
+      sambhale); post_save nahi jaata – profiles caller banaye
+    - Returns [ProvisionedUser(user, raw_password), ...]
+    """
+    from .models import User
+
+    if credentials is None:
+        credentials = prepare_credentials([None] * len(usernames), workers=workers)
+
+    with transaction.atomic():
+        users = User.objects.bulk_create(
+            build_users(usernames, credentials.password_hashes, role=role, **fields),
+            batch_size=batch_size
+        )
+
+    return [
+        ProvisionedUser(user, password)
+        for user, password in zip(users, credentials.passwords)
+    ]
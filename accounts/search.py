@@ -0,0 +1,51 @@
+from django.db.models import Q
+
+from .models import normalize_search_text
+from .utils import is_ascii_digits
+
+
+# Sabse bada unicode code point – "prefix ke baad wala sab kuch" ka upper bound
+_PREFIX_END = '\U0010ffff'
+
+
+def prefix_range(field, prefix):
+    """
+    field LIKE 'prefix%' ki jagah  prefix <= field < prefix + MAX
+    – plain B-tree index range scan, kisi bhi DB par
+    """
+    return Q(**{
+        f'{field}__gte': prefix,
+        f'{field}__lt': prefix + _PREFIX_END,
+    })
+
+
+# ==================================================
+# 🔍 STUDENT DIRECTORY SEARCH
+# ==================================================
+def student_search_q(q, path=''):
+    """
+    - Sirf digits → roll_no / admission_number exact match
+    - Otherwise → normalized full name / middle name / last name prefix
+      ya admission_number prefix (sab indexed columns, full table scan nahi)
+    - path: StudentProfile tak ka relation prefix,
+      e.g. 'student__student_profile__' (StudentFee se)
+    """
+
+    if is_ascii_digits(q):
+        return Q(**{f'{path}roll_no': int(q)}) | Q(**{f'{path}admission_number': q})
+
+    name = normalize_search_text(q)
+    return (
+        prefix_range(f'{path}search_name', name) |
+        prefix_range(f'{path}search_middle_name', name) |
+        prefix_range(f'{path}search_last_name', name) |
+        prefix_range(f'{path}admission_number', q)
+    )
+
+
+def search_students(queryset, q):
+    q = (q or '').strip()
+    if not q:
+        return queryset
+
+    return queryset.filter(student_search_q(q))
@@ -0,0 +1,182 @@
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import User, StudentProfile, RollNumberSequence
+from .search import prefix_range
+
+
+USERNAME_RETRIES = 5
+
+
+# ==================================================
+# 👤 USERNAME ALLOCATION
+# ==================================================
+def _highest_suffixes(base_usernames):
+    """
+    {base: sabse bada numeric suffix (base khud = 0)} – ek hi query me
+    (har base ke liye username unique index par prefix range scan).
+    Jo base abhi free hai wo dict me nahi hoga.
+    """
+
+    bases = set(base_usernames)
+    if not bases:
+        return {}
+
+    taken = User.objects.filter(
+        reduce(or_, (prefix_range('username', base) for base in bases))
+    ).values_list('username', flat=True)
+
+    patterns = {
+        base: re.compile(rf'^{re.escape(base)}(\d*)$') for base in bases
+    }
+
+    highest = {}
+    for username in taken:
+        for base, pattern in patterns.items():
+            match = pattern.match(username)
+            if match:
+                suffix = int(match.group(1) or 0)
+                highest[base] = max(highest.get(base, 0), suffix)
+
+    return highest
+
+
+def next_free_username(base_username):
+    """
+    base, base1, base2 ... me se agla free username – ek hi query me
+
+    - username unique index par prefix range scan
+    - Sabse bada numeric suffix + 1 (loop of exists() nahi)
+    """
+
+    highest = _highest_suffixes([base_username]).get(base_username)
+
+    if highest is None:
+        return base_username
+    return f"{base_username}{highest + 1}"
+
+
+def allocate_usernames(base_usernames):
+    """
+    Bulk version: har base ke liye ek free username, order same.
+    Ek hi base kai baar aaye (same naam + same din) to suffix
+    aage badhta rehta hai.
+
+    Alag bases ek doosre ke naam bana sakte hain ('rahulkumar1' + 1 =
+    'rahulkumar11' = dusra base) – batch me diye naam dobara nahi dete.
+    DB me base ke aage highest se bade suffix hamesha free hain.
+    """
+
+    highest = _highest_suffixes(base_usernames)
+    used = set()
+
+    usernames = []
+    for base in base_usernames:
+        suffix = highest[base] + 1 if base in highest else 0
+        username = f"{base}{suffix or ''}"
+        while username in used:
+            suffix += 1
+            username = f"{base}{suffix}"
+
+        highest[base] = suffix
+        used.add(username)
+        usernames.append(username)
+
+    return usernames
+
+
+def create_user_with_unique_username(base_username, **fields):
+    """
+    Free username allocate karke user create karta hai.
+
+    Do admins same time par same naam register karein to dusre ka
+    INSERT unique constraint par fail hoga – savepoint rollback karke
+    naya suffix le lete hain (USERNAME_RETRIES tak).
+    """
+
+    for attempt in range(USERNAME_RETRIES):
+        username = next_free_username(base_username)
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(username=username, **fields)
+        except IntegrityError:
+            if attempt == USERNAME_RETRIES - 1:
+                raise
+
+
+# ==================================================
+# 🔢 ROLL NUMBER SEQUENCE
+# ==================================================
+def _get_sequence(student_class, section):
+    """
+    Sequence row lao / banao (get_or_create concurrent create ko
+    IntegrityError se handle karta hai). Seed reserve ke UPDATE me hota hai.
+    """
+    sequence, _ = RollNumberSequence.objects.get_or_create(
+        student_class=student_class,
+        section=section
+    )
+    return sequence
+
+
+def _current_max_roll_no():
+    """
+    Sequence row ke class + section ka MAX(roll_no) – correlated subquery
+    ((student_class, section, roll_no) unique index se)
+    """
+    return Coalesce(
+        Subquery(
+            StudentProfile.objects
+            .filter(
+                student_class=OuterRef('student_class'),
+                section=OuterRef('section')
+            )
+            .order_by()
+            .values('student_class')
+            .annotate(last=Max('roll_no'))
+            .values('last')[:1]
+        ),
+        Value(0)
+    )
+
+
+def reserve_roll_numbers(student_class, section, count=1):
+    """
+    Class + section ke agle `count` roll numbers reserve karta hai.
+
+    - Atomic UPDATE last_roll_no = GREATEST(last_roll_no, MAX(roll_no))
+      + count → row lock (transaction khatam hone tak dusra registration
+      wait karega)
+    - MAX(roll_no) har baar: admin ne roll_no / class / section haath se
+      badla ho to bhi sequence us number ke aage se chalta hai
+    - Caller ke transaction.atomic() ke andar call karo, taaki rollback
+      par numbers bhi wapas ho jayein; lock chhota rakhne ke liye
+      isse transaction ke end ke paas call karo
+    - Returns range of reserved roll numbers
+    """
+
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    with transaction.atomic():
+        sequence = _get_sequence(student_class, section)
+
+        RollNumberSequence.objects.filter(pk=sequence.pk).update(
+            last_roll_no=Greatest(F('last_roll_no'), _current_max_roll_no()) + count
+        )
+
+        last = RollNumberSequence.objects.filter(
+            pk=sequence.pk
+        ).values_list('last_roll_no', flat=True).get()
+
+    return range(last - count + 1, last + 1)
+
+
+def next_roll_number(student_class, section):
+    return reserve_roll_numbers(student_class, section)[0]
+
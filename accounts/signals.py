@@ -1,8 +1,19 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver, Signal
 from django.conf import settings
 
-from .models import User, TeacherProfile, StudentProfile
+from .listings import HOMEWORK, NOTICES, bump_version
+from .models import User, TeacherProfile, StudentProfile, Homework, Notice
+
+
+# ==================================================
+# CUSTOM SIGNAL: BULK IMPORT
+# ==================================================
+# bulk_create post_save nahi bhejta – bulk student import ke baad
+# ye signal jaata hai (kwargs: count, sections = {(class, section)})
+# taaki caches update ho sakein
+students_bulk_created = Signal()
 
 
 # ==================================================
@@ -33,3 +44,21 @@ def create_user_profile(sender, instance, created, **kwargs):
         StudentProfile.objects.get_or_create(
             user=instance
         )
+
+
+# ==================================================
+# SIGNAL: NOTICE / HOMEWORK LISTING CACHE
+# ==================================================
+# Version bump commit ke baad – warna commit se pehle aaya reader
+# purana page naye version ki key par cache kar deta (aur rollback
+# par bekaar invalidate)
+@receiver(post_save, sender=Notice)
+@receiver(post_delete, sender=Notice)
+def notice_changed(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_version(NOTICES))
+
+
+@receiver(post_save, sender=Homework)
+@receiver(post_delete, sender=Homework)
+def homework_changed(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_version(HOMEWORK))
@@ -0,0 +1,359 @@
+import random
+from datetime import timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from attendance import bitmap
+from attendance.models import Attendance
+from attendance.summary import rebuild_summaries
+from fees.models import FeePayment, FeeStructure, StudentFee
+from marks.models import StudentMark, Subject
+from .models import StudentProfile, TeacherProfile, User
+from .provisioning import build_users
+from .services import reserve_roll_numbers
+
+# Dashboard app OPTIONAL hai – safe import
+try:
+    from dashboard.metrics import invalidate_metrics
+except ImportError:
+    invalidate_metrics = None
+
+
+# ==================================================
+# ⚙️ DEFAULTS
+# ==================================================
+# Saare synthetic accounts ka password (sirf ek baar hash hota hai)
+SYNTHETIC_PASSWORD = 'school@123'
+
+SYNTHETIC_BATCH_SIZE = 2000
+
+SECTIONS = [section for section, _ in StudentProfile.SECTION_CHOICES]
+
+SUBJECTS = ('English', 'Hindi', 'Maths', 'Science', 'Social Science')
+
+EXAMS = ('Unit Test', 'Mid Term', 'Final')
+
+MONTHS = [month for month, _ in FeeStructure.MONTH_CHOICES]
+
+FIRST_NAMES = ('Aarav', 'Diya', 'Kabir', 'Meera', 'Rohan', 'Saanvi', 'Vivaan', 'Anaya')
+LAST_NAMES = ('Sharma', 'Verma', 'Patel', 'Singh', 'Gupta', 'Yadav', 'Joshi', 'Khan')
+
+
+class SyntheticSchool(NamedTuple):
+    admin: User
+    teachers: int
+    students: int
+    attendance: int
+    marks: int
+    fees: int
+    paid_fees: int
+
+
+def exam_names(count):
+    """
+    'Unit Test', 'Mid Term', 'Final', phir 'Test 4', 'Test 5' ...
+    """
+    return [
+        EXAMS[index] if index < len(EXAMS) else f"Test {index + 1}"
+        for index in range(count)
+    ]
+
+
+def school_days(end_date, days):
+    """
+    end_date se pichhle `days` calendar din, Sunday chhod kar
+    """
+    start = end_date - timedelta(days=days - 1)
+    return [
+        start + timedelta(days=offset)
+        for offset in range(days)
+        if (start + timedelta(days=offset)).weekday() != 6
+    ]
+
+
+def fee_months(end_date, count):
+    """
+    end_date ke month tak ke pichhle `count` month names
+    """
+    last = end_date.month - 1
+    return [MONTHS[(last - offset) % 12] for offset in reversed(range(min(count, 12)))]
+
+
+def _batched_create(model, objects, batch_size):
+    """
+    Generator se aate objects ko batch me INSERT (poori list memory me nahi)
+    """
+    written = 0
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            model.objects.bulk_create(batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch)
+        written += len(batch)
+    return written
+
+
+# ==================================================
+# 👥 ACCOUNTS
+# ==================================================
+def _create_accounts(prefix, class_names, students_per_section, password_hash, rng):
+    """
+    1 admin + har section ka ek teacher + students (bulk_create,
+    profiles bhi bulk – post_save signal nahi chalta)
+    """
+    admin = User.objects.create(
+        username=f"{prefix}_admin",
+        password=password_hash,
+        role='ADMIN',
+        is_staff=True,
+    )
+
+    sections = [(class_name, section) for class_name in class_names for section in SECTIONS]
+
+    teachers = User.objects.bulk_create(build_users(
+        [f"{prefix}_t{class_name}{section.lower()}" for class_name, section in sections],
+        [password_hash] * len(sections),
+        role='TEACHER',
+    ))
+    TeacherProfile.objects.bulk_create([
+        TeacherProfile(
+            user=teacher,
+            subject=SUBJECTS[index % len(SUBJECTS)],
+            assigned_class=class_name,
+            assigned_section=section,
+        )
+        for index, (teacher, (class_name, section)) in enumerate(zip(teachers, sections))
+    ])
+
+    # Existing students ke baad wale roll numbers (importer jaisa)
+    seats = [
+        (class_name, section, roll_no)
+        for class_name, section in sections
+        for roll_no in reserve_roll_numbers(class_name, section, count=students_per_section)
+    ]
+
+    students = User.objects.bulk_create(build_users(
+        [f"{prefix}_s{class_name}{section.lower()}{roll_no:03d}" for class_name, section, roll_no in seats],
+        [password_hash] * len(seats),
+        role='STUDENT',
+    ), batch_size=SYNTHETIC_BATCH_SIZE)
+
+    profiles = []
+    for student, (class_name, section, roll_no) in zip(students, seats):
+        profile = StudentProfile(
+            user=student,
+            student_class=class_name,
+            section=section,
+            roll_no=roll_no,
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+        )
+        profile.update_search_fields()
+        profiles.append(profile)
+    StudentProfile.objects.bulk_create(profiles, batch_size=SYNTHETIC_BATCH_SIZE)
+
+    teacher_for = dict(zip(sections, teachers))
+    roster = [
+        (student, class_name, teacher_for[(class_name, section)])
+        for student, (class_name, section, _) in zip(students, seats)
+    ]
+    return admin, teachers, roster
+
+
+# ==================================================
+# 📅 ATTENDANCE (1 row per student per school day)
+# ==================================================
+def _create_attendance(roster, days, present_ratio, rng, batch_size):
+    records = (
+        Attendance(
+            student=student,
+            date=day,
+            status='P' if rng.random() < present_ratio else 'A',
+            marked_by=teacher,
+        )
+        for day in days
+        for student, _, teacher in roster
+    )
+    written = _batched_create(Attendance, records, batch_size)
+
+    # bulk_create signals nahi bhejta – summary / bitmap ek baar me
+    rebuild_summaries()
+    if bitmap.is_enabled():
+        bitmap.build_from_attendance()
+
+    return written
+
+
+# ==================================================
+# 📝 MARKS (har class ke subjects × exams)
+# ==================================================
+def _create_marks(roster, class_names, exams, rng, batch_size):
+    Subject.objects.bulk_create(
+        [Subject(name=name, class_name=class_name) for class_name in class_names for name in SUBJECTS],
+        ignore_conflicts=True
+    )
+
+    subjects = {}
+    for subject in Subject.objects.filter(class_name__in=class_names, name__in=SUBJECTS):
+        subjects.setdefault(subject.class_name, []).append(subject)
+
+    marks = (
+        StudentMark(
+            student=student,
+            subject=subject,
+            exam_name=exam_name,
+            marks_obtained=rng.randint(20, 100),
+            total_marks=100,
+            uploaded_by=teacher,
+        )
+        for exam_name in exams
+        for student, class_name, teacher in roster
+        for subject in subjects[class_name]
+    )
+    return _batched_create(StudentMark, marks, batch_size)
+
+
+# ==================================================
+# 💰 FEES (sirf roster ke invoices + kuch PAID with ledger)
+# ==================================================
+def _create_fees(roster, class_names, months, paid_ratio, rng, batch_size):
+    # Sirf missing (class, month) – pehle se bani structure ka amount same
+    FeeStructure.objects.bulk_create(
+        [
+            FeeStructure(
+                class_name=class_name,
+                month=month,
+                amount=Decimal(1000 + 100 * int(class_name)),
+            )
+            for class_name in class_names
+            for month in months
+        ],
+        ignore_conflicts=True
+    )
+
+    structures = {}
+    for structure in FeeStructure.objects.filter(class_name__in=class_names, month__in=months):
+        structures.setdefault(structure.class_name, []).append(structure)
+
+    # fees.invoicing poori class invoice karta hai – yahan sirf synthetic
+    # students (kisi real student ko fee nahi)
+    invoices = (
+        StudentFee(student=student, fee_structure=structure)
+        for student, class_name, _ in roster
+        for structure in structures[class_name]
+    )
+    created = _batched_create(StudentFee, invoices, batch_size)
+
+    student_ids = [student.id for student, _, _ in roster]
+    pending = (
+        StudentFee.objects
+        .filter(student_id__in=student_ids, status='PENDING')
+        .order_by('id')
+        .values_list('id', 'student_id', 'fee_structure__amount')
+    )
+
+    paid_on = timezone.localdate()
+    fees = []
+    payments = []
+    for fee_id, student_id, amount in pending:
+        if rng.random() >= paid_ratio:
+            continue
+        transaction_id = f"TXNSYN{fee_id:010d}"
+        fees.append(StudentFee(
+            id=fee_id,
+            status='PAID',
+            paid_on=paid_on,
+            transaction_id=transaction_id,
+        ))
+        payments.append(FeePayment(
+            fee_id=fee_id,
+            student_id=student_id,
+            amount=amount,
+            transaction_id=transaction_id,
+            idempotency_key=f"{fee_id}:synthetic",
+        ))
+
+    StudentFee.objects.bulk_update(
+        fees,
+        ['status', 'paid_on', 'transaction_id'],
+        batch_size=batch_size
+    )
+    FeePayment.objects.bulk_create(payments, batch_size=batch_size)
+
+    return created, len(payments)
+
+
+# ==================================================
+# 🏫 SYNTHETIC SCHOOL GENERATOR
+# ==================================================
+def generate_school(classes=3, students_per_section=30, days=365, exams=3,
+                    months=12, present_ratio=0.9, paid_ratio=0.6,
+                    prefix='syn', seed=42, end_date=None,
+                    batch_size=SYNTHETIC_BATCH_SIZE):
+    """
+    Benchmark / load-test data
+    --------------------------
+    - `classes` classes ('1', '2' ...) × 3 sections × `students_per_section`
+    - Har section ka ek teacher, ek admin (`<prefix>_admin`)
+    - `days` din ki attendance (Sundays chhod kar), `exams` exams ke marks,
+      `months` months ki StudentFee – sirf synthetic roster ke liye
+      seedha bulk_create (fees.invoicing poori class invoice karta hai)
+    - Same seed → same data; sab kuch bulk_create (signals bypass),
+      end me summaries rebuild + dashboard counters invalidate
+    - Target classes me pehle se students hon → ValueError (real data
+      ke saath synthetic mix nahi hota)
+    """
+
+    class_names = [class_name for class_name, _ in StudentProfile.CLASS_CHOICES][:classes]
+
+    occupied = sorted(
+        StudentProfile.objects
+        .filter(student_class__in=class_names)
+        .order_by()
+        .values_list('student_class', flat=True)
+        .distinct(),
+        key=int
+    )
+    if occupied:
+        raise ValueError(
+            f"Classes {', '.join(occupied)} already have students – "
+            f"synthetic data needs empty classes"
+        )
+    end_date = end_date or timezone.localdate()
+    rng = random.Random(seed)
+
+    # PBKDF2 ek hi baar – sab accounts ka same password
+    password_hash = make_password(SYNTHETIC_PASSWORD)
+
+    with transaction.atomic():
+        admin, teachers, roster = _create_accounts(
+            prefix, class_names, students_per_section, password_hash, rng
+        )
+        attendance = _create_attendance(
+            roster, school_days(end_date, days), present_ratio, rng, batch_size
+        )
+        marks = _create_marks(roster, class_names, exam_names(exams), rng, batch_size)
+        fees, paid = _create_fees(
+            roster, class_names, fee_months(end_date, months), paid_ratio, rng, batch_size
+        )
+
+    if invalidate_metrics is not None:
+        invalidate_metrics()
+
+    return SyntheticSchool(
+        admin=admin,
+        teachers=len(teachers),
+        students=len(roster),
+        attendance=attendance,
+        marks=marks,
+        fees=fees,
+        paid_fees=paid,
+    )
@@ -1,3 +1,490 @@
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from attendance.models import Attendance, AttendanceSummary
+from fees.models import FeePayment, FeeStructure, StudentFee
+from marks.models import StudentMark
+from . import importers, provisioning
+from .benchmarks import BenchmarkTestCase
+from .importers import IMPORT_COLUMNS
+from .listings import HOMEWORK_DUE_WINDOW_DAYS, HOMEWORK_PAGE_SIZE, NOTICE_PAGE_SIZE
+from .models import Homework, Notice, StudentProfile, TeacherProfile, User
+from .search import search_students
+from .services import (
+    allocate_usernames,
+    create_user_with_unique_username,
+    next_free_username,
+    next_roll_number,
+    reserve_roll_numbers,
+)
+
+
+class GenerateSchoolCommandTests(TestCase):
+    """
+    generate_school: classes × 3 sections × students, attendance,
+    marks, fees – sab expected counts me
+    """
+
+    def test_generates_requested_size(self):
+        call_command(
+            'generate_school', classes=2, students=4, days=14, exams=2,
+            months=2, prefix='t', stdout=StringIO()
+        )
+
+        students = User.objects.filter(username__startswith='t_s')
+        self.assertEqual(students.count(), 2 * 3 * 4)
+        self.assertEqual(TeacherProfile.objects.count(), 2 * 3)
+        self.assertEqual(
+            StudentProfile.objects.filter(user__in=students).values('student_class', 'section').distinct().count(),
+            6
+        )
+
+        # 14 din me 2 Sunday
+        self.assertEqual(Attendance.objects.count(), 24 * 12)
+        self.assertTrue(AttendanceSummary.objects.exists())
+        self.assertEqual(StudentMark.objects.count(), 24 * 5 * 2)
+        self.assertEqual(StudentFee.objects.count(), 24 * 2)
+        self.assertEqual(
+            StudentFee.objects.filter(status='PAID').count(),
+            FeePayment.objects.count()
+        )
+
+    def test_real_students_and_fee_amounts_untouched(self):
+        real = User.objects.create_user('real', password='x', role='STUDENT')
+        real.student_profile.student_class = '2'
+        real.student_profile.section = 'A'
+        real.student_profile.roll_no = 1
+        real.student_profile.save()
+        FeeStructure.objects.create(class_name='2', month='January', amount=750)
+        month = timezone.localdate().strftime('%B')
+        FeeStructure.objects.create(class_name='1', month=month, amount=750)
+
+        call_command(
+            'generate_school', classes=1, students=2, days=1, months=1,
+            prefix='t', stdout=StringIO()
+        )
+        self.assertEqual(
+            FeeStructure.objects.get(class_name='1', month=month).amount, 750
+        )
+        self.assertEqual(StudentFee.objects.count(), 3 * 2)
+
+        # Class 2 me real student – synthetic data nahi milaya jata
+        with self.assertRaisesMessage(CommandError, 'Classes 1, 2 already have students'):
+            call_command(
+                'generate_school', classes=2, students=1, days=1, months=1,
+                prefix='u', stdout=StringIO()
+            )
+        self.assertFalse(StudentFee.objects.filter(student=real).exists())
+        self.assertFalse(User.objects.filter(username__startswith='u_').exists())
+
+    def test_existing_prefix_rejected(self):
+        call_command('generate_school', classes=1, students=1, days=1, stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command('generate_school', classes=1, students=1, days=1, stdout=StringIO())
+
+
+class DashboardBenchmarkTests(BenchmarkTestCase):
+    """
+    Dashboards: query count school size se independent rehna chahiye
+    """
+
+    def test_admin_dashboard(self):
+        self.login(self.admin)
+        with self.assertWithinBudget('admin_dashboard', queries=6, ms=1000):
+            response = self.client.get(reverse('dashboard:admin_dashboard'))
+        self.assertEqual(response.status_code, 200)
+
+        # Warm cache: counters DB se nahi
+        with self.assertWithinBudget('admin_dashboard (cached)', queries=2, ms=500):
+            self.client.get(reverse('dashboard:admin_dashboard'))
+
+    def test_teacher_dashboard(self):
+        self.login(self.teacher)
+        with self.assertWithinBudget('teacher_dashboard', queries=2, ms=1000):
+            response = self.client.get(reverse('dashboard:teacher_dashboard'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_student_dashboard(self):
+        self.login(self.student)
+        with self.assertWithinBudget('student_dashboard', queries=2, ms=1000):
+            response = self.client.get(reverse('dashboard:student_dashboard'))
+        self.assertEqual(response.status_code, 200)
+
+
+class ListingCacheTests(TestCase):
+    """
+    notice_list / view_homework: cached pages, signal invalidation,
+    due-date window
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user('teacher', password='x', role='TEACHER')
+        cls.student = User.objects.create_user('student', password='x', role='STUDENT')
+
+        today = timezone.localdate()
+        for offset in range(-3, HOMEWORK_PAGE_SIZE + 20):
+            Homework.objects.create(
+                teacher=cls.teacher,
+                title=f"HW {offset}",
+                description='Exercise',
+                due_date=today + timedelta(days=offset),
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.student)
+
+    def test_homework_window_and_cache_hit(self):
+        response = self.client.get(reverse('view_homework'))
+        self.assertEqual(len(response.context['homework']), HOMEWORK_DUE_WINDOW_DAYS + 1)
+        self.assertEqual(response.context['homework'][0].title, 'HW 0')
+
+        # Cache hit: sirf session + user
+        with self.assertNumQueries(2):
+            self.client.get(reverse('view_homework'))
+
+    def test_homework_all_pages(self):
+        response = self.client.get(reverse('view_homework'), {'window': 'all'})
+        self.assertEqual(len(response.context['homework']), HOMEWORK_PAGE_SIZE)
+        self.assertIsNotNone(response.context['next_query'])
+
+        seen = [hw.title for hw in response.context['homework']]
+        while response.context['next_query']:
+            response = self.client.get(f"{reverse('view_homework')}?{response.context['next_query']}")
+            seen += [hw.title for hw in response.context['homework']]
+
+        self.assertEqual(len(seen), Homework.objects.count())
+        self.assertEqual(len(set(seen)), len(seen))
+
+    def test_notice_pages_same_millisecond(self):
+        base = timezone.now().replace(microsecond=0)
+        Notice.objects.bulk_create([
+            Notice(title=f"N {i}", message='-', created_at=base + timedelta(microseconds=i))
+            for i in range(NOTICE_PAGE_SIZE * 2 + 5)
+        ])
+
+        response = self.client.get(reverse('notice_list'))
+        seen = [n.title for n in response.context['notices']]
+        while response.context['next_query']:
+            response = self.client.get(f"{reverse('notice_list')}?{response.context['next_query']}")
+            seen += [n.title for n in response.context['notices']]
+
+        self.assertEqual(len(seen), Notice.objects.count())
+        self.assertEqual(len(set(seen)), len(seen))
+
+    def notice_titles(self, **params):
+        response = self.client.get(reverse('notice_list'), params)
+        return [n.title for n in response.context['notices']]
+
+    def test_save_and_delete_invalidate(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            notice = Notice.objects.create(title='Holiday', message='School closed')
+        self.assertEqual(self.notice_titles(), ['Holiday'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Notice.objects.create(title='Exam', message='Timetable out')
+        self.assertEqual(self.notice_titles(), ['Exam', 'Holiday'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            notice.delete()
+        self.assertEqual(self.notice_titles(), ['Exam'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Homework.objects.create(
+                teacher=self.teacher, title='Urgent', description='Today',
+                due_date=timezone.localdate()
+            )
+        response = self.client.get(reverse('view_homework'))
+        self.assertIn('Urgent', [hw.title for hw in response.context['homework']])
+
+    def test_version_bumped_only_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Notice.objects.create(title='Holiday', message='School closed')
+        self.assertEqual(self.notice_titles(), ['Holiday'])
+
+        # Commit se pehle: purana cached page hi (naye version par
+        # uncommitted state cache nahi hoti)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Notice.objects.create(title='Exam', message='Timetable out')
+        self.assertEqual(self.notice_titles(), ['Holiday'])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.notice_titles(), ['Exam', 'Holiday'])
+
+    def test_cache_key_ignores_invalid_cursor(self):
+        self.notice_titles()
+
+        # Garbage ?after= → pehle page ki hi key (cache hit: session + user)
+        for cursor in ('garbage', 'W10=', 'WyJ4IiwgMV0='):
+            with self.assertNumQueries(2):
+                self.notice_titles(after=cursor)
+
+class StudentSearchTests(TestCase):
+    """
+    student_search_q(): full name / middle / last name prefix, digits exact
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', password='x', role='ADMIN')
+        student = User.objects.create_user('rahul', password='x', role='STUDENT')
+        profile = student.student_profile
+        profile.first_name = 'Rāhul'
+        profile.middle_name = 'Dev'
+        profile.last_name = 'KUMAR'
+        profile.student_class = '5'
+        profile.section = 'A'
+        profile.roll_no = 7
+        profile.save()
+        cls.profile = profile
+
+    def search(self, q):
+        return list(search_students(StudentProfile.objects.all(), q))
+
+    def test_name_token_prefixes(self):
+        for q in ('rahul', 'Rahul Dev', 'rahul dev kum', 'dev', 'Kumar', 'kum'):
+            self.assertEqual(self.search(q), [self.profile], q)
+        self.assertEqual(self.search('umar'), [])
+
+    def test_roll_number(self):
+        self.assertEqual(self.search('7'), [self.profile])
+
+    def test_unicode_digits_do_not_crash(self):
+        self.assertEqual(self.search('²'), [])
+
+        self.client.force_login(self.admin)
+        self.assertEqual(self.client.get(reverse('student_list'), {'q': '²'}).status_code, 200)
+        self.assertEqual(self.client.get(reverse('fees_report'), {'q': '²'}).status_code, 200)
+
+
+class StudentImportTests(TestCase):
+    """
+    import_students(): unreadable files, admission number race
+    """
+
+    HEADER = ','.join(IMPORT_COLUMNS)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', password='x', role='ADMIN')
+
+    def csv_row(self, first_name, admission_number):
+        return (
+            f"{first_name},,Kumar,Father,Mother,9999999999,Address,"
+            f"2012-05-04,{admission_number},5,A"
+        )
+
+    def upload(self, name, content):
+        self.client.force_login(self.admin)
+        return self.client.post(
+            reverse('student_import'),
+            {'file': SimpleUploadedFile(name, content)},
+            follow=True
+        )
+
+    def test_corrupt_xlsx_is_reported(self):
+        response = self.upload('students.xlsx', b'not a zip file')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('corrupt', str(list(response.context['messages'])[0]))
+
+    def test_non_utf8_csv_is_reported(self):
+        content = f"{self.HEADER}\n{self.csv_row('Zoë', 'A1')}\n".encode('latin-1')
+        response = self.upload('students.csv', content)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('not UTF-8', str(list(response.context['messages'])[0]))
+
+    def test_command_reports_unreadable_file(self):
+        with tempfile.NamedTemporaryFile(suffix='.xlsx') as file:
+            file.write(b'garbage')
+            file.flush()
+            with self.assertRaises(CommandError):
+                call_command('import_students', file.name, stdout=StringIO())
+
+    def test_over_length_values_are_row_errors(self):
+        long_phone = self.csv_row('Asha', 'A1').replace('9999999999', '9' * 16)
+        long_name = self.csv_row('N' * 51, 'A2')
+        content = f"{self.HEADER}\n{long_phone}\n{long_name}\n{self.csv_row('Ravi', 'A3')}\n"
+
+        result = importers.import_students(
+            BytesIO(content.encode()), 'students.csv', workers=1
+        )
+
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual(
+            [(error.row_number, error.message) for error in result.errors],
+            [
+                (2, "Too long: contact_number (max 15)"),
+                (3, "Too long: first_name (max 50)"),
+            ]
+        )
+
+    def test_admission_registered_mid_import_is_row_error(self):
+        existing = User.objects.create_user('taken', password='x', role='STUDENT')
+        existing.student_profile.admission_number = 'A1'
+        existing.student_profile.save()
+
+        content = f"{self.HEADER}\n{self.csv_row('Asha', 'A1')}\n{self.csv_row('Ravi', 'A2')}\n"
+
+        # Pehla check race "miss" kare (concurrent registration simulate)
+        real_check = importers._drop_registered_admissions
+        calls = []
+
+        def racy_check(rows, result):
+            calls.append(rows)
+            return rows if len(calls) == 1 else real_check(rows, result)
+
+        with mock.patch.object(importers, '_drop_registered_admissions', racy_check):
+            result = importers.import_students(
+                BytesIO(content.encode()), 'students.csv', workers=1
+            )
+
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual(
+            [error.message for error in result.errors],
+            ["Admission number already registered: A1"]
+        )
+
+
+class UsernameAllocationTests(TestCase):
+    """
+    base, base1, base2 ... suffix rules; batch allocation; race retry
+    """
+
+    def create(self, *usernames):
+        for username in usernames:
+            User.objects.create_user(username, password='x', role='STUDENT')
+
+    def test_next_free_username(self):
+        self.assertEqual(next_free_username('rahulkumar1'), 'rahulkumar1')
+
+        self.create('rahulkumar1')
+        self.assertEqual(next_free_username('rahulkumar1'), 'rahulkumar11')
+
+        # 'rahulkumar12' (dusre din ka base) bhi isi base ka suffix 2 lagta hai
+        self.create('rahulkumar12')
+        self.assertEqual(next_free_username('rahulkumar1'), 'rahulkumar13')
+        self.assertEqual(next_free_username('rahulkumar12'), 'rahulkumar121')
+
+        # Sirf digits wala suffix – 'rahulkumar1x' is base ka nahi
+        self.create('rahulkumar1x')
+        self.assertEqual(next_free_username('rahulkumar1'), 'rahulkumar13')
+
+    def test_allocate_usernames_duplicate_and_overlapping_bases(self):
+        self.create('amitsingh5')
+
+        self.assertEqual(
+            allocate_usernames(['amitsingh5', 'amitsingh5', 'neha3']),
+            ['amitsingh51', 'amitsingh52', 'neha3']
+        )
+
+        # 'rahulkumar1' ka doosra user 'rahulkumar11' banta – jo khud
+        # ek base hai; batch me dono alag milne chahiye
+        usernames = allocate_usernames(['rahulkumar1', 'rahulkumar1', 'rahulkumar11'])
+        self.assertEqual(usernames, ['rahulkumar1', 'rahulkumar11', 'rahulkumar111'])
+
+        usernames = allocate_usernames(['rahulkumar11', 'rahulkumar1', 'rahulkumar1'])
+        self.assertEqual(len(set(usernames)), 3)
+
+    def test_create_retries_on_username_race(self):
+        self.create('priya4')
+
+        # Concurrent registration: pehli baar mila naam INSERT tak le liya gaya
+        with mock.patch(
+            'accounts.services.next_free_username',
+            side_effect=['priya4', 'priya41'],
+        ):
+            user = create_user_with_unique_username('priya4', password='x', role='STUDENT')
+        self.assertEqual(user.username, 'priya41')
+
+        with mock.patch('accounts.services.next_free_username', return_value='priya4'):
+            with self.assertRaises(IntegrityError):
+                create_user_with_unique_username('priya4', password='x', role='STUDENT')
+
+
+class RollNumberSequenceTests(TestCase):
+    """
+    reserve_roll_numbers(): blocks, existing roll numbers, admin edits
+    """
+
+    def place(self, username, student_class, section, roll_no):
+        profile = User.objects.create_user(username, password='x', role='STUDENT').student_profile
+        profile.student_class = student_class
+        profile.section = section
+        profile.roll_no = roll_no
+        profile.save()
+        return profile
+
+    def test_block_reservation(self):
+        self.assertEqual(list(reserve_roll_numbers('6', 'B', count=3)), [1, 2, 3])
+        self.assertEqual(list(reserve_roll_numbers('6', 'B', count=2)), [4, 5])
+        self.assertEqual(next_roll_number('6', 'B'), 6)
+        # Dusra section alag sequence
+        self.assertEqual(next_roll_number('6', 'C'), 1)
+
+        with self.assertRaises(ValueError):
+            reserve_roll_numbers('6', 'B', count=0)
+
+    def test_seeded_from_existing_roll_numbers(self):
+        self.place('old', '5', 'A', 7)
+        self.assertEqual(list(reserve_roll_numbers('5', 'A', count=2)), [8, 9])
+
+    def test_manual_roll_number_edit_is_not_reissued(self):
+        self.place('first', '5', 'A', next_roll_number('5', 'A'))
+
+        # Admin (StudentProfileAdmin) ne kisi aur ko haath se roll 2 diya /
+        # dusre section se move kiya
+        self.place('edited', '5', 'A', 2)
+        moved = self.place('moved', '5', 'B', 1)
+        moved.section = 'A'
+        moved.roll_no = 4
+        moved.save()
+
+        roll_no = next_roll_number('5', 'A')
+        self.assertEqual(roll_no, 5)
+        self.place('next', '5', 'A', roll_no)
+
+
+class ProvisioningTests(TestCase):
+    """
+    provision_users(): credentials generate + process pool hashing + bulk_create
+    """
+
+    def test_parallel_provisioning(self):
+        count = provisioning.PARALLEL_HASH_THRESHOLD
+        usernames = [f"bulk{i}" for i in range(count)]
+
+        with mock.patch.object(
+            provisioning, 'ProcessPoolExecutor', wraps=provisioning.ProcessPoolExecutor
+        ) as pool:
+            provisioned = provisioning.provision_users(usernames, role='TEACHER', workers=2)
+        pool.assert_called_once()
+
+        self.assertEqual([user.username for user, _ in provisioned], usernames)
+        self.assertEqual(
+            len({password for _, password in provisioned}), count
+        )
+        for user, password in provisioned:
+            saved = User.objects.get(username=user.username)
+            self.assertEqual(saved.role, 'TEACHER')
+            self.assertTrue(saved.check_password(password))
+
+    def test_given_passwords_are_kept(self):
+        credentials = provisioning.prepare_credentials(['first@2012', None], workers=1)
+        provisioned = provisioning.provision_users(['a1', 'b1'], credentials)
 
-# Create your tests here.
+        self.assertEqual(provisioned[0].password, 'first@2012')
+        self.assertEqual(len(provisioned[1].password), provisioning.GENERATED_PASSWORD_LENGTH)
+        self.assertTrue(User.objects.get(username='b1').check_password(provisioned[1].password))
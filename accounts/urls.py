@@ -8,6 +8,7 @@ from .views import (
 
     # Student
     student_register,
+    student_import,
     student_list,
 
     # Homework
@@ -36,6 +37,7 @@ urlpatterns = [
     # 🎓 STUDENTS
     # ==================================================
     path('register/student/', student_register, name='student_register'),
+    path('register/students/import/', student_import, name='student_import'),
     path('students/', student_list, name='student_list'),
 
     # ==================================================
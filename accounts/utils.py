@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.cache import caches
+
+
+def is_ascii_digits(value):
+    """
+    Sirf 0-9 wala string – int() safe
+
+    isdigit() '²' / '٣' jaise unicode digits bhi maanta hai, jin par
+    int() fail hota hai (filter / form par 500)
+    """
+    return value.isascii() and value.isdigit()
+
+
+def configured_cache(setting_name):
+    """
+    settings.<setting_name> wala cache alias (default: 'default')
+    – e.g. FEE_RECEIPT_CACHE_ALIAS, LISTING_CACHE_ALIAS.
+    Local-memory se Redis / Memcached tak sirf settings badlo
+    """
+    return caches[getattr(settings, setting_name, 'default')]
@@ -3,11 +3,19 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import HttpResponseForbidden
-from django.db.models import Q
 from django.db import transaction
 from datetime import datetime
 
-from .models import User, Homework, StudentProfile, Notice
+from .models import User, Homework, StudentProfile
+from .importers import IMPORT_COLUMNS, ImportFileError, import_students
+from .listings import HOMEWORK_DUE_WINDOW_DAYS, homework_page, notice_page
+from .pagination import keyset_paginate
+from .search import search_students
+from .services import create_user_with_unique_username, next_roll_number
+
+
+STUDENT_LIST_PAGE_SIZE = 50
+STUDENT_LIST_KEYS = ['student_class', 'section', 'roll_no', 'id']
 
 
 # ==================================================
@@ -106,41 +114,34 @@ def student_register(request):
 
         password = f"{first_name.lower()}@{dob_obj.year}"
         base_username = f"{first_name.lower()}{last_name.lower()}{dob_obj.day}"
-        username = base_username
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}{counter}"
-            counter += 1
-
-        last_student = StudentProfile.objects.filter(
-            student_class=student_class,
-            section=section
-        ).order_by('-roll_no').first()
-
-        roll_no = last_student.roll_no + 1 if last_student else 1
 
         with transaction.atomic():
-            user = User.objects.create_user(
-                username=username,
+            # ⚡ One-query suffix lookup + retry on concurrent collision
+            user = create_user_with_unique_username(
+                base_username,
                 password=password,
                 role='STUDENT'
             )
-
-            StudentProfile.objects.create(
-                user=user,
-                first_name=first_name,
-                middle_name=middle_name,
-                last_name=last_name,
-                father_name=father_name,
-                mother_name=mother_name,
-                contact_number=contact_number,
-                address=address,
-                dob=dob_obj,
-                admission_number=admission_number,
-                student_class=student_class,
-                section=section,
-                roll_no=roll_no
-            )
+            username = user.username
+
+            # post_save signal profile bana chuka hai – wahi update karo
+            profile, _ = StudentProfile.objects.get_or_create(user=user)
+
+            profile.first_name = first_name
+            profile.middle_name = middle_name
+            profile.last_name = last_name
+            profile.father_name = father_name
+            profile.mother_name = mother_name
+            profile.contact_number = contact_number
+            profile.address = address
+            profile.dob = dob_obj
+            profile.admission_number = admission_number or None
+            profile.student_class = student_class
+            profile.section = section
+
+            # 🔢 Atomic per class/section sequence (end me, lock chhota rahe)
+            profile.roll_no = next_roll_number(student_class, section)
+            profile.save()
 
         messages.success(
             request,
@@ -154,6 +155,45 @@ def student_register(request):
     })
 
 
+# ==================================================
+# BULK STUDENT IMPORT (ADMIN ONLY)
+# ==================================================
+@login_required
+def student_import(request):
+
+    if request.user.role != 'ADMIN':
+        return HttpResponseForbidden("Only admin can import students")
+
+    result = None
+
+    if request.method == "POST":
+        upload = request.FILES.get('file')
+
+        if not upload or not upload.name.lower().endswith(('.csv', '.xlsx')):
+            messages.error(request, "Please upload a .csv or .xlsx file")
+            return redirect('student_import')
+
+        try:
+            result = import_students(upload, upload.name)
+        except ImportFileError as exc:
+            messages.error(
+                request,
+                f"{exc} – {exc.result.created_count} students imported before the error"
+            )
+            return redirect('student_import')
+
+        messages.success(
+            request,
+            f"Imported {result.created_count} students "
+            f"({result.error_count} rows rejected)"
+        )
+
+    return render(request, 'register/student_import.html', {
+        'result': result,
+        'columns': IMPORT_COLUMNS,
+    })
+
+
 # ==================================================
 # STUDENT LIST (ADMIN / TEACHER)
 # ==================================================
@@ -165,17 +205,39 @@ def student_list(request):
 
     students = StudentProfile.objects.select_related('user')
 
-    q = request.GET.get('q')
-    if q:
-        students = students.filter(
-            Q(first_name__icontains=q) |
-            Q(last_name__icontains=q) |
-            Q(roll_no__icontains=q) |
-            Q(admission_number__icontains=q)
-        )
+    students = search_students(students, request.GET.get('q'))
+
+    selected_class = request.GET.get('class')
+    if selected_class:
+        students = students.filter(student_class=selected_class)
+
+    selected_section = request.GET.get('section')
+    if selected_section:
+        students = students.filter(section=selected_section)
+
+    fees = request.GET.get('fees')
+    if fees in ('paid', 'unpaid'):
+        students = students.filter(fees_paid=(fees == 'paid'))
+
+    # ⚡ Keyset pagination – Meta ordering (class, section, roll) + id
+    page = keyset_paginate(
+        students,
+        STUDENT_LIST_KEYS,
+        cursor=request.GET.get('after'),
+        page_size=STUDENT_LIST_PAGE_SIZE
+    )
+
+    next_query = None
+    if page.has_next:
+        params = request.GET.copy()
+        params['after'] = page.next_cursor
+        next_query = params.urlencode()
 
     return render(request, 'student/student_list.html', {
-        'students': students
+        'students': page.object_list,
+        'next_query': next_query,
+        'classes': [c for c, _ in StudentProfile.CLASS_CHOICES],
+        'sections': [s for s, _ in StudentProfile.SECTION_CHOICES],
     })
 
 
@@ -216,9 +278,22 @@ def view_homework(request):
     if request.user.role != 'STUDENT':
         return HttpResponseForbidden("Access Denied")
 
-    homework = Homework.objects.all().order_by('-created_at')
+    show_all = request.GET.get('window') == 'all'
+
+    # ⚡ Cached page (Homework save / delete par invalidate)
+    page = homework_page(cursor=request.GET.get('after'), show_all=show_all)
+
+    next_query = None
+    if page.has_next:
+        params = request.GET.copy()
+        params['after'] = page.next_cursor
+        next_query = params.urlencode()
+
     return render(request, 'student/view_homework.html', {
-        'homework': homework
+        'homework': page.object_list,
+        'next_query': next_query,
+        'show_all': show_all,
+        'window_days': HOMEWORK_DUE_WINDOW_DAYS,
     })
 
 
@@ -227,9 +302,18 @@ def view_homework(request):
 # ==================================================
 @login_required
 def notice_list(request):
-    notices = Notice.objects.filter(is_active=True).order_by('-created_at')
+    # ⚡ Cached page (Notice save / delete par invalidate)
+    page = notice_page(cursor=request.GET.get('after'))
+
+    next_query = None
+    if page.has_next:
+        params = request.GET.copy()
+        params['after'] = page.next_cursor
+        next_query = params.urlencode()
+
     return render(request, 'notice/notice_list.html', {
-        'notices': notices
+        'notices': page.object_list,
+        'next_query': next_query,
     })
 
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Attendance
+from .models import Attendance, AttendanceSummary
 
 
 @admin.register(Attendance)
@@ -73,3 +73,44 @@ class AttendanceAdmin(admin.ModelAdmin):
     def status_display(self, obj):
         return obj.get_status_display()
     status_display.short_description = 'Status'
+
+
+@admin.register(AttendanceSummary)
+class AttendanceSummaryAdmin(admin.ModelAdmin):
+    """
+    Per-student monthly attendance counters (read-only –
+    Attendance se automatically maintain hote hain)
+    """
+
+    list_display = (
+        'student',
+        'year',
+        'month',
+        'present',
+        'absent',
+        'updated_at',
+    )
+
+    list_filter = (
+        'year',
+        'month',
+    )
+
+    search_fields = (
+        'student__username',
+    )
+
+    list_select_related = ('student',)
+
+    ordering = ('-year', '-month', 'student')
+
+    readonly_fields = (
+        'student',
+        'year',
+        'month',
+        'present',
+        'absent',
+        'updated_at',
+    )
+
+    list_per_page = 25
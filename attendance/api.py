@@ -0,0 +1,242 @@
+import calendar
+import hashlib
+from datetime import MAXYEAR, MINYEAR, date, datetime, time
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.exceptions import ParseError, PermissionDenied
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.models import StudentProfile
+from .freshness import section_last_modified, student_last_modified
+from .models import Attendance
+from .permissions import IsStudent, IsTeacherOrAdmin
+
+
+# Compact status string: ek character per day
+NOT_MARKED = '-'
+
+LEGEND = {
+    'P': 'Present',
+    'A': 'Absent',
+    NOT_MARKED: 'Not marked',
+}
+
+
+# ======================================================
+# 🏷️ CONDITIONAL GET (Last-Modified + ETag)
+# ======================================================
+class ConditionalAPIView(APIView):
+    """
+    Subclass get_params() (defaults resolve karke, e.g. date = aaj) aur
+    get_last_modified() deta hai (cache se, attendance query nahi).
+    If-None-Match / If-Modified-Since match → 304, get_payload() call
+    hi nahi hota.
+
+    Resolved params ETag me hain: ?date= ke bina kal wala ETag aaj
+    match nahi karta (URL same hote hue bhi).
+    """
+
+    def get_params(self, request):
+        return {}
+
+    def get_last_modified(self, request, params):
+        raise NotImplementedError
+
+    def get_payload(self, request, params):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        params = self.get_params(request)
+        changed = self.get_last_modified(request, params)
+
+        resolved = "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+        raw = (
+            f"{request.version}:{request.user.pk}:{request.get_full_path()}:"
+            f"{resolved}:{changed.isoformat()}"
+        )
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        last_modified = int(changed.timestamp())
+
+        cached = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+        response = cached if cached is not None else Response(self.get_payload(request, params))
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Client har baar revalidate kare (304 sasta hai)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+def month_string(year, month, statuses):
+    """
+    {day: 'P' / 'A'} → "PPA-P..." (month ke har din ka ek character)
+    """
+    days = calendar.monthrange(year, month)[1]
+    return ''.join(statuses.get(day, NOT_MARKED) for day in range(1, days + 1))
+
+
+def defaulted_since(changed, day):
+    """
+    Default (aaj / is saal) wala response `day` shuru hone par badla –
+    Last-Modified usse purana nahi, warna If-Modified-Since par kal ka 304
+    """
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return max(changed, start)
+
+
+def parse_int(value, default):
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ParseError(f"Invalid number: {value}")
+
+
+# ======================================================
+# 👨‍🎓 STUDENT: OWN ATTENDANCE  /api/v1/attendance/me/
+# ======================================================
+class StudentAttendanceAPI(ConditionalAPIView):
+    """
+    GET ?year=YYYY (default: current year)
+
+    {
+      "student": 12, "year": 2026,
+      "months": {"2026-04": {"days": "PPA-P...", "present": 18, "absent": 2}}
+    }
+    """
+
+    permission_classes = [IsStudent]
+
+    def get_params(self, request):
+        year = parse_int(request.query_params.get('year'), timezone.localdate().year)
+        if not MINYEAR <= year <= MAXYEAR:
+            raise ParseError(f"year must be between {MINYEAR} and {MAXYEAR}.")
+        return {'year': year}
+
+    def get_last_modified(self, request, params):
+        changed = student_last_modified(request.user.pk)
+        if not request.query_params.get('year'):
+            changed = defaulted_since(changed, date(params['year'], 1, 1))
+        return changed
+
+    def get_payload(self, request, params):
+        year = params['year']
+
+        records = (
+            Attendance.objects
+            .filter(
+                student=request.user,
+                date__range=(date(year, 1, 1), date(year, 12, 31))
+            )
+            .order_by()
+            .values_list('date', 'status')
+        )
+
+        by_month = {}
+        for day, status in records:
+            by_month.setdefault(day.month, {})[day.day] = status
+
+        months = {}
+        for month in sorted(by_month):
+            statuses = by_month[month]
+            present = sum(1 for status in statuses.values() if status == 'P')
+            months[f"{year}-{month:02d}"] = {
+                'days': month_string(year, month, statuses),
+                'present': present,
+                'absent': len(statuses) - present,
+            }
+
+        return {
+            'student': request.user.pk,
+            'year': year,
+            'legend': LEGEND,
+            'months': months,
+        }
+
+
+# ======================================================
+# 👨‍🏫 TEACHER / ADMIN: SECTION BY DATE  /api/v1/attendance/section/
+# ======================================================
+class SectionAttendanceAPI(ConditionalAPIView):
+    """
+    GET ?date=YYYY-MM-DD (default: today)
+    - TEACHER: apni assigned class + section
+    - ADMIN: ?class= & ?section= zaroori
+
+    {
+      "date": "2026-04-02", "class": "8", "section": "A",
+      "statuses": "PPA-",
+      "students": [{"id": 5, "roll_no": 1, "username": "..."}, ...]
+    }
+    (statuses[i] ↔ students[i], roll number order)
+    """
+
+    permission_classes = [IsTeacherOrAdmin]
+
+    def get_scope(self, request):
+        if request.user.role == 'TEACHER':
+            profile = getattr(request.user, 'teacher_profile', None)
+            if not profile or not profile.assigned_class:
+                raise PermissionDenied("Teacher profile / assigned class not found.")
+            return profile.assigned_class, profile.assigned_section
+
+        student_class = request.query_params.get('class')
+        section = request.query_params.get('section')
+        if not student_class or not section:
+            raise ParseError("class and section are required.")
+        return student_class, section
+
+    def get_params(self, request):
+        student_class, section = self.get_scope(request)
+
+        try:
+            day = date.fromisoformat(request.query_params['date'])
+        except KeyError:
+            day = timezone.localdate()
+        except ValueError:
+            raise ParseError("date must be YYYY-MM-DD.")
+
+        return {'class': student_class, 'section': section, 'date': day}
+
+    def get_last_modified(self, request, params):
+        changed = section_last_modified(params['class'], params['section'])
+        if 'date' not in request.query_params:
+            changed = defaulted_since(changed, params['date'])
+        return changed
+
+    def get_payload(self, request, params):
+        student_class, section, day = params['class'], params['section'], params['date']
+
+        students = list(
+            StudentProfile.objects
+            .filter(student_class=student_class, section=section)
+            .order_by('roll_no', 'user_id')
+            .values_list('user_id', 'roll_no', 'user__username')
+        )
+
+        statuses = dict(
+            Attendance.objects
+            .filter(date=day, student_id__in=[row[0] for row in students])
+            .values_list('student_id', 'status')
+        )
+
+        return {
+            'date': day.isoformat(),
+            'class': student_class,
+            'section': section,
+            'legend': LEGEND,
+            'statuses': ''.join(statuses.get(row[0], NOT_MARKED) for row in students),
+            'students': [
+                {'id': user_id, 'roll_no': roll_no, 'username': username}
+                for user_id, roll_no, username in students
+            ],
+        }
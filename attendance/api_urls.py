@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .api import SectionAttendanceAPI, StudentAttendanceAPI
+
+app_name = 'attendance_api'
+
+urlpatterns = [
+    # 👨‍🎓 Student: own attendance (month-wise status strings)
+    path('me/', StudentAttendanceAPI.as_view(), name='me'),
+
+    # 👨‍🏫 Teacher / Admin: section by date
+    path('section/', SectionAttendanceAPI.as_view(), name='section'),
+]
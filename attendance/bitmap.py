@@ -0,0 +1,247 @@
+import calendar
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+
+from .models import Attendance, AttendanceBitmap
+
+# NumPy OPTIONAL hai – na ho to pure Python popcount
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+BUILD_BATCH_SIZE = 1000
+
+# 31 days ke saare bits
+FULL_MONTH = (1 << 31) - 1
+
+
+def is_enabled():
+    return getattr(settings, 'ATTENDANCE_BITMAP_STORE', False)
+
+
+def day_bit(day):
+    return 1 << (day - 1)
+
+
+def days_mask(first_day, last_day):
+    """
+    first_day..last_day (1-based, inclusive) ke bits
+    """
+    return ((1 << last_day) - 1) ^ ((1 << (first_day - 1)) - 1)
+
+
+# ======================================================
+# ✍️ WRITE PATH
+# ======================================================
+def mark_day(statuses, attendance_date):
+    """
+    statuses: {student_id: 'P' / 'A'} – ek date ke liye
+
+    - Missing month rows ek bulk INSERT (ignore_conflicts) me
+    - Phir do UPDATE: Present students ka bit set, Absent ka clear;
+      dono me marked bit set (SQL bitwise ops, read-modify-write nahi)
+    """
+
+    if not statuses:
+        return
+
+    year, month = attendance_date.year, attendance_date.month
+    bit = day_bit(attendance_date.day)
+
+    present_ids = [sid for sid, status in statuses.items() if status == 'P']
+    absent_ids = [sid for sid, status in statuses.items() if status != 'P']
+
+    with transaction.atomic():
+        AttendanceBitmap.objects.bulk_create(
+            [
+                AttendanceBitmap(student_id=sid, year=year, month=month)
+                for sid in statuses
+            ],
+            ignore_conflicts=True,
+        )
+
+        rows = AttendanceBitmap.objects.filter(year=year, month=month)
+
+        if present_ids:
+            rows.filter(student_id__in=present_ids).update(
+                present_bits=F('present_bits').bitor(bit),
+                marked_bits=F('marked_bits').bitor(bit),
+            )
+
+        if absent_ids:
+            rows.filter(student_id__in=absent_ids).update(
+                present_bits=F('present_bits').bitand(FULL_MONTH ^ bit),
+                marked_bits=F('marked_bits').bitor(bit),
+            )
+
+
+def clear_day(student_id, attendance_date):
+    """
+    Attendance delete hone par us din ke dono bits hatao
+    """
+    clear = FULL_MONTH ^ day_bit(attendance_date.day)
+
+    AttendanceBitmap.objects.filter(
+        student_id=student_id,
+        year=attendance_date.year,
+        month=attendance_date.month,
+    ).update(
+        present_bits=F('present_bits').bitand(clear),
+        marked_bits=F('marked_bits').bitand(clear),
+    )
+
+
+# ======================================================
+# 🔢 POPCOUNT (VECTORIZED)
+# ======================================================
+def _unpackbits_popcount(array):
+    # NumPy < 2.0 (bitwise_count nahi): har uint32 ke 4 bytes unpack karke sum
+    bits = np.unpackbits(array.reshape(-1, 1).view(np.uint8), axis=1)
+    return bits.sum(axis=1, dtype=np.uint32)
+
+
+def popcount(values):
+    """
+    Har integer ke set bits – NumPy array par ek vectorized call
+    """
+    if np is not None:
+        array = np.ascontiguousarray(values, dtype=np.uint32)
+        if hasattr(np, 'bitwise_count'):
+            return np.bitwise_count(array)
+        return _unpackbits_popcount(array)
+    return [int(value).bit_count() for value in values]
+
+
+# ======================================================
+# 📊 QUERY API
+# ======================================================
+def _month_range_q(start, end):
+    """
+    (year, month) start..end (inclusive) – index friendly filter
+    """
+    after_start = Q(year__gt=start.year) | Q(year=start.year, month__gte=start.month)
+    before_end = Q(year__lt=end.year) | Q(year=end.year, month__lte=end.month)
+    return after_start & before_end
+
+
+def _row_mask(year, month, start, end):
+    """
+    Partial months (range ka pehla / aakhri month) ke liye day mask
+    """
+    first_day = start.day if (year, month) == (start.year, start.month) else 1
+    last_day = (
+        end.day if (year, month) == (end.year, end.month)
+        else calendar.monthrange(year, month)[1]
+    )
+    return days_mask(first_day, last_day)
+
+
+def range_summary(student_ids, start, end):
+    """
+    start..end (dates, inclusive) me har student ke
+    {student_id: (present_days, marked_days)}
+
+    Per-day Attendance rows scan nahi: har student ke liye max
+    ek row per month, popcount se count.
+    """
+
+    rows = list(
+        AttendanceBitmap.objects
+        .filter(_month_range_q(start, end), student_id__in=student_ids)
+        .values_list('student_id', 'year', 'month', 'present_bits', 'marked_bits')
+    )
+
+    result = {sid: (0, 0) for sid in student_ids}
+    if not rows:
+        return result
+
+    masks = [_row_mask(year, month, start, end) for _, year, month, _, _ in rows]
+
+    if np is not None:
+        ids = np.array([row[0] for row in rows])
+        mask = np.array(masks, dtype=np.uint32)
+        present = np.array([row[3] for row in rows], dtype=np.uint32) & mask
+        marked = np.array([row[4] for row in rows], dtype=np.uint32) & mask
+
+        unique_ids, index = np.unique(ids, return_inverse=True)
+        present_counts = np.bincount(index, weights=popcount(present))
+        marked_counts = np.bincount(index, weights=popcount(marked))
+
+        for sid, p, m in zip(unique_ids.tolist(), present_counts, marked_counts):
+            result[sid] = (int(p), int(m))
+        return result
+
+    totals = defaultdict(lambda: [0, 0])
+    for (sid, _, _, present_bits, marked_bits), mask in zip(rows, masks):
+        totals[sid][0] += (present_bits & mask).bit_count()
+        totals[sid][1] += (marked_bits & mask).bit_count()
+
+    result.update({sid: tuple(counts) for sid, counts in totals.items()})
+    return result
+
+
+def attendance_percentage(student_id, start, end):
+    present, marked = range_summary([student_id], start, end)[student_id]
+    return round((present / marked) * 100, 2) if marked else 0
+
+
+def present_days(student_id, year, month):
+    """
+    Month M me kin dino Present tha – [2, 3, 5, ...]
+    """
+    bits = (
+        AttendanceBitmap.objects
+        .filter(student_id=student_id, year=year, month=month)
+        .values_list('present_bits', flat=True)
+        .first()
+    ) or 0
+
+    return [day for day in range(1, 32) if bits & day_bit(day)]
+
+
+# ======================================================
+# 🔁 MIGRATION PATH: Attendance → AttendanceBitmap
+# ======================================================
+def build_from_attendance():
+    """
+    Existing Attendance table se poora bitmap store banata hai
+    (student, date order me stream, har student-month ek row).
+    Returns rows written.
+    """
+
+    bitmaps = {}
+    records = (
+        Attendance.objects
+        .order_by()
+        .values_list('student_id', 'date', 'status')
+        .iterator(chunk_size=BUILD_BATCH_SIZE * 10)
+    )
+
+    for student_id, day, status in records:
+        key = (student_id, day.year, day.month)
+        bitmap = bitmaps.get(key)
+        if bitmap is None:
+            bitmap = bitmaps[key] = AttendanceBitmap(
+                student_id=student_id,
+                year=day.year,
+                month=day.month,
+            )
+
+        bit = day_bit(day.day)
+        bitmap.marked_bits |= bit
+        if status == 'P':
+            bitmap.present_bits |= bit
+
+    with transaction.atomic():
+        AttendanceBitmap.objects.all().delete()
+        AttendanceBitmap.objects.bulk_create(
+            bitmaps.values(),
+            batch_size=BUILD_BATCH_SIZE
+        )
+
+    return len(bitmaps)
@@ -0,0 +1,125 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from accounts.models import StudentProfile
+from accounts.utils import configured_cache
+from .models import Attendance
+
+
+# ======================================================
+# 🕒 LAST-MODIFIED STAMPS (API conditional GET ke liye)
+# ======================================================
+# Har student aur har (class, section) ka "attendance last changed"
+# timestamp cache me. Attendance write par touch_students(), roster
+# change (class / section / roll_no) par touch_sections() bump karta
+# hai – writer ke commit ke baad; cache miss par Max(Attendance.updated_at)
+# DB se.
+# Isse unchanged poll ka 304 bina attendance query ke nikalta hai.
+
+KEY_PREFIX = 'attendance:modified:'
+
+# Signal miss ho jaye (queryset.update / dusra process with
+# local-memory cache) to bhi itni der me DB se refresh
+STAMP_TIMEOUT = 60 * 60
+
+# Koi attendance nahi → fixed purana stamp
+NEVER = datetime(2000, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def get_cache():
+    return configured_cache('ATTENDANCE_CACHE_ALIAS')
+
+
+def _student_key(student_id):
+    return f"{KEY_PREFIX}student:{student_id}"
+
+
+def _section_key(student_class, section):
+    return f"{KEY_PREFIX}section:{student_class}:{section}"
+
+
+def student_last_modified(student_id):
+    key = _student_key(student_id)
+    cache = get_cache()
+
+    stamp = cache.get(key)
+    if stamp is None:
+        stamp = (
+            Attendance.objects
+            .filter(student_id=student_id)
+            .aggregate(changed=Max('updated_at'))['changed']
+        ) or NEVER
+        cache.set(key, stamp, STAMP_TIMEOUT)
+
+    return stamp
+
+
+def section_last_modified(student_class, section):
+    key = _section_key(student_class, section)
+    cache = get_cache()
+
+    stamp = cache.get(key)
+    if stamp is None:
+        stamp = (
+            Attendance.objects
+            .filter(
+                student__student_profile__student_class=student_class,
+                student__student_profile__section=section,
+            )
+            .aggregate(changed=Max('updated_at'))['changed']
+        ) or NEVER
+        cache.set(key, stamp, STAMP_TIMEOUT)
+
+    return stamp
+
+
+def _set_stamps(keys):
+    now = timezone.now()
+    get_cache().set_many({key: now for key in keys}, STAMP_TIMEOUT)
+
+
+def _touch_after_commit(keys):
+    """
+    Stamp writer ke transaction commit ke baad hi – warna commit se pehle
+    aaya reader purana data naye stamp / ETag ke saath le jata (aur 304
+    par atka rehta); rollback par stamp nahi badalta
+    """
+    transaction.on_commit(lambda: _set_stamps(keys))
+
+
+def touch_students(student_ids):
+    """
+    In students (aur unke sections) ka stamp = commit ka waqt
+    (1 query: students ke class / section)
+    """
+    sections = (
+        StudentProfile.objects
+        .filter(user_id__in=student_ids)
+        .values_list('student_class', 'section')
+        .distinct()
+    )
+
+    keys = [_student_key(student_id) for student_id in student_ids]
+    keys += [
+        _section_key(student_class, section)
+        for student_class, section in sections
+    ]
+
+    _touch_after_commit(keys)
+
+
+def touch_sections(sections):
+    """
+    Roster badla (student add / remove / move / roll_no) – in
+    (class, section) ka stamp = commit ka waqt
+    """
+    keys = [
+        _section_key(student_class, section)
+        for student_class, section in sections
+        if student_class and section
+    ]
+    if keys:
+        _touch_after_commit(keys)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from attendance.bitmap import build_from_attendance
+
+
+class Command(BaseCommand):
+    help = "Build the compact AttendanceBitmap store from existing Attendance records"
+
+    def handle(self, *args, **options):
+        written = build_from_attendance()
+        self.stdout.write(self.style.SUCCESS(
+            f"Attendance bitmaps built ({written} student-month rows)"
+        ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from attendance.summary import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild the AttendanceSummary table from Attendance records"
+
+    def handle(self, *args, **options):
+        written = rebuild_summaries()
+        self.stdout.write(self.style.SUCCESS(
+            f"Attendance summary rebuilt ({written} student-month rows)"
+        ))
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def build_summaries(apps, schema_editor):
+    Attendance = apps.get_model('attendance', 'Attendance')
+    AttendanceSummary = apps.get_model('attendance', 'AttendanceSummary')
+
+    counts = (
+        Attendance.objects
+        .annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+        .values('student_id', 'year', 'month')
+        .annotate(
+            present=Count('id', filter=Q(status='P')),
+            absent=Count('id', filter=Q(status='A')),
+        )
+        .order_by()
+    )
+
+    AttendanceSummary.objects.bulk_create(
+        [AttendanceSummary(**row) for row in counts],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0004_alter_attendance_options_alter_attendance_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attendance',
+            name='date',
+            field=models.DateField(default=django.utils.timezone.localdate),
+        ),
+        migrations.CreateModel(
+            name='AttendanceSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('present', models.PositiveIntegerField(default=0)),
+                ('absent', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('student', models.ForeignKey(limit_choices_to={'role': 'STUDENT'}, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Attendance Summary',
+                'verbose_name_plural': 'Attendance Summaries',
+                'ordering': ['-year', '-month', 'student'],
+                'indexes': [models.Index(fields=['year', 'month'], name='attendance__year_05e6f4_idx')],
+                'unique_together': {('student', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(build_summaries, migrations.RunPython.noop),
+    ]
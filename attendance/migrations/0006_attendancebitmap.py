@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_attendancesummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceBitmap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('present_bits', models.PositiveIntegerField(default=0)),
+                ('marked_bits', models.PositiveIntegerField(default=0)),
+                ('student', models.ForeignKey(limit_choices_to={'role': 'STUDENT'}, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_bitmaps', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Attendance Bitmap',
+                'verbose_name_plural': 'Attendance Bitmaps',
+                'ordering': ['-year', '-month', 'student'],
+                'indexes': [models.Index(fields=['year', 'month'], name='attendance__year_2606f5_idx')],
+                'unique_together': {('student', 'year', 'month')},
+            },
+        ),
+    ]
@@ -104,3 +104,91 @@ class Attendance(models.Model):
     # --------------------
     def __str__(self):
         return f"{self.student.username} | {self.date} | {self.get_status_display()}"
+
+
+class AttendanceSummary(models.Model):
+    """
+    Attendance Summary (Denormalized)
+    ---------------------------------
+    Har student ka har month ka present / absent counter.
+
+    - Attendance write hone par attendance.summary se refresh hota hai
+      (signals + bulk write path)
+    - Student percentage / monthly report yahin se O(1) lookup
+    - `manage.py rebuild_attendance_summary` se poora rebuild
+    """
+
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='attendance_summaries',
+        limit_choices_to={'role': 'STUDENT'}
+    )
+
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+
+    present = models.PositiveIntegerField(default=0)
+    absent = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('student', 'year', 'month')
+        ordering = ['-year', '-month', 'student']
+        verbose_name = 'Attendance Summary'
+        verbose_name_plural = 'Attendance Summaries'
+        indexes = [
+            models.Index(fields=['year', 'month']),
+        ]
+
+    @property
+    def total(self):
+        return self.present + self.absent
+
+    @property
+    def percentage(self):
+        return round((self.present / self.total) * 100, 2) if self.total else 0
+
+    def __str__(self):
+        return f"{self.student_id} | {self.year}-{self.month:02d} | {self.present}/{self.total}"
+
+
+class AttendanceBitmap(models.Model):
+    """
+    Compact Attendance Store (Optional)
+    -----------------------------------
+    Ek student ka ek month = ek row.
+
+    - present_bits: bit (day - 1) set → us din Present
+    - marked_bits:  bit (day - 1) set → us din attendance mark hui
+      (absent = marked & ~present)
+    - settings.ATTENDANCE_BITMAP_STORE = True hone par Attendance
+      writes ke saath sync hota hai; query API attendance.bitmap me
+    """
+
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='attendance_bitmaps',
+        limit_choices_to={'role': 'STUDENT'}
+    )
+
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+
+    # 31 days → 31 bits (signed 32-bit integer me fit)
+    present_bits = models.PositiveIntegerField(default=0)
+    marked_bits = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('student', 'year', 'month')
+        ordering = ['-year', '-month', 'student']
+        verbose_name = 'Attendance Bitmap'
+        verbose_name_plural = 'Attendance Bitmaps'
+        indexes = [
+            models.Index(fields=['year', 'month']),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} | {self.year}-{self.month:02d} | {self.present_bits:031b}"
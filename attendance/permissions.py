@@ -0,0 +1,34 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsStudent(BasePermission):
+    """
+    Allows access only to authenticated users
+    whose role is STUDENT
+    """
+
+    message = "Only students are allowed to perform this action."
+
+    def has_permission(self, request, view):
+        user = request.user
+
+        if not user or not user.is_authenticated:
+            return False
+
+        return getattr(user, 'role', None) == 'STUDENT'
+
+
+class IsTeacherOrAdmin(BasePermission):
+    """
+    Allows access only to authenticated TEACHER / ADMIN users
+    """
+
+    message = "Only teachers and admins are allowed to perform this action."
+
+    def has_permission(self, request, view):
+        user = request.user
+
+        if not user or not user.is_authenticated:
+            return False
+
+        return getattr(user, 'role', None) in ('TEACHER', 'ADMIN')
@@ -0,0 +1,91 @@
+import calendar
+from datetime import date
+from typing import NamedTuple, Optional
+
+from django.db.models import FilteredRelation, Q
+from django.db.models.functions import Coalesce
+
+from accounts.models import User
+
+
+# ======================================================
+# 📋 REPORT ROW (template + exports dono isi ko use karte hain)
+# ======================================================
+class AttendanceRow(NamedTuple):
+    student_id: int
+    username: str
+    student_class: Optional[str]
+    section: Optional[str]
+    roll_no: Optional[int]
+    present: int
+    absent: int
+
+    @property
+    def total(self):
+        return self.present + self.absent
+
+    @property
+    def percentage(self):
+        return round((self.present / self.total) * 100, 2) if self.total else 0
+
+
+def month_bounds(year, month):
+    """
+    (first_day, last_day) of the given month – index friendly
+    date range filter ke liye (date__month/date__year ki jagah)
+    """
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, 1), date(year, month, last_day)
+
+
+# ======================================================
+# 📊 MONTHLY ATTENDANCE MATRIX (SINGLE QUERY)
+# ======================================================
+def monthly_attendance_report(year, month, student_class=None, section=None):
+    """
+    Monthly Attendance Report Engine
+    --------------------------------
+    - Saare students ka present/absent count ek hi query me
+      (AttendanceSummary se LEFT JOIN – per-day rows scan nahi)
+    - Jin students ki koi attendance nahi hai wo bhi 0/0 ke saath aate hain
+    - Optional class / section filter
+    - Returns list[AttendanceRow]
+    """
+
+    students = (
+        User.objects
+        .filter(role='STUDENT')
+        .annotate(
+            summary=FilteredRelation(
+                'attendance_summaries',
+                condition=Q(
+                    attendance_summaries__year=year,
+                    attendance_summaries__month=month,
+                )
+            )
+        )
+    )
+
+    if student_class:
+        students = students.filter(student_profile__student_class=student_class)
+
+    if section:
+        students = students.filter(student_profile__section=section)
+
+    rows = (
+        students
+        .values_list(
+            'id',
+            'username',
+            'student_profile__student_class',
+            'student_profile__section',
+            'student_profile__roll_no',
+        )
+        .annotate(
+            present=Coalesce('summary__present', 0),
+            absent=Coalesce('summary__absent', 0),
+        )
+        .order_by('username')
+    )
+
+    return [AttendanceRow(*row) for row in rows]
@@ -0,0 +1,90 @@
+from typing import NamedTuple
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from . import bitmap
+from .freshness import touch_students
+from .models import Attendance
+from .summary import refresh_summaries
+
+
+class BulkAttendanceResult(NamedTuple):
+    inserted: list
+    updated: list
+
+    @property
+    def saved_count(self):
+        return len(self.inserted) + len(self.updated)
+
+
+# ======================================================
+# ⚡ BULK ATTENDANCE UPSERT (POORA SECTION EK SAATH)
+# ======================================================
+def bulk_mark_attendance(marked_by, statuses, attendance_date):
+    """
+    Bulk Attendance Write Path
+    --------------------------
+    - statuses: {student_user: 'P' / 'A'}
+    - Role check sirf ek baar (Attendance.clean() wale rules)
+    - Ek INSERT ... ON CONFLICT (student, date) DO UPDATE statement
+    - Same transaction me AttendanceSummary refresh
+    - Returns BulkAttendanceResult(inserted=[student_ids], updated=[student_ids])
+    """
+
+    if getattr(marked_by, 'role', None) != 'TEACHER':
+        raise ValidationError("Attendance sirf TEACHER ke dwara mark ho sakti hai.")
+
+    for student, status in statuses.items():
+        if getattr(student, 'role', None) != 'STUDENT':
+            raise ValidationError("Attendance sirf STUDENT ke liye mark ho sakti hai.")
+        if status not in ('P', 'A'):
+            raise ValidationError(f"Invalid attendance status: {status}")
+
+    if not statuses:
+        return BulkAttendanceResult(inserted=[], updated=[])
+
+    student_ids = [student.id for student in statuses]
+
+    with transaction.atomic():
+        existing = set(
+            Attendance.objects
+            .filter(student_id__in=student_ids, date=attendance_date)
+            .values_list('student_id', flat=True)
+        )
+
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    student=student,
+                    date=attendance_date,
+                    status=status,
+                    marked_by=marked_by,
+                )
+                for student, status in statuses.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['student', 'date'],
+            update_fields=['status', 'marked_by', 'updated_at'],
+        )
+
+        # bulk_create signals nahi bhejta – summary yahin refresh
+        refresh_summaries(
+            student_ids,
+            attendance_date.year,
+            attendance_date.month
+        )
+
+        if bitmap.is_enabled():
+            bitmap.mark_day(
+                {student.id: status for student, status in statuses.items()},
+                attendance_date
+            )
+
+    # API clients ka next poll naya data le (conditional GET)
+    touch_students(student_ids)
+
+    return BulkAttendanceResult(
+        inserted=[sid for sid in student_ids if sid not in existing],
+        updated=[sid for sid in student_ids if sid in existing],
+    )
@@ -0,0 +1,147 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from accounts.models import StudentProfile
+from accounts.signals import students_bulk_created
+from . import bitmap
+from .freshness import touch_sections, touch_students
+from .models import Attendance
+from .summary import refresh_summaries
+
+
+# ==================================================
+# SIGNAL: PURANA (student, date) – ADMIN EDIT
+# ==================================================
+SLOT_FIELDS = {'student', 'student_id', 'date'}
+
+
+@receiver(pre_save, sender=Attendance)
+def attendance_slot_before(sender, instance, update_fields=None, **kwargs):
+    """
+    AttendanceAdmin date / student bhi badal sakta hai – purana
+    (student_id, date) yaad rakho, taaki purane student-month ka
+    summary / bitmap bhi theek ho. Slot fields update nahi ho rahe → query nahi
+    """
+    instance._old_slot = None
+    if instance.pk is None:
+        return
+    if update_fields is not None and not SLOT_FIELDS & set(update_fields):
+        return
+
+    instance._old_slot = (
+        sender.objects.filter(pk=instance.pk).values_list('student_id', 'date').first()
+    )
+
+
+def moved_from(instance):
+    """
+    post_save me: row kisi aur (student_id, date) se aayi ho to wo, warna None
+    """
+    old = getattr(instance, '_old_slot', None)
+    if old is not None and old != (instance.student_id, instance.date):
+        return old
+    return None
+
+
+# ==================================================
+# SIGNAL: KEEP AttendanceSummary IN SYNC
+# ==================================================
+def _refresh_slots(slots):
+    """
+    (student_id, date) slots ke student-months ka summary refresh
+    + API last-modified stamp bump
+    """
+    months = {(student_id, day.year, day.month) for student_id, day in slots}
+    for student_id, year, month in months:
+        refresh_summaries([student_id], year, month)
+
+    touch_students(sorted({student_id for student_id, _ in slots}))
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_saved(sender, instance, **kwargs):
+    """
+    Single Attendance save → us student-month ka summary refresh; date /
+    student badla ho to purane student-month ka bhi
+    (bulk path attendance.services khud refresh karta hai)
+    """
+    slots = [(instance.student_id, instance.date)]
+    old = moved_from(instance)
+    if old is not None:
+        slots.append(old)
+    _refresh_slots(slots)
+
+
+@receiver(post_delete, sender=Attendance)
+def attendance_deleted(sender, instance, **kwargs):
+    _refresh_slots([(instance.student_id, instance.date)])
+
+
+# ==================================================
+# SIGNAL: OPTIONAL BITMAP STORE
+# ==================================================
+@receiver(post_save, sender=Attendance)
+def attendance_saved_bitmap(sender, instance, **kwargs):
+    if not bitmap.is_enabled():
+        return
+
+    # Date / student badla → purane din ke bits hatao
+    old = moved_from(instance)
+    if old is not None:
+        bitmap.clear_day(*old)
+
+    bitmap.mark_day({instance.student_id: instance.status}, instance.date)
+
+
+@receiver(post_delete, sender=Attendance)
+def attendance_deleted_bitmap(sender, instance, **kwargs):
+    if bitmap.is_enabled():
+        bitmap.clear_day(instance.student_id, instance.date)
+
+
+# ==================================================
+# SIGNAL: SECTION ROSTER → API LAST-MODIFIED STAMP
+# ==================================================
+# Section API ke students / statuses roster par bhi depend karte hain
+ROSTER_FIELDS = ('student_class', 'section', 'roll_no')
+
+
+def _roster(profile):
+    return tuple(getattr(profile, field) for field in ROSTER_FIELDS)
+
+
+@receiver(pre_save, sender=StudentProfile)
+def student_profile_roster_before(sender, instance, update_fields=None, **kwargs):
+    """
+    Purana (class, section, roll_no) – move hone par purane section ka
+    stamp bhi bump ho. Roster fields update nahi ho rahe → query nahi
+    """
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(ROSTER_FIELDS) & set(update_fields):
+        return
+
+    instance._old_roster = (
+        sender.objects.filter(pk=instance.pk).values_list(*ROSTER_FIELDS).first()
+    )
+
+
+@receiver(post_save, sender=StudentProfile)
+def student_profile_roster_saved(sender, instance, created, **kwargs):
+    old = instance.__dict__.pop('_old_roster', None)
+    new = _roster(instance)
+
+    if created:
+        touch_sections([new[:2]])
+    elif old is not None and old != new:
+        touch_sections({old[:2], new[:2]})
+
+
+@receiver(post_delete, sender=StudentProfile)
+def student_profile_roster_deleted(sender, instance, **kwargs):
+    touch_sections([_roster(instance)[:2]])
+
+
+@receiver(students_bulk_created)
+def students_imported_roster(sender, sections=(), **kwargs):
+    touch_sections(sections)
@@ -0,0 +1,127 @@
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+from .models import Attendance, AttendanceSummary
+from .reports import month_bounds
+
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def _upsert(summaries):
+    AttendanceSummary.objects.bulk_create(
+        summaries,
+        batch_size=REBUILD_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['student', 'year', 'month'],
+        update_fields=['present', 'absent', 'updated_at'],
+    )
+
+
+# ======================================================
+# ♻️ INCREMENTAL REFRESH (student-month level)
+# ======================================================
+def refresh_summaries(student_ids, year, month):
+    """
+    Diye gaye students ka ek month ka summary Attendance se dobara
+    count karta hai – (student, date) index par ek grouped query +
+    ek upsert. Exact rehta hai chahe status P ↔ A badla ho.
+    """
+
+    student_ids = list(student_ids)
+    if not student_ids:
+        return
+
+    first_day, last_day = month_bounds(year, month)
+
+    counts = (
+        Attendance.objects
+        .filter(student_id__in=student_ids, date__range=(first_day, last_day))
+        .values('student_id')
+        .annotate(
+            present=Count('id', filter=Q(status='P')),
+            absent=Count('id', filter=Q(status='A')),
+        )
+    )
+
+    summaries = [
+        AttendanceSummary(
+            student_id=row['student_id'],
+            year=year,
+            month=month,
+            present=row['present'],
+            absent=row['absent'],
+        )
+        for row in counts
+    ]
+
+    with transaction.atomic():
+        # Jinki is month ki saari attendance delete ho gayi
+        AttendanceSummary.objects.filter(
+            student_id__in=student_ids,
+            year=year,
+            month=month,
+        ).exclude(
+            student_id__in=[summary.student_id for summary in summaries]
+        ).delete()
+
+        _upsert(summaries)
+
+
+# ======================================================
+# 🔁 FULL REBUILD
+# ======================================================
+def rebuild_summaries():
+    """
+    Poori AttendanceSummary table Attendance se dobara banata hai
+    (ek grouped query, batch me insert). Returns rows written.
+    """
+
+    counts = (
+        Attendance.objects
+        .annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+        .values('student_id', 'year', 'month')
+        .annotate(
+            present=Count('id', filter=Q(status='P')),
+            absent=Count('id', filter=Q(status='A')),
+        )
+        .order_by()
+    )
+
+    summaries = [
+        AttendanceSummary(
+            student_id=row['student_id'],
+            year=row['year'],
+            month=row['month'],
+            present=row['present'],
+            absent=row['absent'],
+        )
+        for row in counts.iterator(chunk_size=REBUILD_BATCH_SIZE)
+    ]
+
+    with transaction.atomic():
+        AttendanceSummary.objects.all().delete()
+        AttendanceSummary.objects.bulk_create(
+            summaries,
+            batch_size=REBUILD_BATCH_SIZE
+        )
+
+    return len(summaries)
+
+
+# ======================================================
+# 📈 LOOKUPS
+# ======================================================
+def student_totals(student):
+    """
+    (present_days, total_days) – per-day rows ki jagah monthly summary
+    rows ka SUM (ek student ke saal me max 12 rows)
+    """
+
+    totals = AttendanceSummary.objects.filter(student=student).aggregate(
+        present=Sum('present'),
+        absent=Sum('absent'),
+    )
+    present = totals['present'] or 0
+    return present, present + (totals['absent'] or 0)
@@ -1,3 +1,419 @@
-from django.test import TestCase
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.benchmarks import BenchmarkTestCase, consume
+from accounts.models import StudentProfile, User
+from . import bitmap
+from .freshness import _section_key
+from .models import Attendance, AttendanceBitmap, AttendanceSummary
+from .summary import refresh_summaries, student_totals
+
+
+class AttendanceBenchmarkTests(BenchmarkTestCase):
+    """
+    Teacher marking + monthly report: query budgets section size se
+    independent (N+1 aate hi fail)
+    """
+
+    def test_mark_attendance_page(self):
+        self.login(self.teacher)
+        with self.assertWithinBudget('mark_attendance GET', queries=4, ms=1000):
+            response = self.client.get(reverse('mark_attendance'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_mark_attendance_submit(self):
+        student_ids = list(
+            StudentProfile.objects
+            .filter(student_class='1', section='A')
+            .values_list('user_id', flat=True)
+        )
+        day = timezone.localdate()
+
+        self.login(self.teacher)
+        with self.assertWithinBudget('mark_attendance POST', queries=14, ms=1000):
+            response = self.client.post(reverse('mark_attendance'), {
+                'date': day.isoformat(),
+                **{f"status_{student_id}": 'A' for student_id in student_ids},
+            })
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            Attendance.objects.filter(date=day, student_id__in=student_ids, status='A').count(),
+            len(student_ids)
+        )
+
+    def report_params(self):
+        latest = Attendance.objects.latest('date').date
+        return {'month': latest.month, 'year': latest.year}
+
+    def test_monthly_report(self):
+        params = self.report_params()
+
+        self.login(self.admin)
+        with self.assertWithinBudget('monthly_attendance_report', queries=3, ms=1000):
+            response = self.client.get(reverse('monthly_attendance_report'), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['report']), self.school.students)
+
+    def test_monthly_report_csv(self):
+        params = self.report_params()
+
+        self.login(self.admin)
+        with self.assertWithinBudget('monthly_attendance_report CSV', queries=3, ms=1000):
+            response = self.client.get(
+                reverse('monthly_attendance_report'), {**params, 'export': 'csv'}
+            )
+            body = consume(response)
+        self.assertEqual(body.count(b'\n'), self.school.students + 1)
+
+
+@override_settings(ATTENDANCE_BITMAP_STORE=True)
+class AttendanceBitmapTests(TestCase):
+    """
+    Bitmap store: signals se sync, range popcount, rebuild, NumPy fallback
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.students = [
+            User.objects.create_user(f's{i}', password='x', role='STUDENT')
+            for i in range(2)
+        ]
+
+    def mark(self, student, day, status):
+        Attendance.objects.update_or_create(
+            student=student, date=day, defaults={'status': status}
+        )
+
+    def test_popcount_matches_bit_count(self):
+        values = [0, 1, 0b1011, bitmap.FULL_MONTH, (1 << 32) - 1]
+        expected = [value.bit_count() for value in values]
+
+        self.assertEqual(list(bitmap.popcount(values)), expected)
+        # NumPy < 2.0 path (np.bitwise_count missing)
+        array = bitmap.np.asarray(values, dtype=bitmap.np.uint32)
+        self.assertEqual(bitmap._unpackbits_popcount(array).tolist(), expected)
+        with mock.patch.object(bitmap, 'np', None):
+            self.assertEqual(bitmap.popcount(values), expected)
+
+    def test_signals_keep_bitmap_in_sync(self):
+        student = self.students[0]
+        self.mark(student, date(2025, 1, 1), 'P')
+        self.mark(student, date(2025, 1, 2), 'A')
+        self.mark(student, date(2025, 1, 3), 'P')
+
+        self.assertEqual(bitmap.present_days(student.id, 2025, 1), [1, 3])
+
+        # P → A overwrite: present bit clear, marked bit bana rahe
+        self.mark(student, date(2025, 1, 3), 'A')
+        self.assertEqual(bitmap.present_days(student.id, 2025, 1), [1])
+
+        Attendance.objects.get(student=student, date=date(2025, 1, 2)).delete()
+        row = AttendanceBitmap.objects.get(student=student, year=2025, month=1)
+        self.assertEqual(row.present_bits, bitmap.day_bit(1))
+        self.assertEqual(row.marked_bits, bitmap.day_bit(1) | bitmap.day_bit(3))
+
+    def test_moved_row_clears_old_day(self):
+        first, second = self.students
+        record = Attendance.objects.create(student=first, date=date(2025, 1, 10), status='P')
+
+        record.date = date(2025, 2, 10)
+        record.save()
+        self.assertEqual(bitmap.present_days(first.id, 2025, 1), [])
+        self.assertEqual(
+            AttendanceBitmap.objects.get(student=first, year=2025, month=1).marked_bits, 0
+        )
+        self.assertEqual(bitmap.present_days(first.id, 2025, 2), [10])
+
+        record.student = second
+        record.save()
+        self.assertEqual(bitmap.present_days(first.id, 2025, 2), [])
+        self.assertEqual(bitmap.present_days(second.id, 2025, 2), [10])
+        self.assertEqual(
+            bitmap.range_summary([first.id], date(2025, 1, 1), date(2025, 2, 28)),
+            {first.id: (0, 0)}
+        )
+
+    def test_range_summary_across_partial_months(self):
+        first, second = self.students
+        for day in (date(2025, 1, 30), date(2025, 1, 31), date(2025, 2, 1), date(2025, 2, 10)):
+            self.mark(first, day, 'P')
+        self.mark(second, date(2025, 2, 1), 'A')
+
+        start, end = date(2025, 1, 31), date(2025, 2, 5)
+        expected = {first.id: (2, 2), second.id: (0, 1)}
+
+        self.assertEqual(bitmap.range_summary([first.id, second.id], start, end), expected)
+        with mock.patch.object(bitmap, 'np', None):
+            self.assertEqual(bitmap.range_summary([first.id, second.id], start, end), expected)
+
+        self.assertEqual(bitmap.attendance_percentage(second.id, start, end), 0)
+
+    def test_build_from_attendance_matches_signals(self):
+        student = self.students[0]
+        self.mark(student, date(2025, 3, 4), 'P')
+        self.mark(student, date(2025, 3, 5), 'A')
+        self.mark(student, date(2025, 4, 1), 'P')
+
+        before = set(AttendanceBitmap.objects.values_list(
+            'student_id', 'year', 'month', 'present_bits', 'marked_bits'
+        ))
+        AttendanceBitmap.objects.all().delete()
+
+        self.assertEqual(bitmap.build_from_attendance(), 2)
+        after = set(AttendanceBitmap.objects.values_list(
+            'student_id', 'year', 'month', 'present_bits', 'marked_bits'
+        ))
+        self.assertEqual(before, after)
+
+
+class AttendanceAPITests(TestCase):
+    """
+    /api/v1/attendance/: status strings, 304 bina attendance query,
+    stamp commit / roster change par hi badle
+    """
+
+    DAY = date(2025, 7, 1)
+    SECTION_URL = '/api/v1/attendance/section/?date=2025-07-01'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user('teacher', password='x', role='TEACHER')
+        profile = cls.teacher.teacher_profile
+        profile.assigned_class = '8'
+        profile.assigned_section = 'A'
+        profile.save()
+
+        cls.students = []
+        for i in range(3):
+            student = User.objects.create_user(f's{i}', password='x', role='STUDENT')
+            student.student_profile.student_class = '8'
+            student.student_profile.section = 'A'
+            student.student_profile.roll_no = i + 1
+            student.student_profile.save()
+            cls.students.append(student)
+
+        Attendance.objects.create(student=cls.students[0], date=cls.DAY, status='P')
+        Attendance.objects.create(student=cls.students[2], date=cls.DAY, status='A')
+        Attendance.objects.create(student=cls.students[0], date=date(2025, 7, 3), status='A')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(pk=self.teacher.pk))
+
+    def test_section_status_string(self):
+        response = self.client.get(self.SECTION_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['statuses'], 'P-A')
+        self.assertEqual(
+            [row['id'] for row in response.json()['students']],
+            [student.id for student in self.students]
+        )
+
+    def test_student_month_string_and_year_range(self):
+        self.client.force_authenticate(self.students[0])
+
+        response = self.client.get('/api/v1/attendance/me/', {'year': 2025})
+        self.assertEqual(response.json()['months'], {
+            '2025-07': {'days': 'P-A' + '-' * 28, 'present': 1, 'absent': 1},
+        })
+
+        for year in ('0', '10000', 'abc'):
+            response = self.client.get('/api/v1/attendance/me/', {'year': year})
+            self.assertEqual(response.status_code, 400, year)
+
+    def test_unchanged_poll_is_304_without_attendance_queries(self):
+        etag = self.client.get(self.SECTION_URL)['ETag']
+
+        # Stamp cache se; teacher_profile pehle request me load ho chuka
+        # (force_authenticate same user object) – koi query nahi
+        with self.assertNumQueries(0):
+            response = self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_stamp_bumped_only_after_commit(self):
+        etag = self.client.get(self.SECTION_URL)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Attendance.objects.create(student=self.students[1], date=self.DAY, status='P')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(
+            self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Attendance.objects.create(student=self.students[1], date=self.DAY, status='P')
+        self.assertEqual(
+            self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+        for callback in callbacks:
+            callback()
+        response = self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['statuses'], 'PPA')
+
+    def test_roster_change_invalidates_section(self):
+        etag = self.client.get(self.SECTION_URL)['ETag']
+
+        profile = self.students[1].student_profile
+        profile.section = 'B'
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+
+        response = self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['statuses'], 'PA')
+
+        # Roster fields na badle → stamp same
+        etag = response['ETag']
+        profile = self.students[0].student_profile
+        profile.contact_number = '9999999999'
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        self.assertEqual(
+            self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+    def test_default_date_and_year_are_part_of_etag(self):
+        today = timezone.localdate()
+        tomorrow = today + timedelta(days=1)
+        Attendance.objects.create(student=self.students[1], date=today, status='P')
+
+        first = self.client.get('/api/v1/attendance/section/')
+        self.assertEqual(first.json()['statuses'], '-P-')
+
+        # Aadhi raat ke baad same URL: naya din → na ETag, na
+        # Last-Modified par purana 304
+        with mock.patch('django.utils.timezone.localdate', return_value=tomorrow):
+            response = self.client.get(
+                '/api/v1/attendance/section/', HTTP_IF_NONE_MATCH=first['ETag']
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['date'], tomorrow.isoformat())
+            self.assertEqual(response.json()['statuses'], '---')
+
+            response = self.client.get(
+                '/api/v1/attendance/section/',
+                HTTP_IF_MODIFIED_SINCE=first['Last-Modified'],
+            )
+            self.assertEqual(response.status_code, 200)
+
+        # Explicit ?date= wala URL din badalne se nahi badalta
+        etag = self.client.get(self.SECTION_URL)['ETag']
+        with mock.patch('django.utils.timezone.localdate', return_value=tomorrow):
+            self.assertEqual(
+                self.client.get(self.SECTION_URL, HTTP_IF_NONE_MATCH=etag).status_code, 304
+            )
+
+        self.client.force_authenticate(self.students[0])
+        first = self.client.get('/api/v1/attendance/me/')
+        self.assertEqual(first.json()['year'], today.year)
+
+        next_year = date(today.year + 1, 1, 1)
+        with mock.patch('django.utils.timezone.localdate', return_value=next_year):
+            response = self.client.get('/api/v1/attendance/me/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['year'], today.year + 1)
+
+    @override_settings(
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'attendance': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'attendance-stamp-tests',
+            },
+        },
+        ATTENDANCE_CACHE_ALIAS='attendance',
+    )
+    def test_stamps_use_configured_cache_alias(self):
+        caches['attendance'].clear()
+
+        self.client.get(self.SECTION_URL)
+        key = _section_key('8', 'A')
+        self.assertIsNotNone(caches['attendance'].get(key))
+        self.assertIsNone(caches['default'].get(key))
+
+
+class AttendanceSummaryTests(TestCase):
+    """
+    AttendanceSummary: refresh_summaries + signals (save / delete / admin
+    date ya student move)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.students = [
+            User.objects.create_user(f's{i}', password='x', role='STUDENT')
+            for i in range(2)
+        ]
+
+    def summary(self, student, year, month):
+        return (
+            AttendanceSummary.objects
+            .filter(student=student, year=year, month=month)
+            .values_list('present', 'absent')
+            .first()
+        )
+
+    def test_refresh_summaries_recounts_month(self):
+        student = self.students[0]
+        # bulk_create signals nahi bhejta – summary abhi khali
+        Attendance.objects.bulk_create([
+            Attendance(student=student, date=date(2025, 1, day), status=status)
+            for day, status in ((1, 'P'), (2, 'P'), (3, 'A'))
+        ] + [Attendance(student=student, date=date(2025, 2, 1), status='P')])
+        self.assertIsNone(self.summary(student, 2025, 1))
+
+        refresh_summaries([student.id, self.students[1].id], 2025, 1)
+        self.assertEqual(self.summary(student, 2025, 1), (2, 1))
+        self.assertIsNone(self.summary(self.students[1], 2025, 1))
+        self.assertIsNone(self.summary(student, 2025, 2))
+
+        # Month ki saari attendance gayi → summary row bhi
+        Attendance.objects.filter(date__month=1).delete()
+        refresh_summaries([student.id], 2025, 1)
+        self.assertIsNone(self.summary(student, 2025, 1))
+
+    def test_save_and_delete_signals(self):
+        student = self.students[0]
+        first = Attendance.objects.create(student=student, date=date(2025, 1, 10), status='P')
+        Attendance.objects.create(student=student, date=date(2025, 1, 11), status='A')
+        self.assertEqual(self.summary(student, 2025, 1), (1, 1))
+
+        first.status = 'A'
+        first.save()
+        self.assertEqual(self.summary(student, 2025, 1), (0, 2))
+
+        first.delete()
+        self.assertEqual(self.summary(student, 2025, 1), (0, 1))
+        self.assertEqual(student_totals(student), (0, 1))
+
+    def test_date_and_student_move_refresh_old_month(self):
+        first, second = self.students
+        record = Attendance.objects.create(student=first, date=date(2025, 1, 10), status='P')
+
+        # AttendanceAdmin: date January → February
+        record.date = date(2025, 2, 10)
+        record.save()
+        self.assertIsNone(self.summary(first, 2025, 1))
+        self.assertEqual(self.summary(first, 2025, 2), (1, 0))
+
+        # ... phir dusre student ko
+        record.student = second
+        record.save()
+        self.assertIsNone(self.summary(first, 2025, 2))
+        self.assertEqual(self.summary(second, 2025, 2), (1, 0))
+        self.assertEqual(student_totals(first), (0, 0))
@@ -1,13 +1,18 @@
+import csv
 from datetime import date
 
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
-from django.http import HttpResponseForbidden
+from django.http import HttpResponse, HttpResponseForbidden
 from django.contrib import messages
 
-from accounts.models import User, StudentProfile
-from .models import Attendance
+from accounts.models import StudentProfile
+from .models import Attendance, AttendanceSummary
+from .reports import month_bounds
+from .reports import monthly_attendance_report as build_monthly_report
+from .services import bulk_mark_attendance
+from .summary import student_totals
 
 
 # ======================================================
@@ -58,25 +63,21 @@ def mark_attendance(request):
                 messages.error(request, "Invalid date format ❌")
                 return redirect('mark_attendance')
 
-        saved_count = 0
+        statuses = {}
 
         for sp in student_profiles:
             status = request.POST.get(f"status_{sp.user.id}")
 
             if status in ('P', 'A'):
-                Attendance.objects.update_or_create(
-                    student=sp.user,
-                    date=selected_date,
-                    defaults={
-                        'status': status,
-                        'marked_by': request.user
-                    }
-                )
-                saved_count += 1
+                statuses[sp.user] = status
+
+        # ⚡ Poora section ek hi upsert me
+        result = bulk_mark_attendance(request.user, statuses, selected_date)
 
         messages.success(
             request,
-            f"Attendance saved successfully ✅ ({saved_count} students)"
+            f"Attendance saved successfully ✅ ({result.saved_count} students: "
+            f"{len(result.inserted)} new, {len(result.updated)} updated)"
         )
         return redirect('mark_attendance')
 
@@ -97,25 +98,40 @@ def student_attendance(request):
     Student Attendance View
     -----------------------
     - STUDENT sirf apni attendance dekhe
-    - Percentage calculated
+    - Percentage AttendanceSummary se (per-day rows count nahi)
+    - Month-wise breakdown + sirf selected month ke records
     """
 
     if request.user.role != 'STUDENT':
         return HttpResponseForbidden("Access Denied")
 
-    records = Attendance.objects.filter(
-        student=request.user
-    ).order_by('-date')
+    today = timezone.localdate()
+    try:
+        month = int(request.GET.get('month', today.month))
+        year = int(request.GET.get('year', today.year))
+        first_day, last_day = month_bounds(year, month)
+    except ValueError:
+        month, year = today.month, today.year
+        first_day, last_day = month_bounds(year, month)
 
-    total_days = records.count()
-    present_days = records.filter(status='P').count()
+    present_days, total_days = student_totals(request.user)
 
     percentage = round(
         (present_days / total_days) * 100, 2
     ) if total_days > 0 else 0
 
+    monthly = AttendanceSummary.objects.filter(student=request.user)
+
+    records = Attendance.objects.filter(
+        student=request.user,
+        date__range=(first_day, last_day)
+    ).order_by('-date')
+
     return render(request, 'attendance/student_attendance.html', {
         'records': records,
+        'monthly': monthly,
+        'month': month,
+        'year': year,
         'total_days': total_days,
         'present_days': present_days,
         'percentage': percentage,
@@ -132,6 +148,8 @@ def monthly_attendance_report(request):
     -------------------------
     - ADMIN & TEACHER allowed
     - Month / Year based report
+    - Optional class / section filter
+    - ?export=csv se same report CSV me
     """
 
     if request.user.role not in ('ADMIN', 'TEACHER'):
@@ -140,31 +158,54 @@ def monthly_attendance_report(request):
     today = timezone.localdate()
     month = int(request.GET.get('month', today.month))
     year = int(request.GET.get('year', today.year))
-
-    students = (
-        User.objects
-        .filter(role='STUDENT')
-        .select_related('student_profile')
-        .order_by('username')
+    selected_class = request.GET.get('class', '').strip()
+    selected_section = request.GET.get('section', '').strip()
+
+    # ⚡ Ek hi grouped query – per student loop nahi
+    report = build_monthly_report(
+        year,
+        month,
+        student_class=selected_class or None,
+        section=selected_section or None,
     )
 
-    report = []
-
-    for student in students:
-        qs = Attendance.objects.filter(
-            student=student,
-            date__month=month,
-            date__year=year
+    # 📥 CSV export (same rows as the HTML table)
+    if request.GET.get('export') == 'csv':
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = (
+            f'attachment; filename="attendance_{year}_{month:02d}.csv"'
         )
 
-        report.append({
-            'student': student,
-            'present': qs.filter(status='P').count(),
-            'absent': qs.filter(status='A').count(),
-        })
+        writer = csv.writer(response)
+        writer.writerow([
+            "Student Username",
+            "Class",
+            "Section",
+            "Roll No",
+            "Present",
+            "Absent",
+            "Total",
+            "Percentage",
+        ])
+        for row in report:
+            writer.writerow([
+                row.username,
+                row.student_class or "",
+                row.section or "",
+                row.roll_no or "",
+                row.present,
+                row.absent,
+                row.total,
+                row.percentage,
+            ])
+        return response
 
     return render(request, 'attendance/monthly_report.html', {
         'report': report,
         'month': month,
         'year': year,
+        'selected_class': selected_class,
+        'selected_section': selected_section,
+        'classes': [c for c, _ in StudentProfile.CLASS_CHOICES],
+        'sections': [s for s, _ in StudentProfile.SECTION_CHOICES],
     })
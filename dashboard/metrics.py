@@ -0,0 +1,97 @@
+from django.conf import settings
+
+from accounts.models import User, StudentProfile
+from accounts.utils import configured_cache
+
+# Fees app OPTIONAL hai – safe import
+try:
+    from fees.models import FeePayment, StudentFee
+except ImportError:
+    FeePayment = StudentFee = None
+
+
+# Safety net: signal miss ho jaye (bulk_create / queryset.update /
+# dusra process with local-memory cache) to bhi itni der me refresh
+METRICS_TIMEOUT = getattr(settings, 'DASHBOARD_METRICS_TIMEOUT', 300)
+
+KEY_PREFIX = 'dashboard:metrics:'
+
+METRIC_NAMES = (
+    'total_students',
+    'total_teachers',
+    'total_fees',
+    'pending_fees',
+)
+
+
+def get_cache():
+    return configured_cache('DASHBOARD_CACHE_ALIAS')
+
+
+def _key(name):
+    return f"{KEY_PREFIX}{name}"
+
+
+# ==================================================
+# 🔢 DB COUNTS (sirf cache miss par)
+# ==================================================
+def _compute(name):
+    if name == 'total_students':
+        return StudentProfile.objects.count()
+
+    if name == 'total_teachers':
+        return User.objects.filter(role='TEACHER').count()
+
+    if StudentFee is None:
+        return 0
+
+    if name == 'total_fees':
+        return StudentFee.objects.count()
+
+    if name == 'pending_fees':
+        return StudentFee.objects.filter(status='PENDING').count()
+
+    raise KeyError(name)
+
+
+def get_admin_metrics():
+    """
+    Admin dashboard counters – ek get_many() call, DB sirf missing
+    counters ke liye
+    """
+    cache = get_cache()
+    keys = {_key(name): name for name in METRIC_NAMES}
+
+    cached = cache.get_many(keys)
+    metrics = {keys[key]: value for key, value in cached.items()}
+
+    missing = {}
+    for name in METRIC_NAMES:
+        if name not in metrics:
+            metrics[name] = missing[_key(name)] = _compute(name)
+
+    if missing:
+        cache.set_many(missing, METRICS_TIMEOUT)
+
+    return metrics
+
+
+# ==================================================
+# ♻️ INCREMENTAL UPDATE / INVALIDATION
+# ==================================================
+def adjust_metric(name, delta):
+    """
+    Cached counter ko +/- karta hai. Agar key cache me nahi hai to
+    kuch nahi karta – next read DB se fresh value le lega.
+    """
+    try:
+        get_cache().incr(_key(name), delta)
+    except ValueError:
+        pass
+
+
+def invalidate_metrics(*names):
+    """
+    Given counters (ya sab, agar koi naam na diya ho) cache se hatao
+    """
+    get_cache().delete_many([_key(name) for name in (names or METRIC_NAMES)])
@@ -0,0 +1,323 @@
+import contextvars
+import functools
+import hashlib
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.template.base import Template
+
+
+# ==================================================
+# ⚙️ SETTINGS
+# ==================================================
+def is_enabled():
+    return getattr(settings, 'PERFORMANCE_PROFILING', False)
+
+
+def window_size():
+    """
+    Har view ke kitne latest requests yaad rakhne hain
+    """
+    return getattr(settings, 'PERFORMANCE_PROFILING_WINDOW', 500)
+
+
+# Latency histogram buckets (ms, upper bounds)
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Ek request me itni baar same SQL → duplicate fingerprint report
+DUPLICATE_THRESHOLD = 2
+
+# URL resolve nahi hua (404 / scanners) – sab ek hi bucket me, warna
+# har naya path ek naya stats entry (memory unbounded)
+UNRESOLVED = '<unresolved>'
+
+
+class RequestSample(NamedTuple):
+    total_ms: float
+    queries: int
+    sql_ms: float
+    template_ms: float
+    size: int
+    duplicates: tuple  # ((fingerprint, sql, count), ...)
+
+
+# ==================================================
+# 🧮 PER-REQUEST COLLECTOR
+# ==================================================
+_current = contextvars.ContextVar('performance_profile', default=None)
+
+
+class RequestProfile:
+    """
+    Ek request ke dauraan queries (execute_wrapper se) aur template
+    render time jama karta hai
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.template_seconds = 0.0
+        self.template_depth = 0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - start
+            self.queries += 1
+            self.statements[sql] += 1
+
+    def duplicates(self):
+        """
+        Same SQL (params alag ho sakte hain) baar-baar → N+1 ka nishaan
+        """
+        return tuple(
+            (fingerprint(sql), sql[:200], count)
+            for sql, count in self.statements.most_common()
+            if count >= DUPLICATE_THRESHOLD
+        )
+
+    def sample(self, response):
+        return RequestSample(
+            total_ms=(time.perf_counter() - self.started) * 1000,
+            queries=self.queries,
+            sql_ms=self.sql_seconds * 1000,
+            template_ms=self.template_seconds * 1000,
+            size=response_size(response),
+            duplicates=self.duplicates(),
+        )
+
+
+def fingerprint(sql):
+    return hashlib.md5(sql.encode()).hexdigest()[:8]
+
+
+def response_size(response):
+    """
+    Streaming (CSV / FileResponse) ka size pehle se pata nahi → 0
+    """
+    if getattr(response, 'streaming', False):
+        return 0
+    return len(response.content)
+
+
+# ==================================================
+# 🖼️ TEMPLATE RENDER TIMING (top-level Template.render)
+# ==================================================
+_template_render = Template.render
+_template_patched = False
+
+
+def _timed_render(self, context):
+    profile = _current.get()
+    if profile is None:
+        return _template_render(self, context)
+
+    # {% include %} / {% extends %} bhi Template.render – sirf bahar wala count
+    profile.template_depth += 1
+    start = time.perf_counter()
+    try:
+        return _template_render(self, context)
+    finally:
+        profile.template_depth -= 1
+        if profile.template_depth == 0:
+            profile.template_seconds += time.perf_counter() - start
+
+
+def install_template_timer():
+    global _template_patched
+    if not _template_patched:
+        Template.render = _timed_render
+        _template_patched = True
+
+
+# ==================================================
+# 📊 ROLLING IN-MEMORY STATS
+# ==================================================
+class ViewStats:
+    """
+    Har view name ke latest N samples (deque) + total request count
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=window_size()))
+        self._requests = Counter()
+
+    def record(self, view_name, sample):
+        with self._lock:
+            self._samples[view_name].append(sample)
+            self._requests[view_name] += 1
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._requests.clear()
+
+    def snapshot(self):
+        """
+        View-wise summary rows (slowest p95 pehle)
+        """
+        with self._lock:
+            items = [(name, list(samples)) for name, samples in self._samples.items()]
+            requests = dict(self._requests)
+
+        rows = [summarize(name, samples, requests[name]) for name, samples in items if samples]
+        rows.sort(key=lambda row: row['p95_ms'], reverse=True)
+        return rows
+
+
+def percentile(sorted_values, percent):
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def histogram(values):
+    """
+    [(label, count), ...] – BUCKETS_MS ke hisaab se
+    """
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for value in values:
+        for index, bound in enumerate(BUCKETS_MS):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+
+    labels = [f"≤{bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+    return list(zip(labels, counts))
+
+
+def summarize(view_name, samples, requests):
+    latencies = sorted(sample.total_ms for sample in samples)
+    count = len(samples)
+
+    duplicates = Counter()
+    statements = {}
+    for sample in samples:
+        for key, sql, repeats in sample.duplicates:
+            duplicates[key] += repeats
+            statements[key] = sql
+
+    return {
+        'view': view_name,
+        'requests': requests,
+        'window': count,
+        'p50_ms': round(percentile(latencies, 50), 1),
+        'p95_ms': round(percentile(latencies, 95), 1),
+        'max_ms': round(latencies[-1], 1),
+        'avg_queries': round(sum(s.queries for s in samples) / count, 1),
+        'max_queries': max(s.queries for s in samples),
+        'avg_sql_ms': round(sum(s.sql_ms for s in samples) / count, 1),
+        'avg_template_ms': round(sum(s.template_ms for s in samples) / count, 1),
+        'avg_size': int(sum(s.size for s in samples) / count),
+        'histogram': histogram(latencies),
+        'duplicates': [
+            (key, statements[key], repeats)
+            for key, repeats in duplicates.most_common(5)
+        ],
+    }
+
+
+stats = ViewStats()
+
+
+# ==================================================
+# 🏷️ SERVER-TIMING HEADER
+# ==================================================
+def server_timing(sample):
+    parts = [
+        f'db;dur={sample.sql_ms:.1f};desc="{sample.queries} queries"',
+        f'tpl;dur={sample.template_ms:.1f};desc="templates"',
+        f'total;dur={sample.total_ms:.1f}',
+    ]
+    if sample.duplicates:
+        repeated = sum(count for _, _, count in sample.duplicates)
+        parts.append(f'dup;desc="{repeated} duplicate queries"')
+    return ', '.join(parts)
+
+
+def view_name(request, fallback):
+    """
+    URL name ('fees:fees_report') – resolve na hua ho to fallback
+    """
+    match = getattr(request, 'resolver_match', None)
+    return (match.view_name if match else None) or fallback
+
+
+def profiled(request, get_response, fallback):
+    """
+    get_response() ko profile karo → stats record + Server-Timing header
+    """
+    profile = RequestProfile()
+    token = _current.set(profile)
+    try:
+        with connection.execute_wrapper(profile):
+            response = get_response()
+    finally:
+        _current.reset(token)
+
+    sample = profile.sample(response)
+    # resolver_match view chalne ke baad hi set hota hai
+    stats.record(view_name(request, fallback), sample)
+    response['Server-Timing'] = server_timing(sample)
+    return response
+
+
+# ==================================================
+# 🧩 MIDDLEWARE (saare views)
+# ==================================================
+class ProfilingMiddleware:
+    """
+    settings.PERFORMANCE_PROFILING = True hone par har request ka
+    query count, SQL time, duplicate queries, template time, size
+    → Server-Timing header + rolling stats (dashboard:performance_stats)
+
+    False → MiddlewareNotUsed (zero overhead)
+    """
+
+    def __init__(self, get_response):
+        if not is_enabled():
+            raise MiddlewareNotUsed
+        install_template_timer()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return profiled(
+            request,
+            lambda: self.get_response(request),
+            fallback=UNRESOLVED,
+        )
+
+
+# ==================================================
+# 🎯 PER-VIEW DECORATOR
+# ==================================================
+def profile_view(view_func):
+    """
+    Middleware ke bina sirf chune hue views profile karne ke liye.
+    Middleware already profile kar raha ho to kuch extra nahi karta.
+    """
+
+    @functools.wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if not is_enabled() or _current.get() is not None:
+            return view_func(request, *args, **kwargs)
+
+        install_template_timer()
+        return profiled(
+            request,
+            lambda: view_func(request, *args, **kwargs),
+            fallback=f"{view_func.__module__}.{view_func.__name__}",
+        )
+
+    return wrapper
@@ -0,0 +1,98 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from accounts.models import User, StudentProfile
+from accounts.signals import students_bulk_created
+from .metrics import FeePayment, StudentFee, adjust_metric, invalidate_metrics
+
+# Fees app OPTIONAL hai – safe import
+try:
+    from fees.signals import fees_bulk_created
+except ImportError:
+    fees_bulk_created = None
+
+
+def after_commit(func, *args):
+    """
+    Counter update writer ke transaction commit ke baad hi –
+    rollback hua to cache galat nahi hota
+    """
+    transaction.on_commit(lambda: func(*args))
+
+
+# ==================================================
+# 🎓 STUDENTS
+# ==================================================
+@receiver(post_save, sender=StudentProfile)
+def student_profile_saved(sender, instance, created, **kwargs):
+    if created:
+        after_commit(adjust_metric, 'total_students', 1)
+
+
+@receiver(post_delete, sender=StudentProfile)
+def student_profile_deleted(sender, instance, **kwargs):
+    after_commit(adjust_metric, 'total_students', -1)
+
+
+@receiver(students_bulk_created)
+def students_imported(sender, count, **kwargs):
+    after_commit(adjust_metric, 'total_students', count)
+
+
+# ==================================================
+# 👨‍🏫 TEACHERS
+# ==================================================
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        if instance.role == 'TEACHER':
+            after_commit(adjust_metric, 'total_teachers', 1)
+        return
+
+    # Login par sirf last_login save hota hai – role same rehta hai
+    if update_fields is not None and 'role' not in update_fields:
+        return
+
+    # Role change ho sakta hai (edit_user) – purana role pata nahi
+    after_commit(invalidate_metrics, 'total_teachers')
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    if instance.role == 'TEACHER':
+        after_commit(adjust_metric, 'total_teachers', -1)
+
+
+# ==================================================
+# 💰 STUDENT FEES (fees app optional)
+# ==================================================
+if StudentFee is not None:
+
+    @receiver(post_save, sender=StudentFee)
+    def student_fee_saved(sender, instance, created, **kwargs):
+        if created:
+            after_commit(adjust_metric, 'total_fees', 1)
+            if instance.status == 'PENDING':
+                after_commit(adjust_metric, 'pending_fees', 1)
+        else:
+            # Status PENDING ↔ PAID badla ho sakta hai
+            after_commit(invalidate_metrics, 'pending_fees')
+
+    @receiver(post_delete, sender=StudentFee)
+    def student_fee_deleted(sender, instance, **kwargs):
+        after_commit(adjust_metric, 'total_fees', -1)
+        if instance.status == 'PENDING':
+            after_commit(adjust_metric, 'pending_fees', -1)
+
+    @receiver(fees_bulk_created)
+    def student_fees_invoiced(sender, count, **kwargs):
+        # ignore_conflicts ke baad exact count pakka nahi – recount
+        after_commit(invalidate_metrics, 'total_fees', 'pending_fees')
+
+    @receiver(post_save, sender=FeePayment)
+    def fee_payment_recorded(sender, instance, created, **kwargs):
+        # Payment service status conditional UPDATE se badalta hai
+        # (StudentFee post_save nahi) – ledger row = ek fee PAID
+        if created:
+            after_commit(adjust_metric, 'pending_fees', -1)
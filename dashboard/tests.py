@@ -1,3 +1,118 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from accounts.models import User
+from . import profiling
+from .metrics import get_admin_metrics
+
+
+class MetricsSignalTests(TestCase):
+    """
+    Cached counters sirf commit ke baad badalte hain
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.before = get_admin_metrics()['total_students']
+
+    def test_committed_write_adjusts_counter(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user('student', password='x', role='STUDENT')
+
+        self.assertEqual(get_admin_metrics()['total_students'], self.before + 1)
+
+    def test_rolled_back_write_leaves_counter(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    User.objects.create_user('student', password='x', role='STUDENT')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(get_admin_metrics()['total_students'], self.before)
+
+
+@profiling.profile_view
+def sample_view(request):
+    User.objects.count()
+    User.objects.count()
+    return HttpResponse('ok')
+
+
+class ProfilingTests(TestCase):
+    """
+    ProfilingMiddleware / profile_view: Server-Timing, rolling stats,
+    unresolved bucket; performance_stats sirf staff / ADMIN
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', password='x', role='ADMIN')
+        cls.teacher = User.objects.create_user('teacher', password='x', role='TEACHER')
+        cls.staff = User.objects.create_user('staff', password='x', role='STUDENT', is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+        profiling.stats.reset()
+
+    def views(self):
+        return {row['view']: row for row in profiling.stats.snapshot()}
+
+    def test_disabled_by_default(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('dashboard:admin_dashboard'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(self.views(), {})
+
+    @override_settings(PERFORMANCE_PROFILING=True)
+    def test_middleware_records_view_and_header(self):
+        # Middleware handler load par enable hota hai – naya client
+        client = Client()
+        client.force_login(self.admin)
+        response = client.get(reverse('dashboard:admin_dashboard'))
+
+        self.assertIn('db;dur=', response['Server-Timing'])
+        row = self.views()['dashboard:admin_dashboard']
+        self.assertEqual(row['requests'], 1)
+        self.assertGreater(row['avg_queries'], 0)
+        self.assertGreater(row['avg_size'], 0)
+
+    @override_settings(PERFORMANCE_PROFILING=True)
+    def test_unresolved_paths_share_one_bucket(self):
+        client = Client()
+        for i in range(3):
+            client.get(f'/no-such-page-{i}/')
+
+        views = self.views()
+        self.assertEqual(list(views), [profiling.UNRESOLVED])
+        self.assertEqual(views[profiling.UNRESOLVED]['requests'], 3)
+
+    @override_settings(PERFORMANCE_PROFILING=True)
+    def test_profile_view_decorator(self):
+        response = sample_view(RequestFactory().get('/sample/'))
+
+        self.assertIn('desc="2 queries"', response['Server-Timing'])
+        self.assertIn('dup;', response['Server-Timing'])
+        row = self.views()[f'{__name__}.sample_view']
+        self.assertEqual(row['max_queries'], 2)
+        self.assertEqual(len(row['duplicates']), 1)
+
+    def test_performance_stats_access(self):
+        url = reverse('dashboard:performance_stats')
+
+        self.client.force_login(self.teacher)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.post(url).status_code, 403)
+
+        for user in (self.admin, self.staff):
+            self.client.force_login(user)
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        profiling.stats.record('x', profiling.RequestSample(1.0, 1, 0.5, 0.1, 10, ()))
+        self.assertRedirects(self.client.post(url), url)
+        self.assertEqual(self.views(), {})
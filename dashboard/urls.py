@@ -18,6 +18,11 @@ urlpatterns = [
         views.monthly_report,
         name='monthly_report'
     ),
+    path(
+        'performance/',
+        views.performance_stats,
+        name='performance_stats'
+    ),
 
     # ================= TEACHER =================
     path(
@@ -1,14 +1,10 @@
+from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden
-from django.shortcuts import render
+from django.shortcuts import redirect, render
 
-from accounts.models import User, StudentProfile
-
-# Fees app OPTIONAL hai – safe import
-try:
-    from fees.models import StudentFee
-except ImportError:
-    StudentFee = None
+from . import profiling
+from .metrics import get_admin_metrics
 
 
 # ==================================================
@@ -19,22 +15,8 @@ def admin_dashboard(request):
     if getattr(request.user, 'role', None) != 'ADMIN':
         return HttpResponseForbidden("You are not allowed to access this page.")
 
-    total_students = StudentProfile.objects.count()
-    total_teachers = User.objects.filter(role='TEACHER').count()
-
-    if StudentFee:
-        total_fees = StudentFee.objects.count()
-        pending_fees = StudentFee.objects.filter(status='PENDING').count()
-    else:
-        total_fees = 0
-        pending_fees = 0
-
-    context = {
-        'total_students': total_students,
-        'total_teachers': total_teachers,
-        'total_fees': total_fees,
-        'pending_fees': pending_fees,
-    }
+    # ⚡ Cached counters (signals se update hote hain)
+    context = get_admin_metrics()
 
     return render(request, 'dashboard/admin_dashboard.html', context)
 
@@ -50,6 +32,26 @@ def monthly_report(request):
     return render(request, 'dashboard/monthly_report.html')
 
 
+# ==================================================
+# ⏱️ STAFF: PERFORMANCE STATS (ProfilingMiddleware)
+# ==================================================
+@login_required
+def performance_stats(request):
+    if not (request.user.is_staff or getattr(request.user, 'role', None) == 'ADMIN'):
+        return HttpResponseForbidden("You are not allowed to access this page.")
+
+    if request.method == 'POST':
+        profiling.stats.reset()
+        messages.success(request, "Performance stats reset ho gaye.")
+        return redirect('dashboard:performance_stats')
+
+    return render(request, 'dashboard/performance_stats.html', {
+        'enabled': profiling.is_enabled(),
+        'window': profiling.window_size(),
+        'rows': profiling.stats.snapshot(),
+    })
+
+
 # ==================================================
 # 👨‍🏫 TEACHER DASHBOARD
 # ==================================================
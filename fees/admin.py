@@ -1,5 +1,7 @@
-from django.contrib import admin
-from .models import FeeStructure, StudentFee
+from django.contrib import admin, messages
+
+from .invoicing import generate_monthly_fees
+from .models import FeePayment, FeeStructure, StudentFee
 
 
 # ==================================================
@@ -35,6 +37,18 @@ class FeeStructureAdmin(admin.ModelAdmin):
 
     list_per_page = 25
 
+    actions = ['generate_student_fees']
+
+    @admin.action(description="Generate student fees for selected structures")
+    def generate_student_fees(self, request, queryset):
+        result = generate_monthly_fees(queryset)
+        self.message_user(
+            request,
+            f"Created {result.created} student fees "
+            f"({result.existing} already existed)",
+            messages.SUCCESS
+        )
+
 
 # ==================================================
 # 💰 STUDENT FEE ADMIN
@@ -84,3 +98,47 @@ class StudentFeeAdmin(admin.ModelAdmin):
     def get_amount(self, obj):
         return obj.fee_structure.amount
     get_amount.short_description = "Amount"
+
+
+# ==================================================
+# 📒 FEE PAYMENT LEDGER ADMIN
+# ==================================================
+@admin.register(FeePayment)
+class FeePaymentAdmin(admin.ModelAdmin):
+    """
+    Payment ledger (read-only – fees.payments service likhta hai)
+    """
+
+    list_display = (
+        'transaction_id',
+        'student',
+        'fee',
+        'amount',
+        'created_at',
+    )
+
+    search_fields = (
+        'transaction_id',
+        'student__username',
+    )
+
+    list_select_related = ('student', 'fee__student', 'fee__fee_structure')
+
+    ordering = ('-created_at',)
+
+    readonly_fields = (
+        'fee',
+        'student',
+        'amount',
+        'transaction_id',
+        'idempotency_key',
+        'created_at',
+    )
+
+    list_per_page = 25
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,129 @@
+import csv
+import tempfile
+
+import openpyxl
+
+from accounts.search import prefix_range, student_search_q
+from .models import StudentFee
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_HEADERS = [
+    "Student Username",
+    "Father Name",
+    "Contact Number",
+    "Class",
+    "Month",
+    "Amount",
+    "Status",
+]
+
+
+# =================================================
+# 🔍 REPORT FILTERS (fees_report + exports dono)
+# =================================================
+def filter_fees(fees, month='', class_name='', status='', q=''):
+    """
+    - month / class_name → FeeStructure
+    - status → PAID / PENDING
+    - q → student name / admission no. / roll no. ya username prefix
+    """
+
+    if month:
+        fees = fees.filter(fee_structure__month=month)
+
+    if class_name:
+        fees = fees.filter(fee_structure__class_name=class_name)
+
+    if status in ('PAID', 'PENDING'):
+        fees = fees.filter(status=status)
+
+    q = (q or '').strip()
+    if q:
+        fees = fees.filter(
+            student_search_q(q, path='student__student_profile__') |
+            prefix_range('student__username', q)
+        )
+
+    return fees
+
+
+# =================================================
+# 📋 EXPORT ROWS (values_list + iterator, no model instances)
+# =================================================
+def fee_export_rows(month='', class_name='', status='', q=''):
+    """
+    Fees report ke rows plain tuples me, chunk-wise DB se
+    (same filters as fees_report)
+    """
+
+    fees = filter_fees(
+        StudentFee.objects.order_by('-created_at', 'id'),
+        month, class_name, status, q
+    )
+
+    rows = fees.values_list(
+        'student__username',
+        'student__student_profile__father_name',
+        'student__student_profile__contact_number',
+        'fee_structure__class_name',
+        'fee_structure__month',
+        'fee_structure__amount',
+        'status',
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    for username, father, contact, cls, fee_month, amount, status in rows:
+        yield [
+            username,
+            father or "",
+            contact or "",
+            cls,
+            fee_month,
+            float(amount),
+            status,
+        ]
+
+
+# =================================================
+# 📄 CSV (TRUE STREAMING)
+# =================================================
+class _Echo:
+    """
+    File-like object jo write() ki value wapas kar deta hai
+    (csv.writer ko StreamingHttpResponse ke saath use karne ke liye)
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_fees_csv(month='', class_name='', status='', q=''):
+    writer = csv.writer(_Echo())
+
+    yield writer.writerow(EXPORT_HEADERS)
+    for row in fee_export_rows(month, class_name, status, q):
+        yield writer.writerow(row)
+
+
+# =================================================
+# 📊 XLSX (WRITE-ONLY WORKBOOK → TEMP FILE)
+# =================================================
+def build_fees_xlsx(month='', class_name='', status='', q=''):
+    """
+    Write-only workbook rows ko seedha disk par likhta hai,
+    isliye memory constant rehti hai. Returns an open temp file
+    (rewound) jise FileResponse chunk-wise stream kar sakta hai.
+    """
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title="Fees Report")
+
+    ws.append(EXPORT_HEADERS)
+    for row in fee_export_rows(month, class_name, status, q):
+        ws.append(row)
+
+    tmp = tempfile.TemporaryFile()
+    wb.save(tmp)
+    tmp.seek(0)
+    return tmp
@@ -0,0 +1,102 @@
+from typing import NamedTuple
+
+from django.db import transaction
+
+from accounts.models import StudentProfile
+from .models import FeeStructure, StudentFee
+from .signals import fees_bulk_created
+
+
+INVOICE_CHUNK_SIZE = 1000
+
+
+class InvoiceResult(NamedTuple):
+    """
+    created: is run me actually insert hue StudentFee rows
+    existing: jo pehle se the (re-run idempotent hai – created 0)
+    """
+    created: int
+    existing: int
+
+
+# =================================================
+# 🧾 BULK MONTHLY FEE INVOICING
+# =================================================
+def invoice_fee_structure(fee_structure, chunk_size=INVOICE_CHUNK_SIZE):
+    """
+    Ek FeeStructure (class + month) ke liye us class ke har student
+    ka PENDING StudentFee row
+
+    - Existing students ek query me skip
+    - bulk_create(ignore_conflicts=True) chunks me – parallel run
+      ho jaye to bhi unique (student, fee_structure) duplicate rokta hai
+    - ignore_conflicts skipped rows nahi batata: created = insert se
+      pehle / baad ka COUNT ka fark
+    """
+
+    student_ids = list(
+        StudentProfile.objects
+        .filter(student_class=fee_structure.class_name)
+        .order_by('user_id')
+        .values_list('user_id', flat=True)
+    )
+
+    already = set(
+        StudentFee.objects
+        .filter(fee_structure=fee_structure, student_id__in=student_ids)
+        .values_list('student_id', flat=True)
+    )
+
+    new_fees = [
+        StudentFee(student_id=student_id, fee_structure=fee_structure)
+        for student_id in student_ids
+        if student_id not in already
+    ]
+
+    if not new_fees:
+        return InvoiceResult(created=0, existing=len(already))
+
+    invoiced = StudentFee.objects.filter(
+        fee_structure=fee_structure, student_id__in=student_ids
+    )
+
+    with transaction.atomic():
+        before = invoiced.count()
+        for start in range(0, len(new_fees), chunk_size):
+            StudentFee.objects.bulk_create(
+                new_fees[start:start + chunk_size],
+                ignore_conflicts=True
+            )
+        created = invoiced.count() - before
+
+    return InvoiceResult(created=created, existing=len(student_ids) - created)
+
+
+def generate_monthly_fees(fee_structures, chunk_size=INVOICE_CHUNK_SIZE):
+    """
+    Invoicing Job
+    -------------
+    - fee_structures: FeeStructure queryset / list (e.g. ek month ke
+      saare classes)
+    - bulk_create post_save nahi bhejta: end me fees_bulk_created
+      signal (dashboard counters ke liye)
+    - Returns InvoiceResult (totals)
+    """
+
+    created = existing = 0
+    for fee_structure in fee_structures:
+        result = invoice_fee_structure(fee_structure, chunk_size=chunk_size)
+        created += result.created
+        existing += result.existing
+
+    if created:
+        fees_bulk_created.send(sender=StudentFee, count=created)
+
+    return InvoiceResult(created=created, existing=existing)
+
+
+def structures_for_month(month, class_names=None):
+    structures = FeeStructure.objects.filter(month=month)
+    if class_names:
+        structures = structures.filter(class_name__in=class_names)
+    return structures.order_by('class_name')
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from fees.invoicing import INVOICE_CHUNK_SIZE, generate_monthly_fees, structures_for_month
+from fees.models import FeeStructure
+
+
+class Command(BaseCommand):
+    help = "Create the month's PENDING StudentFee rows for every student from FeeStructure"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'month',
+            choices=[month for month, _ in FeeStructure.MONTH_CHOICES],
+            help="Fee month, e.g. April"
+        )
+        parser.add_argument(
+            '--class',
+            dest='class_names',
+            action='append',
+            help="Only this class (repeatable; default: all classes)"
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=INVOICE_CHUNK_SIZE,
+            help="Rows inserted per bulk_create batch"
+        )
+
+    def handle(self, *args, **options):
+        structures = list(structures_for_month(options['month'], options['class_names']))
+        if not structures:
+            raise CommandError(f"No fee structure defined for {options['month']}")
+
+        result = generate_monthly_fees(structures, chunk_size=options['chunk_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {result.created} student fees "
+            f"({result.existing} already existed, {len(structures)} fee structures)"
+        ))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0002_alter_studentfee_student'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentfee',
+            index=models.Index(fields=['-created_at', 'id'], name='fees_studen_created_2cf0e7_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:45
+
+from django.conf import settings
+from django.db import migrations
+
+
+def remove_duplicate_fees(apps, schema_editor):
+    """
+    Manual entry se bane duplicate (student, fee_structure) rows:
+    PAID row (warna sabse purana) rakho, baaki PENDING rows hatao.
+
+    Ek pair ke ek se zyada PAID rows (payment records) kabhi delete
+    nahi karte – migration ruk jaati hai, pehle admin unhe theek kare.
+    """
+    StudentFee = apps.get_model('fees', 'StudentFee')
+
+    keep = {}
+    duplicates = []
+    paid_conflicts = set()
+    rows = StudentFee.objects.order_by('student_id', 'fee_structure_id', 'id').values_list(
+        'id', 'student_id', 'fee_structure_id', 'status'
+    )
+    for fee_id, student_id, structure_id, status in rows.iterator():
+        key = (student_id, structure_id)
+        kept = keep.get(key)
+        if kept is None:
+            keep[key] = (fee_id, status)
+        elif status == 'PAID' and kept[1] == 'PAID':
+            paid_conflicts.add(key)
+        elif status == 'PAID':
+            duplicates.append(kept[0])
+            keep[key] = (fee_id, status)
+        else:
+            duplicates.append(fee_id)
+
+    if paid_conflicts:
+        pairs = ", ".join(
+            f"(student={student_id}, fee_structure={structure_id})"
+            for student_id, structure_id in sorted(paid_conflicts)
+        )
+        raise RuntimeError(
+            "Cannot add unique (student, fee_structure): multiple PAID StudentFee "
+            f"rows exist for {pairs}. Resolve these payments manually, then "
+            "re-run migrate."
+        )
+
+    for start in range(0, len(duplicates), 500):
+        StudentFee.objects.filter(id__in=duplicates[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0003_studentfee_fees_studen_created_2cf0e7_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_fees, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='studentfee',
+            unique_together={('student', 'fee_structure')},
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0004_studentfee_unique_student_fee_structure'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeePayment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=8)),
+                ('transaction_id', models.CharField(max_length=100, unique=True)),
+                ('idempotency_key', models.CharField(max_length=100, unique=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fee', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='payments', to='fees.studentfee')),
+                ('student', models.ForeignKey(limit_choices_to={'role': 'STUDENT'}, on_delete=django.db.models.deletion.PROTECT, related_name='fee_payments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Fee Payment',
+                'verbose_name_plural': 'Fee Payments',
+                'ordering': ('-created_at',),
+            },
+        ),
+    ]
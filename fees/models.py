@@ -104,9 +104,67 @@ class StudentFee(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
+        # Ek student ko ek month ki fee ek hi baar (invoicing idempotent)
+        unique_together = ('student', 'fee_structure')
         ordering = ('-created_at',)
+        # fees_report keyset pagination (-created_at, id)
+        indexes = [
+            models.Index(fields=['-created_at', 'id']),
+        ]
         verbose_name = "Student Fee"
         verbose_name_plural = "Student Fees"
 
     def __str__(self):
         return f"{self.student.username} - {self.fee_structure.month} ({self.status})"
+
+
+# ==================================================
+# 📒 PAYMENT LEDGER
+# ==================================================
+class FeePayment(models.Model):
+    """
+    Har successful payment ka ek row (append-only ledger)
+
+    - fees.payments.process_payment hi likhta hai
+    - idempotency_key unique: same request dobara aaye (double click /
+      retry) to naya payment nahi banta
+    - transaction_id unique: StudentFee.transaction_id se match
+    """
+
+    fee = models.ForeignKey(
+        StudentFee,
+        on_delete=models.PROTECT,
+        related_name='payments'
+    )
+
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        limit_choices_to={'role': 'STUDENT'},
+        related_name='fee_payments'
+    )
+
+    amount = models.DecimalField(
+        max_digits=8,
+        decimal_places=2
+    )
+
+    transaction_id = models.CharField(
+        max_length=100,
+        unique=True
+    )
+
+    idempotency_key = models.CharField(
+        max_length=100,
+        unique=True
+    )
+
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ('-created_at',)
+        verbose_name = "Fee Payment"
+        verbose_name_plural = "Fee Payments"
+
+    def __str__(self):
+        return f"{self.transaction_id} - {self.student_id} (₹{self.amount})"
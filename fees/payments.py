@@ -0,0 +1,94 @@
+import uuid
+from typing import NamedTuple, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import FeePayment, StudentFee
+
+
+class PaymentResult(NamedTuple):
+    """
+    payment: ledger row (naya ya pehle wala)
+    created: True sirf tab jab is call ne fee PAID ki
+    """
+    payment: Optional[FeePayment]
+    created: bool
+
+    @property
+    def already_paid(self):
+        return not self.created
+
+
+def new_transaction_id():
+    """
+    TXN + date + random 128-bit hex – same second me bhi collision nahi
+    (purana TXN{id}{timestamp} format ek second me repeat hota tha)
+    """
+    return f"TXN{timezone.now():%Y%m%d}{uuid.uuid4().hex.upper()}"
+
+
+def ledger_key(fee_id, idempotency_key):
+    """
+    Client key ko fee ke saath scope karo – ek form key se do
+    alag fees pay ho sakti hain
+    """
+    return f"{fee_id}:{idempotency_key or uuid.uuid4().hex}"
+
+
+# =================================================
+# 💳 PAYMENT PROCESSING (IDEMPOTENT + RACE SAFE)
+# =================================================
+def process_payment(fee_id, student, idempotency_key=None):
+    """
+    Payment Service
+    ---------------
+    - Same idempotency key dobara → pehle wala payment (koi write nahi)
+    - Conditional UPDATE ... WHERE status='PENDING': do parallel requests
+      me se sirf ek ka UPDATE 1 row match karta hai, doosra 0
+    - Winner hi FeePayment ledger row likhta hai (same transaction)
+    - Key na ho to bhi double payment nahi – sirf replay detection nahi hota
+    """
+
+    key = ledger_key(fee_id, idempotency_key)
+
+    replay = FeePayment.objects.filter(idempotency_key=key).first()
+    if replay is not None:
+        return PaymentResult(replay, False)
+
+    transaction_id = new_transaction_id()
+
+    with transaction.atomic():
+        updated = StudentFee.objects.filter(
+            id=fee_id,
+            student=student,
+            status='PENDING'
+        ).update(
+            status='PAID',
+            paid_on=timezone.localdate(),
+            transaction_id=transaction_id
+        )
+
+        if not updated:
+            # Kisi aur request ne pehle hi pay kar diya
+            return PaymentResult(
+                FeePayment.objects.filter(fee_id=fee_id).first(),
+                False
+            )
+
+        amount = (
+            StudentFee.objects
+            .filter(id=fee_id)
+            .values_list('fee_structure__amount', flat=True)
+            .get()
+        )
+
+        payment = FeePayment.objects.create(
+            fee_id=fee_id,
+            student=student,
+            amount=amount,
+            transaction_id=transaction_id,
+            idempotency_key=key
+        )
+
+    return PaymentResult(payment, True)
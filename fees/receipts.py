@@ -0,0 +1,201 @@
+import io
+import tempfile
+from typing import NamedTuple
+
+from django.conf import settings
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from accounts.utils import configured_cache
+from .models import StudentFee
+
+
+# Paid receipts immutable hain – (fee_id, transaction_id) key kabhi
+# stale nahi hoti, isliye lamba timeout theek hai
+RECEIPT_CACHE_TIMEOUT = getattr(settings, 'FEE_RECEIPT_CACHE_TIMEOUT', 60 * 60 * 24 * 7)
+
+KEY_PREFIX = 'fees:receipt:'
+
+RECEIPT_CHUNK_SIZE = 500
+
+# Static layout ka PDF form XObject name
+LAYOUT_FORM = 'FeeReceiptLayout'
+
+WIDTH, HEIGHT = A4
+
+# Variable fields (label layout me, value yahan stamp hoti hai)
+FIELD_X = 200
+FIELD_Y = [HEIGHT - 140 - 25 * i for i in range(6)]
+
+RECEIPT_FIELDS = (
+    'id',
+    'student__username',
+    'fee_structure__class_name',
+    'fee_structure__month',
+    'fee_structure__amount',
+    'paid_on',
+    'transaction_id',
+)
+
+
+class ReceiptData(NamedTuple):
+    """
+    Receipt par stamp hone wali values – model instance ki jagah
+    plain tuple (bulk me values_list se seedha banta hai)
+    """
+    fee_id: int
+    username: str
+    class_name: str
+    month: str
+    amount: object
+    paid_on: object
+    transaction_id: str
+
+    @classmethod
+    def from_fee(cls, fee):
+        return cls(
+            fee.id,
+            fee.student.username,
+            fee.fee_structure.class_name,
+            fee.fee_structure.month,
+            fee.fee_structure.amount,
+            fee.paid_on,
+            fee.transaction_id,
+        )
+
+
+def get_cache():
+    return configured_cache('FEE_RECEIPT_CACHE_ALIAS')
+
+
+def receipt_cache_key(fee_id, transaction_id):
+    return f"{KEY_PREFIX}{fee_id}:{transaction_id}"
+
+
+# =================================================
+# 🖨️ STATIC LAYOUT (EK BAAR, FORM XOBJECT)
+# =================================================
+def _draw_layout(p):
+    """
+    Header, title, labels aur footer – har receipt me same
+    """
+    p.setFont("Helvetica-Bold", 16)
+    p.drawCentredString(WIDTH / 2, HEIGHT - 50, "VIDHYA SETU SCHOOL")
+
+    p.setFont("Helvetica", 12)
+    p.drawCentredString(WIDTH / 2, HEIGHT - 80, "Fee Payment Receipt")
+
+    p.setFont("Helvetica", 11)
+    labels = (
+        "Student Username:",
+        "Class:",
+        "Month:",
+        "Amount Paid:",
+        "Paid On:",
+        "Transaction ID:",
+    )
+    for label, y in zip(labels, FIELD_Y):
+        p.drawString(80, y, label)
+
+    y = FIELD_Y[-1]
+    p.line(80, y - 30, WIDTH - 80, y - 30)
+    p.drawString(80, y - 60, "This is a system-generated receipt.")
+    p.drawString(80, y - 80, "Thank you for your payment!")
+
+
+def _use_layout(p):
+    """
+    Canvas me layout form pehli baar define hota hai; uske baad har
+    page par sirf doForm() reference (bulk PDF me layout ek hi baar
+    embed hota hai)
+    """
+    if not getattr(p, '_receipt_layout_ready', False):
+        p.beginForm(LAYOUT_FORM)
+        _draw_layout(p)
+        p.endForm()
+        p._receipt_layout_ready = True
+
+    p.doForm(LAYOUT_FORM)
+
+
+def draw_receipt(p, receipt):
+    """
+    Layout stamp + sirf variable fields
+    """
+    _use_layout(p)
+
+    p.setFont("Helvetica", 11)
+    values = (
+        receipt.username,
+        receipt.class_name,
+        receipt.month,
+        f"₹{receipt.amount}",
+        receipt.paid_on,
+        receipt.transaction_id,
+    )
+    for value, y in zip(values, FIELD_Y):
+        p.drawString(FIELD_X, y, str(value))
+
+
+def render_receipt(receipt):
+    """
+    Single receipt PDF (bytes), cache se ya render karke
+    """
+    cache = get_cache()
+    key = receipt_cache_key(receipt.fee_id, receipt.transaction_id)
+
+    pdf = cache.get(key)
+    if pdf is not None:
+        return pdf
+
+    buffer = io.BytesIO()
+    p = canvas.Canvas(buffer, pagesize=A4)
+    draw_receipt(p, receipt)
+    p.showPage()
+    p.save()
+
+    pdf = buffer.getvalue()
+    cache.set(key, pdf, RECEIPT_CACHE_TIMEOUT)
+    return pdf
+
+
+# =================================================
+# 📚 BULK RECEIPTS (CLASS / MONTH)
+# =================================================
+def paid_receipts(class_name='', month=''):
+    """
+    PAID fees ke ReceiptData, chunk-wise DB se (no model instances)
+    """
+    fees = StudentFee.objects.filter(status='PAID').order_by(
+        'fee_structure__class_name', 'student__username', 'id'
+    )
+
+    if class_name:
+        fees = fees.filter(fee_structure__class_name=class_name)
+
+    if month:
+        fees = fees.filter(fee_structure__month=month)
+
+    for row in fees.values_list(*RECEIPT_FIELDS).iterator(chunk_size=RECEIPT_CHUNK_SIZE):
+        yield ReceiptData(*row)
+
+
+def build_receipts_pdf(class_name='', month=''):
+    """
+    Saari matching receipts ek PDF me (ek page per receipt,
+    layout XObject ek baar). Returns (open temp file, count).
+    """
+
+    tmp = tempfile.TemporaryFile()
+    p = canvas.Canvas(tmp, pagesize=A4)
+
+    count = 0
+    for receipt in paid_receipts(class_name, month):
+        draw_receipt(p, receipt)
+        p.showPage()
+        count += 1
+
+    p.save()
+    tmp.seek(0)
+    return tmp, count
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver, Signal
+
+from .models import FeeStructure
+from .summary import invalidate_filter_options
+
+
+# ==================================================
+# CUSTOM SIGNAL: BULK INVOICING
+# ==================================================
+# bulk_create post_save nahi bhejta – monthly invoicing ke baad
+# ye signal jaata hai (kwargs: count, sab PENDING) taaki caches
+# update ho sakein
+fees_bulk_created = Signal()
+
+
+# ==================================================
+# 🔽 FEES REPORT DROPDOWNS
+# ==================================================
+@receiver(post_save, sender=FeeStructure)
+def fee_structure_saved(sender, instance, **kwargs):
+    invalidate_filter_options()
+
+
+@receiver(post_delete, sender=FeeStructure)
+def fee_structure_deleted(sender, instance, **kwargs):
+    invalidate_filter_options()
@@ -0,0 +1,137 @@
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.db.models import Q, Sum
+
+from accounts.utils import configured_cache, is_ascii_digits
+from .models import FeeStructure
+
+
+FILTER_OPTIONS_KEY = 'fees:filter-options'
+
+# Signal miss ho jaye (queryset.update / bulk_create) to bhi itni der me refresh
+FILTER_OPTIONS_TIMEOUT = 60 * 60
+
+ZERO = Decimal('0.00')
+
+# Calendar order (alphabetical nahi)
+MONTH_ORDER = {month: index for index, (month, _) in enumerate(FeeStructure.MONTH_CHOICES)}
+
+
+class FeeTotals(NamedTuple):
+    total: Decimal = ZERO
+    paid: Decimal = ZERO
+    pending: Decimal = ZERO
+
+    def __add__(self, other):
+        return FeeTotals(
+            self.total + other.total,
+            self.paid + other.paid,
+            self.pending + other.pending,
+        )
+
+
+class FeeSummary(NamedTuple):
+    """
+    Overall totals + month-wise / class-wise breakdown
+    (dono dicts calendar / class order me)
+    """
+    totals: FeeTotals
+    by_month: dict
+    by_class: dict
+
+    @property
+    def total(self):
+        return self.totals.total
+
+    @property
+    def paid(self):
+        return self.totals.paid
+
+    @property
+    def pending(self):
+        return self.totals.pending
+
+
+def _class_order(class_name):
+    if is_ascii_digits(class_name):
+        return int(class_name)
+    return class_name
+
+
+def get_cache():
+    return configured_cache('FEE_SUMMARY_CACHE_ALIAS')
+
+
+# =================================================
+# 💰 FEE SUMMARY (ONE GROUPED QUERY)
+# =================================================
+def fee_summary(fees):
+    """
+    Fee-Summary Service
+    -------------------
+    - fees: koi bhi (filtered) StudentFee queryset
+    - Ek hi query: (month, class) GROUP BY + conditional SUMs
+      (Sum(filter=Q(status=...)))
+    - Overall / per-month / per-class totals Python me roll-up
+    """
+
+    rows = (
+        fees
+        .order_by()
+        .values_list('fee_structure__month', 'fee_structure__class_name')
+        .annotate(
+            total=Sum('fee_structure__amount'),
+            paid=Sum('fee_structure__amount', filter=Q(status='PAID')),
+            pending=Sum('fee_structure__amount', filter=Q(status='PENDING')),
+        )
+    )
+
+    totals = FeeTotals()
+    by_month = {}
+    by_class = {}
+
+    for month, class_name, total, paid, pending in rows:
+        row = FeeTotals(total or ZERO, paid or ZERO, pending or ZERO)
+        totals += row
+        by_month[month] = by_month.get(month, FeeTotals()) + row
+        by_class[class_name] = by_class.get(class_name, FeeTotals()) + row
+
+    return FeeSummary(
+        totals=totals,
+        by_month=dict(sorted(by_month.items(), key=lambda item: MONTH_ORDER.get(item[0], 99))),
+        by_class=dict(sorted(by_class.items(), key=lambda item: _class_order(item[0]))),
+    )
+
+
+# =================================================
+# 🔽 FILTER DROPDOWNS (FeeStructure se, cached)
+# =================================================
+def fee_filter_options():
+    """
+    (months, classes) jinke liye FeeStructure bana hai –
+    StudentFee table scan nahi. FeeStructure save / delete par
+    cache clear hota hai (fees.signals).
+    """
+
+    cache = get_cache()
+    options = cache.get(FILTER_OPTIONS_KEY)
+    if options is not None:
+        return options
+
+    months = set()
+    classes = set()
+    for month, class_name in FeeStructure.objects.order_by().values_list('month', 'class_name'):
+        months.add(month)
+        classes.add(class_name)
+
+    options = (
+        sorted(months, key=lambda month: MONTH_ORDER.get(month, 99)),
+        sorted(classes, key=_class_order),
+    )
+    cache.set(FILTER_OPTIONS_KEY, options, FILTER_OPTIONS_TIMEOUT)
+    return options
+
+
+def invalidate_filter_options():
+    get_cache().delete(FILTER_OPTIONS_KEY)
@@ -1,3 +1,412 @@
-from django.test import TestCase
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import caches
+from django.db import OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.benchmarks import BenchmarkTestCase, consume
+from accounts.models import User
+from .invoicing import generate_monthly_fees
+from .models import FeePayment, FeeStructure, StudentFee
+from .payments import new_transaction_id, process_payment
+from .receipts import ReceiptData, paid_receipts, receipt_cache_key, render_receipt
+from .summary import FILTER_OPTIONS_KEY, fee_filter_options
+
+
+class PaymentServiceTests(TestCase):
+    """
+    process_payment(): idempotency key, conditional UPDATE, ledger row
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user('student', password='x', role='STUDENT')
+        cls.other = User.objects.create_user('other', password='x', role='STUDENT')
+        cls.structure = FeeStructure.objects.create(
+            class_name='5', month='April', amount=Decimal('750.00')
+        )
+
+    def setUp(self):
+        self.fee = StudentFee.objects.create(
+            student=self.student, fee_structure=self.structure
+        )
+
+    def test_payment_marks_fee_paid_and_writes_ledger(self):
+        result = process_payment(self.fee.id, self.student, 'key-1')
+
+        self.assertTrue(result.created)
+        self.fee.refresh_from_db()
+        self.assertEqual(self.fee.status, 'PAID')
+        self.assertIsNotNone(self.fee.paid_on)
+        self.assertEqual(self.fee.transaction_id, result.payment.transaction_id)
+        self.assertEqual(result.payment.amount, Decimal('750.00'))
+        self.assertEqual(FeePayment.objects.count(), 1)
+
+    def test_same_key_replays_original_payment(self):
+        first = process_payment(self.fee.id, self.student, 'key-1')
+        second = process_payment(self.fee.id, self.student, 'key-1')
+
+        self.assertFalse(second.created)
+        self.assertEqual(second.payment, first.payment)
+        self.assertEqual(FeePayment.objects.count(), 1)
+
+    def test_different_key_does_not_pay_twice(self):
+        first = process_payment(self.fee.id, self.student, 'key-1')
+        second = process_payment(self.fee.id, self.student, 'key-2')
+
+        self.assertFalse(second.created)
+        self.assertEqual(second.payment, first.payment)
+        self.fee.refresh_from_db()
+        self.assertEqual(self.fee.transaction_id, first.payment.transaction_id)
+
+    def test_other_student_cannot_pay(self):
+        result = process_payment(self.fee.id, self.other, 'key-1')
+
+        self.assertFalse(result.created)
+        self.assertIsNone(result.payment)
+        self.fee.refresh_from_db()
+        self.assertEqual(self.fee.status, 'PENDING')
+
+    def test_transaction_ids_are_unique(self):
+        ids = {new_transaction_id() for _ in range(10000)}
+        self.assertEqual(len(ids), 10000)
+
+    def test_double_submit_through_view(self):
+        self.client.force_login(self.student)
+        url = reverse('pay_fee', args=[self.fee.id])
+
+        for _ in range(3):
+            response = self.client.post(url, {'idempotency_key': 'form-key'})
+            self.assertRedirects(response, reverse('my_fees'), fetch_redirect_response=False)
+
+        self.assertEqual(FeePayment.objects.filter(fee=self.fee).count(), 1)
+
+
+@override_settings(
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'fees': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'fee-summary-tests',
+        },
+    },
+    FEE_SUMMARY_CACHE_ALIAS='fees',
+)
+class FeeFilterOptionsTests(TestCase):
+    """
+    Report dropdowns: FEE_SUMMARY_CACHE_ALIAS wale cache me, class order numeric
+    """
+
+    def setUp(self):
+        caches['fees'].clear()
+
+    def test_options_cached_in_configured_alias(self):
+        FeeStructure.objects.create(class_name='10', month='March', amount=500)
+        FeeStructure.objects.create(class_name='2', month='January', amount=500)
+
+        self.assertEqual(
+            fee_filter_options(), (['January', 'March'], ['2', '10'])
+        )
+        self.assertIsNotNone(caches['fees'].get(FILTER_OPTIONS_KEY))
+        self.assertIsNone(caches['default'].get(FILTER_OPTIONS_KEY))
+
+        with self.assertNumQueries(0):
+            fee_filter_options()
+
+        FeeStructure.objects.create(class_name='1', month='April', amount=500)
+        self.assertIsNone(caches['fees'].get(FILTER_OPTIONS_KEY))
+        self.assertEqual(fee_filter_options()[1], ['1', '2', '10'])
+
+
+@override_settings(
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'receipts': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'fee-receipt-tests',
+        },
+    },
+    FEE_RECEIPT_CACHE_ALIAS='receipts',
+)
+class FeeReceiptTests(TestCase):
+    """
+    Receipt PDF: (fee_id, transaction_id) par cached; bulk receipts sirf PAID
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', password='x', role='ADMIN')
+        cls.student = User.objects.create_user('student', password='x', role='STUDENT')
+        other = User.objects.create_user('other', password='x', role='STUDENT')
+
+        april = FeeStructure.objects.create(class_name='5', month='April', amount=750)
+        may = FeeStructure.objects.create(class_name='5', month='May', amount=750)
+        june = FeeStructure.objects.create(class_name='6', month='June', amount=900)
+
+        cls.fee = StudentFee.objects.create(
+            student=cls.student, fee_structure=april, status='PAID',
+            paid_on=timezone.now(), transaction_id='TXN-1',
+        )
+        StudentFee.objects.create(
+            student=other, fee_structure=april, status='PAID',
+            paid_on=timezone.now(), transaction_id='TXN-2',
+        )
+        StudentFee.objects.create(
+            student=cls.student, fee_structure=june, status='PAID',
+            paid_on=timezone.now(), transaction_id='TXN-3',
+        )
+        StudentFee.objects.create(student=cls.student, fee_structure=may)
+
+    def setUp(self):
+        caches['receipts'].clear()
+
+    def test_receipt_cached_by_fee_and_transaction(self):
+        receipt = ReceiptData.from_fee(self.fee)
+        key = receipt_cache_key(self.fee.id, 'TXN-1')
+
+        pdf = render_receipt(receipt)
+        self.assertTrue(pdf.startswith(b'%PDF'))
+        self.assertEqual(caches['receipts'].get(key), pdf)
+        self.assertIsNone(caches['default'].get(key))
+
+        # Cache hit: stored bytes hi wapas (dobara render nahi)
+        caches['receipts'].set(key, b'cached', 60)
+        self.assertEqual(render_receipt(receipt), b'cached')
+
+        # Naya transaction_id → alag key, naya render
+        self.assertTrue(
+            render_receipt(receipt._replace(transaction_id='TXN-9')).startswith(b'%PDF')
+        )
+
+    def test_receipt_view_uses_cache(self):
+        self.client.force_login(self.student)
+        url = reverse('fee_receipt', args=[self.fee.id])
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+
+        with self.assertNumQueries(3):  # session + user + fee
+            cached = self.client.get(url)
+        self.assertEqual(cached.content, response.content)
+
+    def test_paid_receipts_filters(self):
+        self.assertEqual(
+            [r.transaction_id for r in paid_receipts()], ['TXN-2', 'TXN-1', 'TXN-3']
+        )
+        self.assertEqual(
+            [r.transaction_id for r in paid_receipts('5', 'April')], ['TXN-2', 'TXN-1']
+        )
+        self.assertEqual(list(paid_receipts(month='May')), [])
+
+    def test_bulk_fee_receipts_view(self):
+        self.client.force_login(self.student)
+        self.assertEqual(self.client.get(reverse('bulk_fee_receipts')).status_code, 403)
+
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('bulk_fee_receipts'), {'class_name': '5'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+
+        pdf = b''.join(response.streaming_content)
+        self.assertTrue(pdf.startswith(b'%PDF'))
+        self.assertEqual(pdf.count(b'/Type /Page\n'), 2)
+
+        empty = self.client.get(reverse('bulk_fee_receipts'), {'month': 'May'})
+        self.assertRedirects(empty, reverse('fees_report'), fetch_redirect_response=False)
+
+
+class InvoicingTests(TestCase):
+    """
+    generate_monthly_fees(): re-run idempotent, created = actual inserts
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.students = []
+        for i in range(3):
+            student = User.objects.create_user(f's{i}', password='x', role='STUDENT')
+            student.student_profile.student_class = '5'
+            student.student_profile.save()
+            cls.students.append(student)
+
+        cls.structure = FeeStructure.objects.create(class_name='5', month='April', amount=750)
+
+    def test_rerun_creates_nothing(self):
+        StudentFee.objects.create(student=self.students[0], fee_structure=self.structure)
+
+        first = generate_monthly_fees([self.structure])
+        self.assertEqual((first.created, first.existing), (2, 1))
+        self.assertEqual(StudentFee.objects.count(), 3)
+
+        with mock.patch('fees.invoicing.fees_bulk_created.send') as send:
+            again = generate_monthly_fees([self.structure])
+        self.assertEqual((again.created, again.existing), (0, 3))
+        self.assertEqual(StudentFee.objects.count(), 3)
+        send.assert_not_called()
+
+    def test_rows_skipped_by_conflict_are_not_counted(self):
+        real_atomic = transaction.atomic
+        raced = []
+
+        def racing_atomic(*args, **kwargs):
+            # `already` padhne ke baad parallel run ne ek student invoice kar diya
+            if not raced:
+                raced.append(True)
+                StudentFee.objects.create(student=self.students[1], fee_structure=self.structure)
+            return real_atomic(*args, **kwargs)
+
+        with mock.patch('django.db.transaction.atomic', racing_atomic):
+            result = generate_monthly_fees([self.structure])
+
+        self.assertEqual((result.created, result.existing), (2, 1))
+        self.assertEqual(StudentFee.objects.count(), 3)
+
+
+class FeesReportPaginationTests(TestCase):
+    """
+    fees_report keyset pages (-created_at, id): same millisecond me bane
+    invoices bhi skip / repeat na hon
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', password='x', role='ADMIN')
+        structures = [
+            FeeStructure.objects.create(class_name='5', month=month, amount=500)
+            for month, _ in FeeStructure.MONTH_CHOICES
+        ]
+
+        # Saare created_at ek hi millisecond me, sirf microseconds alag
+        # (kuch exactly equal – id tie-break)
+        base = timezone.now().replace(microsecond=0)
+        fees = []
+        for i in range(10):
+            student = User.objects.create_user(f's{i}', password='x', role='STUDENT')
+            for j, structure in enumerate(structures):
+                fees.append(StudentFee(
+                    student=student,
+                    fee_structure=structure,
+                    created_at=base + timedelta(microseconds=(i * 12 + j) // 2),
+                ))
+        StudentFee.objects.bulk_create(fees)
+
+    def test_pages_reach_every_fee(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse('fees_report'))
+        seen = [fee.id for fee in response.context['fees']]
+        while response.context['next_query']:
+            response = self.client.get(
+                f"{reverse('fees_report')}?{response.context['next_query']}"
+            )
+            seen += [fee.id for fee in response.context['fees']]
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(set(seen), set(StudentFee.objects.values_list('id', flat=True)))
+
+
+class ConcurrentPaymentLoadTests(TransactionTestCase):
+    """
+    Many threads hammer the same PENDING fees at once (different
+    idempotency keys, like separate tabs). Each fee must be paid once.
+    """
+
+    THREADS = 8
+    FEES = 10
+
+    def setUp(self):
+        self.student = User.objects.create_user('student', password='x', role='STUDENT')
+        self.fees = [
+            StudentFee.objects.create(
+                student=self.student,
+                fee_structure=FeeStructure.objects.create(
+                    class_name=str(i + 1), month='April', amount=Decimal('100.00')
+                )
+            )
+            for i in range(self.FEES)
+        ]
+
+    def test_concurrent_attempts_pay_each_fee_once(self):
+        barrier = threading.Barrier(self.THREADS)
+        created = []
+        errors = []
+        lock = threading.Lock()
+
+        def worker(number):
+            try:
+                barrier.wait()
+                for fee in self.fees:
+                    for attempt in range(200):
+                        try:
+                            result = process_payment(fee.id, self.student, f"t{number}")
+                            break
+                        except OperationalError:
+                            # SQLite "database table is locked" – retry like a client would
+                            time.sleep(0.005)
+                    else:
+                        raise AssertionError("payment kept failing")
+                    if result.created:
+                        with lock:
+                            created.append(fee.id)
+            except Exception as exc:
+                with lock:
+                    errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(created), sorted(fee.id for fee in self.fees))
+        self.assertEqual(FeePayment.objects.count(), self.FEES)
+        self.assertEqual(StudentFee.objects.filter(status='PENDING').count(), 0)
+        self.assertEqual(
+            FeePayment.objects.values('transaction_id').distinct().count(),
+            self.FEES
+        )
+
+
+class FeesBenchmarkTests(BenchmarkTestCase):
+    """
+    fees_report + exports: query budgets fee rows ki ginti se independent
+    """
+
+    def test_fees_report(self):
+        self.login(self.admin)
+        with self.assertWithinBudget('fees_report', queries=5, ms=1000):
+            response = self.client.get(reverse('fees_report'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_fees_report_filtered(self):
+        self.login(self.admin)
+        with self.assertWithinBudget('fees_report (filtered)', queries=5, ms=1000):
+            response = self.client.get(
+                reverse('fees_report'), {'status': 'PENDING', 'class_name': '1'}
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_export_fees_excel(self):
+        self.login(self.admin)
+        with self.assertWithinBudget('export_fees_excel', queries=3, ms=1500):
+            response = self.client.get(reverse('export_fees_excel'))
+            body = consume(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(body.startswith(b'PK'))
+
+    def test_export_fees_csv(self):
+        self.login(self.admin)
+        with self.assertWithinBudget('export_fees_excel CSV', queries=3, ms=1000):
+            response = self.client.get(reverse('export_fees_excel'), {'format': 'csv'})
+            body = consume(response)
+        self.assertEqual(body.count(b'\n'), StudentFee.objects.count() + 1)
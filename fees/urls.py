@@ -11,4 +11,5 @@ urlpatterns = [
     # ================= ADMIN / TEACHER =================
     path('report/', views.fees_report, name='fees_report'),
     path('export/', views.export_fees_excel, name='export_fees_excel'),
+    path('receipts/', views.bulk_fee_receipts, name='bulk_fee_receipts'),
 ]
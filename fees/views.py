@@ -1,16 +1,26 @@
+import json
+import uuid
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, HttpResponseForbidden
-from django.utils import timezone
-from django.db.models import Sum
-from decimal import Decimal
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseForbidden,
+    StreamingHttpResponse,
+)
+from django.contrib import messages
+
+from accounts.pagination import keyset_paginate
+from .exports import build_fees_xlsx, filter_fees, stream_fees_csv
+from .payments import process_payment
+from .receipts import ReceiptData, build_receipts_pdf, render_receipt
+from .summary import fee_filter_options, fee_summary
+from .models import StudentFee
 
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
 
-import openpyxl
-
-from .models import StudentFee
+FEES_REPORT_PAGE_SIZE = 50
+FEES_REPORT_KEYS = ['-created_at', 'id']
 
 
 # =================================================
@@ -28,21 +38,16 @@ def my_fees(request):
         'fee_structure'
     ).filter(student=request.user)
 
-    total_amount = fees.aggregate(
-        total=Sum('fee_structure__amount')
-    )['total'] or Decimal('0.00')
-
-    paid_amount = fees.filter(status='PAID').aggregate(
-        total=Sum('fee_structure__amount')
-    )['total'] or Decimal('0.00')
-
-    pending_amount = total_amount - paid_amount
+    # ⚡ Total / paid / pending ek hi query me
+    summary = fee_summary(fees)
 
     context = {
         'fees': fees,
-        'total_amount': total_amount,
-        'paid_amount': paid_amount,
-        'pending_amount': pending_amount,
+        # Har page render ki apni key – double submit same key bhejta hai
+        'payment_key': uuid.uuid4().hex,
+        'total_amount': summary.total,
+        'paid_amount': summary.paid,
+        'pending_amount': summary.pending,
     }
 
     return render(request, 'student/my_fees.html', context)
@@ -55,22 +60,37 @@ def my_fees(request):
 def pay_fee(request, fee_id):
     """
     Demo payment: marks fee as PAID
+
+    - Idempotency key: form ka hidden field ya Idempotency-Key header
+    - Double click / parallel requests → sirf ek payment (fees.payments)
     """
     if request.user.role != 'STUDENT':
         return HttpResponseForbidden("Access Denied")
 
+    # Status filter nahi – doosri request ko 404 ki jagah "already paid"
     fee = get_object_or_404(
-        StudentFee,
+        StudentFee.objects.only('id'),
         id=fee_id,
-        student=request.user,
-        status='PENDING'
+        student=request.user
     )
 
     if request.method == "POST":
-        fee.status = 'PAID'
-        fee.paid_on = timezone.now().date()
-        fee.transaction_id = f"TXN{fee.id}{int(timezone.now().timestamp())}"
-        fee.save()
+        result = process_payment(
+            fee.id,
+            request.user,
+            idempotency_key=(
+                request.headers.get('Idempotency-Key')
+                or request.POST.get('idempotency_key')
+            )
+        )
+
+        if result.created:
+            messages.success(
+                request,
+                f"Payment successful ✅ (Transaction ID: {result.payment.transaction_id})"
+            )
+        else:
+            messages.info(request, "This fee is already paid ℹ️")
 
     return redirect('my_fees')
 
@@ -87,49 +107,51 @@ def fee_receipt(request, fee_id):
         return HttpResponseForbidden("Access Denied")
 
     fee = get_object_or_404(
-        StudentFee,
+        StudentFee.objects.select_related('student', 'fee_structure'),
         id=fee_id,
         student=request.user,
         status='PAID'
     )
 
-    response = HttpResponse(content_type='application/pdf')
+    # ⚡ Paid receipt immutable – (fee_id, transaction_id) par cached bytes
+    response = HttpResponse(
+        render_receipt(ReceiptData.from_fee(fee)),
+        content_type='application/pdf'
+    )
     response['Content-Disposition'] = (
         f'inline; filename="fee_receipt_{fee.id}.pdf"'
     )
 
-    p = canvas.Canvas(response, pagesize=A4)
-    width, height = A4
-
-    p.setFont("Helvetica-Bold", 16)
-    p.drawCentredString(width / 2, height - 50, "VIDHYA SETU SCHOOL")
+    return response
 
-    p.setFont("Helvetica", 12)
-    p.drawCentredString(width / 2, height - 80, "Fee Payment Receipt")
 
-    y = height - 140
-    p.setFont("Helvetica", 11)
+# =================================================
+# 📚 BULK FEE RECEIPTS (CLASS / MONTH)
+# =================================================
+@login_required
+def bulk_fee_receipts(request):
+    """
+    Admin / Teacher: class / month ki saari PAID receipts ek PDF me
+    """
+    if request.user.role not in ['ADMIN', 'TEACHER']:
+        return HttpResponseForbidden("Access Denied")
 
-    p.drawString(80, y, f"Student Username: {fee.student.username}")
-    y -= 25
-    p.drawString(80, y, f"Class: {fee.fee_structure.class_name}")
-    y -= 25
-    p.drawString(80, y, f"Month: {fee.fee_structure.month}")
-    y -= 25
-    p.drawString(80, y, f"Amount Paid: ₹{fee.fee_structure.amount}")
-    y -= 25
-    p.drawString(80, y, f"Paid On: {fee.paid_on}")
-    y -= 25
-    p.drawString(80, y, f"Transaction ID: {fee.transaction_id}")
+    selected_month = request.GET.get('month', '').strip()
+    selected_class = request.GET.get('class_name', '').strip()
 
-    p.line(80, y - 30, width - 80, y - 30)
-    p.drawString(80, y - 60, "This is a system-generated receipt.")
-    p.drawString(80, y - 80, "Thank you for your payment!")
+    pdf, count = build_receipts_pdf(selected_class, selected_month)
 
-    p.showPage()
-    p.save()
+    if not count:
+        pdf.close()
+        messages.warning(request, "No paid receipts found for this filter ⚠️")
+        return redirect('fees_report')
 
-    return response
+    return FileResponse(
+        pdf,
+        as_attachment=True,
+        filename='fee_receipts.pdf',
+        content_type='application/pdf'
+    )
 
 
 # =================================================
@@ -143,98 +165,101 @@ def fees_report(request):
     if request.user.role not in ['ADMIN', 'TEACHER']:
         return HttpResponseForbidden("Access Denied")
 
-    fees = StudentFee.objects.select_related(
-        'student',
-        'student__student_profile',
-        'fee_structure'
-    )
-
     selected_month = request.GET.get('month', '').strip()
     selected_class = request.GET.get('class_name', '').strip()
+    selected_status = request.GET.get('status', '').strip()
+    query = request.GET.get('q', '').strip()
+
+    fees = filter_fees(
+        StudentFee.objects.all(),
+        selected_month,
+        selected_class,
+        selected_status,
+        query
+    )
 
-    if selected_month:
-        fees = fees.filter(fee_structure__month=selected_month)
-
-    if selected_class:
-        fees = fees.filter(fee_structure__class_name=selected_class)
-
-    total_collected = fees.filter(status='PAID').aggregate(
-        total=Sum('fee_structure__amount')
-    )['total'] or Decimal('0.00')
+    # ⚡ Totals + class-wise breakdown ek hi aggregate query me
+    summary = fee_summary(fees)
+
+    # ⚡ Sirf visible page (keyset – OFFSET nahi)
+    page = keyset_paginate(
+        fees.select_related(
+            'student',
+            'student__student_profile',
+            'fee_structure'
+        ),
+        FEES_REPORT_KEYS,
+        cursor=request.GET.get('after'),
+        page_size=FEES_REPORT_PAGE_SIZE
+    )
 
-    total_pending = fees.filter(status='PENDING').aggregate(
-        total=Sum('fee_structure__amount')
-    )['total'] or Decimal('0.00')
+    next_query = None
+    if page.has_next:
+        params = request.GET.copy()
+        params['after'] = page.next_cursor
+        next_query = params.urlencode()
 
-    months = StudentFee.objects.values_list(
-        'fee_structure__month', flat=True
-    ).distinct()
+    first_query = request.GET.copy()
+    first_query.pop('after', None)
 
-    classes = StudentFee.objects.values_list(
-        'fee_structure__class_name', flat=True
-    ).distinct()
+    # Dropdowns FeeStructure se (cached) – StudentFee scan nahi
+    months, classes = fee_filter_options()
 
     context = {
-        'fees': fees,
-        'total_collected': total_collected,
-        'total_pending': total_pending,
+        'fees': page.object_list,
+        'next_query': next_query,
+        'filter_query': first_query.urlencode(),
+        'total_collected': summary.paid,
+        'total_pending': summary.pending,
+        'pie_labels': json.dumps(['Paid', 'Pending']),
+        'pie_values': json.dumps([float(summary.paid), float(summary.pending)]),
+        'bar_labels': json.dumps([f"Class {cls}" for cls in summary.by_class]),
+        'bar_values': json.dumps([float(row.total) for row in summary.by_class.values()]),
         'months': months,
         'classes': classes,
+        'statuses': StudentFee.PAYMENT_STATUS,
         'selected_month': selected_month,
         'selected_class': selected_class,
+        'selected_status': selected_status,
+        'query': query,
     }
 
     return render(request, 'fees/fees_report.html', context)
 
 
 # =================================================
-# 📥 EXPORT FEES REPORT TO EXCEL
+# 📥 EXPORT FEES REPORT TO EXCEL / CSV
 # =================================================
 @login_required
 def export_fees_excel(request):
     """
     Export fee report to Excel (Admin / Teacher)
+
+    - Same month / class_name / status / q filters as fees_report
+    - ?format=csv → streamed CSV
+    - default → write-only XLSX streamed from a temp file
     """
     if request.user.role not in ['ADMIN', 'TEACHER']:
         return HttpResponseForbidden("Access Denied")
 
-    fees = StudentFee.objects.select_related(
-        'student',
-        'student__student_profile',
-        'fee_structure'
+    filters = (
+        request.GET.get('month', '').strip(),
+        request.GET.get('class_name', '').strip(),
+        request.GET.get('status', '').strip(),
+        request.GET.get('q', '').strip(),
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Fees Report"
-
-    ws.append([
-        "Student Username",
-        "Father Name",
-        "Contact Number",
-        "Class",
-        "Month",
-        "Amount",
-        "Status"
-    ])
-
-    for fee in fees:
-        profile = getattr(fee.student, 'student_profile', None)
-
-        ws.append([
-            fee.student.username,
-            profile.father_name if profile else "",
-            profile.contact_number if profile else "",
-            fee.fee_structure.class_name,
-            fee.fee_structure.month,
-            float(fee.fee_structure.amount),
-            fee.status
-        ])
-
-    response = HttpResponse(
+    if request.GET.get('format') == 'csv':
+        response = StreamingHttpResponse(
+            stream_fees_csv(*filters),
+            content_type='text/csv'
+        )
+        response['Content-Disposition'] = 'attachment; filename=fees_report.csv'
+        return response
+
+    return FileResponse(
+        build_fees_xlsx(*filters),
+        as_attachment=True,
+        filename='fees_report.xlsx',
         content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     )
-    response['Content-Disposition'] = 'attachment; filename=fees_report.xlsx'
-
-    wb.save(response)
-    return response
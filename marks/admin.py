@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Subject, StudentMark
+from .models import GRADE_CHOICES, Subject, StudentMark
 
 
 # ==================================================
@@ -31,6 +31,22 @@ class SubjectAdmin(admin.ModelAdmin):
     )
 
 
+# ==================================================
+# 🎯 GRADE FILTER (SQL annotation par)
+# ==================================================
+class GradeListFilter(admin.SimpleListFilter):
+    title = "Grade"
+    parameter_name = "grade"
+
+    def lookups(self, request, model_admin):
+        return [(grade, grade) for grade in GRADE_CHOICES]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(grade_value=self.value())
+        return queryset
+
+
 # ==================================================
 # 📝 STUDENT MARK ADMIN CONFIGURATION
 # ==================================================
@@ -62,8 +78,11 @@ class StudentMarkAdmin(admin.ModelAdmin):
         'exam_name',
         'subject__class_name',
         'subject',
+        GradeListFilter,
     )
 
+    list_select_related = ('student', 'subject', 'uploaded_by')
+
     # -----------------------------
     # Search bar
     # -----------------------------
@@ -97,13 +116,21 @@ class StudentMarkAdmin(admin.ModelAdmin):
         'updated_at',
     )
 
+    # -----------------------------
+    # Percentage / grade SQL me (sortable + filterable)
+    # -----------------------------
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_grade()
+
     # -----------------------------
     # Custom display methods
     # -----------------------------
     def percentage_display(self, obj):
-        return f"{obj.percentage()} %"
+        return f"{obj.percent_value} %"
     percentage_display.short_description = "Percentage"
+    percentage_display.admin_order_field = "percent_value"
 
     def grade_display(self, obj):
-        return obj.grade()
+        return obj.grade_value
     grade_display.short_description = "Grade"
+    grade_display.admin_order_field = "percent_value"
@@ -0,0 +1,273 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from .models import GRADE_THRESHOLDS as MODEL_GRADE_THRESHOLDS
+from .models import StudentMark, Subject
+
+
+# StudentMark.grade() wale thresholds (percentage >= threshold), ascending
+GRADE_THRESHOLDS = np.array([threshold for threshold, _ in reversed(MODEL_GRADE_THRESHOLDS)])
+GRADE_LABELS = ("Fail",) + tuple(label for _, label in reversed(MODEL_GRADE_THRESHOLDS))
+
+PERCENTILES = (25, 75, 90)
+
+
+class MarksFrame(NamedTuple):
+    """
+    Column arrays – har index ek StudentMark row
+    """
+    student_ids: np.ndarray
+    subject_ids: np.ndarray
+    exam_names: np.ndarray
+    obtained: np.ndarray
+    total: np.ndarray
+
+    @property
+    def size(self):
+        return len(self.student_ids)
+
+    @property
+    def percentages(self):
+        return percentages(self.obtained, self.total)
+
+
+class SubjectStats(NamedTuple):
+    exam_name: str
+    subject_id: int
+    subject_name: str
+    count: int
+    mean: float
+    median: float
+    std: float
+    minimum: float
+    maximum: float
+    p25: float
+    p75: float
+    p90: float
+    grades: dict
+
+
+class StudentRank(NamedTuple):
+    exam_name: str
+    student_id: int
+    obtained: int
+    total: int
+    percentage: float
+    grade: str
+    rank: int
+
+
+# ==================================================
+# 📥 LOAD (values_list → NumPy, model instances nahi)
+# ==================================================
+def load_marks(class_name=None, section=None, exam_name=None):
+    """
+    Entered marks (marks_obtained NOT NULL, total_marks > 0) ko
+    column arrays me load karta hai – ek query
+    """
+
+    marks = StudentMark.objects.filter(
+        marks_obtained__isnull=False,
+        total_marks__gt=0,
+    )
+
+    if class_name:
+        marks = marks.filter(subject__class_name=class_name)
+
+    if section:
+        marks = marks.filter(student__student_profile__section=section)
+
+    if exam_name:
+        marks = marks.filter(exam_name=exam_name)
+
+    rows = list(
+        marks.order_by().values_list(
+            'student_id',
+            'subject_id',
+            'exam_name',
+            'marks_obtained',
+            'total_marks',
+        )
+    )
+
+    if not rows:
+        return MarksFrame(
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+            np.array([], dtype=object),
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+        )
+
+    student_ids, subject_ids, exam_names, obtained, total = zip(*rows)
+    return MarksFrame(
+        np.array(student_ids, dtype=np.int64),
+        np.array(subject_ids, dtype=np.int64),
+        np.array(exam_names, dtype=object),
+        np.array(obtained, dtype=np.int64),
+        np.array(total, dtype=np.int64),
+    )
+
+
+# ==================================================
+# 🔢 VECTORIZED HELPERS
+# ==================================================
+def percentages(obtained, total):
+    """
+    StudentMark.percentage() ka vectorized version (2 decimals)
+    """
+    obtained = np.asarray(obtained, dtype=np.float64)
+    total = np.asarray(total, dtype=np.float64)
+
+    result = np.zeros_like(obtained)
+    np.divide(obtained, total, out=result, where=total > 0)
+    return np.round(result * 100, 2)
+
+
+def grade_indexes(percent):
+    """
+    0 = Fail, 1 = C, 2 = B, 3 = A, 4 = A+
+    """
+    return np.searchsorted(GRADE_THRESHOLDS, percent, side='right')
+
+
+def grades(percent):
+    return np.array(GRADE_LABELS, dtype=object)[grade_indexes(percent)]
+
+
+def grade_histogram(percent):
+    counts = np.bincount(grade_indexes(percent), minlength=len(GRADE_LABELS))
+    return dict(zip(GRADE_LABELS, counts.tolist()))
+
+
+def competition_ranks(scores):
+    """
+    Highest score = rank 1; barabar score → same rank (1, 2, 2, 4)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    descending = np.sort(scores)[::-1]
+    return np.searchsorted(-descending, -scores, side='left') + 1
+
+
+def _groups(*keys):
+    """
+    Multiple key columns → (unique key tuples, group index per row)
+    """
+    codes = []
+    uniques = []
+    for key in keys:
+        values, inverse = np.unique(key, return_inverse=True)
+        uniques.append(values)
+        codes.append(inverse)
+
+    combined = np.ravel_multi_index(codes, [len(u) for u in uniques])
+    group_codes, index = np.unique(combined, return_inverse=True)
+
+    group_keys = [
+        tuple(u[i] for u, i in zip(uniques, np.unravel_index(code, [len(u) for u in uniques])))
+        for code in group_codes
+    ]
+    return group_keys, index
+
+
+# ==================================================
+# 📊 PER EXAM / SUBJECT STATISTICS
+# ==================================================
+def subject_stats(frame):
+    """
+    Har (exam, subject) ke percentage stats + grade histogram
+    """
+
+    if frame.size == 0:
+        return []
+
+    percent = frame.percentages
+    group_keys, index = _groups(frame.exam_names, frame.subject_ids)
+
+    subject_names = dict(
+        Subject.objects
+        .filter(id__in=np.unique(frame.subject_ids).tolist())
+        .values_list('id', 'name')
+    )
+
+    # Group-wise contiguous slices: group ke andar percentage sorted
+    order = np.lexsort((percent, index))
+    sorted_percent = percent[order]
+    boundaries = np.flatnonzero(np.diff(index[order])) + 1
+
+    results = []
+    for (exam_name, subject_id), values in zip(
+        group_keys, np.split(sorted_percent, boundaries)
+    ):
+        p25, p75, p90 = np.percentile(values, PERCENTILES)
+        results.append(SubjectStats(
+            exam_name=str(exam_name),
+            subject_id=int(subject_id),
+            subject_name=subject_names.get(int(subject_id), ''),
+            count=len(values),
+            mean=round(float(values.mean()), 2),
+            median=round(float(np.median(values)), 2),
+            std=round(float(values.std()), 2),
+            minimum=float(values[0]),
+            maximum=float(values[-1]),
+            p25=round(float(p25), 2),
+            p75=round(float(p75), 2),
+            p90=round(float(p90), 2),
+            grades=grade_histogram(values),
+        ))
+
+    return results
+
+
+# ==================================================
+# 🏆 PER EXAM STUDENT RANKING
+# ==================================================
+def exam_ranks(frame):
+    """
+    Har exam me har student ka total (saare subjects), percentage,
+    grade aur rank. Sorted: exam, phir rank.
+    """
+
+    if frame.size == 0:
+        return []
+
+    group_keys, index = _groups(frame.exam_names, frame.student_ids)
+
+    obtained = np.bincount(index, weights=frame.obtained).astype(np.int64)
+    total = np.bincount(index, weights=frame.total).astype(np.int64)
+    percent = percentages(obtained, total)
+    labels = grades(percent)
+
+    exams = np.array([key[0] for key in group_keys], dtype=object)
+    ranks = np.zeros(len(group_keys), dtype=np.int64)
+    for exam_name in np.unique(exams):
+        in_exam = exams == exam_name
+        ranks[in_exam] = competition_ranks(percent[in_exam])
+
+    results = [
+        StudentRank(
+            exam_name=str(exam_name),
+            student_id=int(student_id),
+            obtained=int(obtained[i]),
+            total=int(total[i]),
+            percentage=float(percent[i]),
+            grade=str(labels[i]),
+            rank=int(ranks[i]),
+        )
+        for i, (exam_name, student_id) in enumerate(group_keys)
+    ]
+
+    results.sort(key=lambda row: (row.exam_name, row.rank, row.student_id))
+    return results
+
+
+def toppers(ranks, limit=3):
+    """
+    exam_ranks() result se har exam ke top `limit` ranks
+    """
+    top = {}
+    for row in ranks:
+        if row.rank <= limit:
+            top.setdefault(row.exam_name, []).append(row)
+    return top
@@ -0,0 +1,344 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.http import quote_etag
+from rest_framework import generics, status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.models import StudentProfile
+from accounts.utils import is_ascii_digits
+from .models import StudentMark, Subject
+from .permissions import IsTeacher
+from .serializers import (
+    StudentMarkBulkItemSerializer,
+    StudentMarkSerializer,
+    optimize_queryset,
+    selected_fields,
+)
+from .services import mark_key, upsert_marks
+
+
+BULK_MAX_ITEMS = 500
+
+
+class MarkCursorPagination(CursorPagination):
+    """
+    Cursor pagination – OFFSET nahi, naye rows aane par page shift nahi
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('-id',)
+
+
+# ==================================================
+# 🔐 ROLE SCOPING (HTML views jaisa)
+# ==================================================
+def teacher_scope(user):
+    """
+    (assigned_class, assigned_section) ya None
+    """
+    profile = getattr(user, 'teacher_profile', None)
+    if not profile or not profile.assigned_class:
+        return None
+    return profile.assigned_class, profile.assigned_section
+
+
+def scoped_marks(user):
+    """
+    - STUDENT: sirf apne marks
+    - TEACHER: assigned class + section
+    - ADMIN: sab
+    """
+    marks = StudentMark.objects.all()
+    role = getattr(user, 'role', None)
+
+    if role == 'STUDENT':
+        return marks.filter(student=user)
+
+    if role == 'TEACHER':
+        scope = teacher_scope(user)
+        if scope is None:
+            return marks.none()
+        class_name, section = scope
+        return marks.filter(
+            subject__class_name=class_name,
+            student__student_profile__student_class=class_name,
+            student__student_profile__section=section,
+        )
+
+    if role == 'ADMIN':
+        return marks
+
+    return marks.none()
+
+
+def filter_marks(marks, params):
+    """
+    ?exam= ?subject= ?student=
+    """
+    if params.get('exam'):
+        marks = marks.filter(exam_name=params['exam'])
+
+    if is_ascii_digits(params.get('subject', '')):
+        marks = marks.filter(subject_id=params['subject'])
+
+    if is_ascii_digits(params.get('student', '')):
+        marks = marks.filter(student_id=params['student'])
+
+    return marks
+
+
+class MarkPermissionMixin:
+    """
+    Read: koi bhi logged-in user (queryset role se scoped)
+    Write: sirf TEACHER
+    """
+
+    def get_permissions(self):
+        if self.request.method in SAFE_METHODS:
+            return [IsAuthenticated()]
+        return [IsTeacher()]
+
+
+# ==================================================
+# 🏷️ ETAG HELPERS
+# ==================================================
+def make_etag(*parts):
+    raw = ':'.join(str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+
+def not_modified(request, etag):
+    """
+    If-None-Match match kare to 304 (body / serialization nahi)
+    """
+    header = request.headers.get('If-None-Match', '')
+    candidates = [value.strip() for value in header.split(',')]
+
+    if etag in candidates or '*' in candidates:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        return response
+    return None
+
+
+# ==================================================
+# 📋 LIST + CREATE  /api/v1/marks/
+# ==================================================
+class MarkListCreateAPI(MarkPermissionMixin, generics.ListCreateAPIView):
+    """
+    GET: scoped marks, cursor paginated, ?fields= sparse fieldset,
+         ETag = (count, max updated_at, query) – unchanged → 304
+    POST: single mark (teacher ki class / section)
+    """
+
+    serializer_class = StudentMarkSerializer
+    pagination_class = MarkCursorPagination
+
+    def get_fields(self):
+        if self.request.method in SAFE_METHODS:
+            return selected_fields(self.request.query_params.get('fields'))
+        return None
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        return filter_marks(scoped_marks(self.request.user), self.request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        marks = self.get_queryset()
+
+        # ⚡ Ek aggregate query – change / delete dono pakadta hai
+        state = marks.order_by().aggregate(count=Count('id'), changed=Max('updated_at'))
+        etag = make_etag(
+            request.version,
+            request.user.pk,
+            request.get_full_path(),
+            state['count'],
+            state['changed'],
+        )
+
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        page = self.paginate_queryset(optimize_queryset(marks, self.get_fields()))
+        serializer = self.get_serializer(page, many=True)
+
+        response = self.get_paginated_response(serializer.data)
+        response['ETag'] = etag
+        return response
+
+    def perform_create(self, serializer):
+        check_write_scope(
+            self.request.user,
+            serializer.validated_data['student'].id,
+            serializer.validated_data['subject'].id,
+        )
+        serializer.save(uploaded_by=self.request.user)
+
+
+# ==================================================
+# 🔎 DETAIL / UPDATE  /api/v1/marks/<id>/
+# ==================================================
+class MarkDetailAPI(MarkPermissionMixin, generics.RetrieveUpdateAPIView):
+    """
+    GET: ETag = (id, updated_at) – unchanged → 304
+    PUT / PATCH: teacher ki class / section ke marks
+    """
+
+    serializer_class = StudentMarkSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        if self.request.method in SAFE_METHODS:
+            kwargs.setdefault(
+                'fields',
+                selected_fields(self.request.query_params.get('fields'))
+            )
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        return scoped_marks(self.request.user).select_related('student', 'subject')
+
+    def retrieve(self, request, *args, **kwargs):
+        mark = self.get_object()
+        etag = make_etag(request.version, mark.pk, mark.updated_at.isoformat())
+
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        response = Response(self.get_serializer(mark).data)
+        response['ETag'] = etag
+        return response
+
+    def perform_update(self, serializer):
+        data = serializer.validated_data
+        check_write_scope(
+            self.request.user,
+            data.get('student', serializer.instance.student).id,
+            data.get('subject', serializer.instance.subject).id,
+        )
+        serializer.save(uploaded_by=self.request.user)
+
+
+# ==================================================
+# 📦 BULK UPSERT  /api/v1/marks/bulk/
+# ==================================================
+class MarkBulkAPI(APIView):
+    """
+    POST [ {student, subject, exam_name, marks_obtained, total_marks}, ... ]
+
+    - Poori list ek request me validate (all-or-nothing)
+    - Students / subjects ek-ek query me resolve + scope check
+    - Valid list → ek INSERT ... ON CONFLICT DO UPDATE (marks.services)
+    - 400: errors list input ke index ke saath aligned
+    """
+
+    permission_classes = [IsTeacher]
+
+    def post(self, request, *args, **kwargs):
+        if not isinstance(request.data, list) or not request.data:
+            return Response(
+                {'detail': "Expected a non-empty list of marks."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(request.data) > BULK_MAX_ITEMS:
+            return Response(
+                {'detail': f"At most {BULK_MAX_ITEMS} marks per request."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = StudentMarkBulkItemSerializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        items = serializer.validated_data
+        students, subjects = allowed_targets(
+            request.user,
+            {item['student'] for item in items},
+            {item['subject'] for item in items},
+        )
+
+        errors = []
+        seen = set()
+        marks = []
+        for item in items:
+            mark = StudentMark(uploaded_by=request.user, **{
+                'student_id': item['student'],
+                'subject_id': item['subject'],
+                'exam_name': item.get('exam_name', 'Unit Test'),
+                'marks_obtained': item['marks_obtained'],
+                'total_marks': item['total_marks'],
+            })
+
+            item_errors = {}
+            if mark.student_id not in students:
+                item_errors['student'] = ["Student is not in your assigned class / section."]
+            if mark.subject_id not in subjects:
+                item_errors['subject'] = ["Subject is not taught in your assigned class."]
+            if mark_key(mark) in seen:
+                item_errors['non_field_errors'] = ["Duplicate student / subject / exam in request."]
+
+            seen.add(mark_key(mark))
+            errors.append(item_errors)
+            marks.append(mark)
+
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        inserted, updated = upsert_marks(marks)
+
+        return Response(
+            {'inserted': len(inserted), 'updated': len(updated)},
+            status=status.HTTP_201_CREATED if inserted else status.HTTP_200_OK
+        )
+
+
+# ==================================================
+# 🔐 WRITE SCOPE
+# ==================================================
+def allowed_targets(teacher, student_ids, subject_ids):
+    """
+    Teacher sirf apni assigned class + section ke students aur
+    class ke subjects ke marks likh sakta hai.
+    Returns (allowed student ids, allowed subject ids) – 2 queries.
+    """
+
+    scope = teacher_scope(teacher)
+    if scope is None:
+        raise PermissionDenied("Teacher profile / assigned class not found.")
+
+    class_name, section = scope
+
+    students = set(
+        StudentProfile.objects
+        .filter(
+            user_id__in=student_ids,
+            user__role='STUDENT',
+            student_class=class_name,
+            section=section,
+        )
+        .values_list('user_id', flat=True)
+    )
+    subjects = set(
+        Subject.objects
+        .filter(id__in=subject_ids, class_name=class_name)
+        .values_list('id', flat=True)
+    )
+
+    return students, subjects
+
+
+def check_write_scope(teacher, student_id, subject_id):
+    students, subjects = allowed_targets(teacher, [student_id], [subject_id])
+    if not students or not subjects:
+        raise PermissionDenied("Student / subject is outside your assigned class.")
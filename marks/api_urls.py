@@ -0,0 +1,16 @@
+from django.urls import path
+
+from .api import MarkBulkAPI, MarkDetailAPI, MarkListCreateAPI
+
+app_name = 'marks_api'
+
+urlpatterns = [
+    # 📋 List (cursor) + single create
+    path('', MarkListCreateAPI.as_view(), name='list'),
+
+    # 📦 Bulk upsert
+    path('bulk/', MarkBulkAPI.as_view(), name='bulk'),
+
+    # 🔎 Detail / update
+    path('<int:pk>/', MarkDetailAPI.as_view(), name='detail'),
+]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Case, FloatField, Value, When
+from django.db.models.functions import Cast, Round
 from django.core.exceptions import ValidationError
 from django.conf import settings
 
@@ -30,6 +32,71 @@ class Subject(models.Model):
         return f"{self.name} (Class {self.class_name})"
 
 
+# ==================================================
+# GRADES
+# ==================================================
+# StudentMark.grade() wale thresholds, upar se neeche
+# (percentage >= threshold → label, warna "Fail")
+GRADE_THRESHOLDS = (
+    (90, 'A+'),
+    (75, 'A'),
+    (60, 'B'),
+    (40, 'C'),
+)
+
+GRADE_CHOICES = [label for _, label in GRADE_THRESHOLDS] + ['Fail']
+
+
+# ==================================================
+# STUDENT MARK QUERYSET (DB-SIDE PERCENTAGE / GRADE)
+# ==================================================
+class StudentMarkQuerySet(models.QuerySet):
+    """
+    StudentMark.percentage() / grade() ke SQL versions, taaki
+    sort / filter database me ho sake:
+
+        StudentMark.objects.with_grade().filter(grade_value='A+')
+        StudentMark.objects.with_percentage().order_by('-percent_value')
+    """
+
+    def with_percentage(self):
+        """
+        percent_value = round((obtained / total) * 100, 2), missing → 0
+        """
+        if 'percent_value' in self.query.annotations:
+            return self
+
+        return self.annotate(
+            percent_value=Case(
+                When(marks_obtained__isnull=True, then=Value(0.0)),
+                When(total_marks__isnull=True, then=Value(0.0)),
+                When(total_marks=0, then=Value(0.0)),
+                default=Round(
+                    Cast('marks_obtained', FloatField())
+                    / Cast('total_marks', FloatField())
+                    * Value(100.0),
+                    precision=2
+                ),
+                output_field=FloatField(),
+            )
+        )
+
+    def with_grade(self):
+        """
+        grade_value = 'A+' / 'A' / 'B' / 'C' / 'Fail' (percent_value se)
+        """
+        return self.with_percentage().annotate(
+            grade_value=Case(
+                *[
+                    When(percent_value__gte=threshold, then=Value(label))
+                    for threshold, label in GRADE_THRESHOLDS
+                ],
+                default=Value('Fail'),
+                output_field=models.CharField(),
+            )
+        )
+
+
 # ==================================================
 # STUDENT MARK MODEL
 # ==================================================
@@ -80,6 +147,8 @@ class StudentMark(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StudentMarkQuerySet.as_manager()
+
     # ==================================================
     # Helper Methods
     # ==================================================
@@ -0,0 +1,120 @@
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+
+# Isse chhote batch ke liye process pool start karna mehenga padta hai
+PARALLEL_RENDER_THRESHOLD = 8
+
+
+# ==================================================
+# 🖨️ REPORT CARD PAGE (fees.views.fee_receipt jaisa ReportLab layout)
+# ==================================================
+# Note: is module me Django imports nahi hain – process pool workers
+# sirf plain ReportCard tuples receive karte hain.
+def draw_report_card(p, card):
+    """
+    Ek ReportCard ko canvas ke current page par draw karta hai
+    """
+
+    width, height = A4
+
+    p.setFont("Helvetica-Bold", 16)
+    p.drawCentredString(width / 2, height - 50, "VIDHYA SETU SCHOOL")
+
+    p.setFont("Helvetica", 12)
+    p.drawCentredString(width / 2, height - 80, f"Report Card - {card.exam_name}")
+
+    y = height - 130
+    p.setFont("Helvetica", 11)
+
+    p.drawString(80, y, f"Student Name: {card.full_name or card.username}")
+    y -= 20
+    p.drawString(80, y, f"Username: {card.username}")
+    y -= 20
+    p.drawString(80, y, f"Class: {card.student_class}   Section: {card.section}")
+    y -= 20
+    p.drawString(80, y, f"Roll No: {card.roll_no if card.roll_no is not None else '-'}")
+
+    # -----------------------------
+    # 📚 SUBJECT TABLE
+    # -----------------------------
+    y -= 40
+    p.setFont("Helvetica-Bold", 11)
+    p.drawString(80, y, "Subject")
+    p.drawString(280, y, "Marks")
+    p.drawString(380, y, "Percentage")
+    p.drawString(480, y, "Grade")
+    p.line(80, y - 8, width - 80, y - 8)
+
+    p.setFont("Helvetica", 11)
+    for subject in card.subjects:
+        y -= 25
+        p.drawString(80, y, subject.name)
+        p.drawString(280, y, f"{subject.obtained} / {subject.total}")
+        p.drawString(380, y, f"{subject.percentage}%")
+        p.drawString(480, y, subject.grade)
+
+    # -----------------------------
+    # 🧮 TOTAL / RANK
+    # -----------------------------
+    p.line(80, y - 15, width - 80, y - 15)
+    y -= 40
+    p.setFont("Helvetica-Bold", 11)
+    p.drawString(80, y, f"Total: {card.obtained} / {card.total}")
+    y -= 20
+    p.drawString(80, y, f"Percentage: {card.percentage}%")
+    y -= 20
+    p.drawString(80, y, f"Grade: {card.grade}")
+    y -= 20
+    p.drawString(80, y, f"Rank in Section: {card.rank} of {card.section_size}")
+
+    p.setFont("Helvetica", 11)
+    p.drawString(80, y - 50, "This is a system-generated report card.")
+
+
+def render_report_card(card):
+    """
+    Single student ka PDF (bytes)
+    """
+    buffer = io.BytesIO()
+
+    p = canvas.Canvas(buffer, pagesize=A4)
+    draw_report_card(p, card)
+    p.showPage()
+    p.save()
+
+    return buffer.getvalue()
+
+
+def render_report_cards(cards, workers=1):
+    """
+    Har card ka alag PDF – bade batch ko ProcessPoolExecutor me
+    saare cores par render karo. Order same rehta hai.
+    """
+
+    cards = list(cards)
+
+    if workers == 1 or len(cards) < PARALLEL_RENDER_THRESHOLD:
+        return [render_report_card(card) for card in cards]
+
+    chunksize = max(1, len(cards) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_report_card, cards, chunksize=chunksize))
+
+
+def write_merged_pdf(cards, fileobj):
+    """
+    Saare cards ek hi PDF me (ek page per student).
+    Ek canvas par seedha likha jaata hai – alag PDFs ko
+    merge karne ke liye koi extra library nahi chahiye.
+    """
+    p = canvas.Canvas(fileobj, pagesize=A4)
+
+    for card in cards:
+        draw_report_card(p, card)
+        p.showPage()
+
+    p.save()
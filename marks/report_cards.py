@@ -0,0 +1,226 @@
+import os
+import tempfile
+import zipfile
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.db.models import F, FloatField, Sum, Value, Window
+from django.db.models.functions import Cast, Rank, Round
+
+from accounts.models import StudentProfile
+from .models import GRADE_THRESHOLDS, StudentMark
+from .pdf import render_report_cards, write_merged_pdf
+
+
+class SubjectResult(NamedTuple):
+    name: str
+    obtained: int
+    total: int
+    percentage: float
+    grade: str
+
+
+class ReportCard(NamedTuple):
+    """
+    Ek student ka poora report card – plain data, taaki process
+    pool workers ko pickle karke bheja ja sake
+    """
+    student_id: int
+    username: str
+    full_name: str
+    student_class: str
+    section: str
+    roll_no: Optional[int]
+    exam_name: str
+    subjects: tuple
+    obtained: int
+    total: int
+    percentage: float
+    grade: str
+    rank: int
+    section_size: int
+
+
+def report_card_workers():
+    """
+    settings.REPORT_CARD_WORKERS (default: saare CPU cores)
+    """
+    return getattr(settings, 'REPORT_CARD_WORKERS', None) or os.cpu_count() or 1
+
+
+def grade_for(percent):
+    """
+    StudentMark.grade() wala hi rule, kisi bhi percentage ke liye
+    """
+    for threshold, label in GRADE_THRESHOLDS:
+        if percent >= threshold:
+            return label
+    return "Fail"
+
+
+def _entered_marks(class_name, exam_name):
+    """
+    Sirf entered marks (marks_obtained NOT NULL, total_marks > 0)
+    """
+    return StudentMark.objects.filter(
+        exam_name=exam_name,
+        subject__class_name=class_name,
+        student__student_profile__student_class=class_name,
+        marks_obtained__isnull=False,
+        total_marks__gt=0,
+    )
+
+
+# ==================================================
+# 🏆 SECTION RANKS (WINDOW FUNCTION – 1 QUERY PER SECTION)
+# ==================================================
+def section_ranks(class_name, section, exam_name):
+    """
+    Section ke har student ka total / percentage aur RANK()
+    (barabar percentage → same rank: 1, 2, 2, 4) – DB me hi
+    GROUP BY + window function, ek query.
+    """
+
+    percent = Round(
+        Cast(Sum('marks_obtained'), FloatField())
+        / Cast(Sum('total_marks'), FloatField())
+        * Value(100.0),
+        precision=2
+    )
+
+    return list(
+        _entered_marks(class_name, exam_name)
+        .filter(student__student_profile__section=section)
+        .order_by()
+        .values(
+            'student_id',
+            'student__username',
+            'student__student_profile__first_name',
+            'student__student_profile__middle_name',
+            'student__student_profile__last_name',
+            'student__student_profile__roll_no',
+        )
+        .annotate(
+            obtained=Sum('marks_obtained'),
+            total=Sum('total_marks'),
+            percent=percent,
+        )
+        .annotate(
+            rank=Window(Rank(), order_by=F('percent').desc()),
+        )
+        .order_by('rank', 'student__student_profile__roll_no', 'student_id')
+    )
+
+
+# ==================================================
+# 📋 BUILD REPORT CARDS (CLASS / SECTION)
+# ==================================================
+def build_report_cards(class_name, exam_name, section=None):
+    """
+    Report card data for a class (optionally ek section)
+
+    - Sections ki list: 1 query
+    - Har section ke ranks: 1 window query per section
+    - Saare subject marks (percentage + grade SQL me): 1 query
+    - Returns list[ReportCard] – section, phir rank order me
+    """
+
+    if section:
+        sections = [section]
+    else:
+        sections = list(
+            StudentProfile.objects
+            .filter(student_class=class_name)
+            .exclude(section__isnull=True)
+            .order_by('section')
+            .values_list('section', flat=True)
+            .distinct()
+        )
+
+    ranked = {sec: section_ranks(class_name, sec, exam_name) for sec in sections}
+
+    subjects = {}
+    subject_rows = (
+        _entered_marks(class_name, exam_name)
+        .filter(student__student_profile__section__in=sections)
+        .with_grade()
+        .order_by('student_id', 'subject__name')
+        .values_list(
+            'student_id',
+            'subject__name',
+            'marks_obtained',
+            'total_marks',
+            'percent_value',
+            'grade_value',
+        )
+    )
+    for student_id, *result in subject_rows:
+        subjects.setdefault(student_id, []).append(SubjectResult(*result))
+
+    cards = []
+    for sec in sections:
+        rows = ranked[sec]
+        for row in rows:
+            full_name = " ".join(
+                part for part in (
+                    row['student__student_profile__first_name'],
+                    row['student__student_profile__middle_name'],
+                    row['student__student_profile__last_name'],
+                ) if part
+            )
+            cards.append(ReportCard(
+                student_id=row['student_id'],
+                username=row['student__username'],
+                full_name=full_name,
+                student_class=class_name,
+                section=sec,
+                roll_no=row['student__student_profile__roll_no'],
+                exam_name=exam_name,
+                subjects=tuple(subjects.get(row['student_id'], ())),
+                obtained=row['obtained'],
+                total=row['total'],
+                percentage=row['percent'],
+                grade=grade_for(row['percent']),
+                rank=row['rank'],
+                section_size=len(rows),
+            ))
+
+    return cards
+
+
+# ==================================================
+# 📦 OUTPUT (TEMP FILE → FileResponse stream)
+# ==================================================
+def card_filename(card):
+    roll = f"{card.roll_no:03d}" if card.roll_no is not None else "000"
+    return f"{card.student_class}{card.section}/{roll}_{card.username}.pdf"
+
+
+def build_report_cards_zip(cards, workers=None):
+    """
+    Har student ka alag PDF (process pool me render) ek zip me.
+    Returns an open temp file (rewound).
+    """
+
+    pdfs = render_report_cards(cards, workers=workers or report_card_workers())
+
+    tmp = tempfile.TemporaryFile()
+    # PDFs already compressed hain – ZIP_STORED
+    with zipfile.ZipFile(tmp, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for card, pdf in zip(cards, pdfs):
+            archive.writestr(card_filename(card), pdf)
+
+    tmp.seek(0)
+    return tmp
+
+
+def build_report_cards_pdf(cards):
+    """
+    Saare report cards ek merged PDF me (ek page per student).
+    Returns an open temp file (rewound).
+    """
+
+    tmp = tempfile.TemporaryFile()
+    write_merged_pdf(cards, tmp)
+    tmp.seek(0)
+    return tmp
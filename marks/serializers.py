@@ -3,6 +3,33 @@ from .models import StudentMark
 
 
 class StudentMarkSerializer(serializers.ModelSerializer):
+    """
+    Marks API serializer
+
+    - ?fields=id,exam_name,... → sparse fieldset (baaki fields drop)
+    - student_username / subject_name read-only (select_related se)
+    """
+
+    student_username = serializers.CharField(source='student.username', read_only=True)
+    subject_name = serializers.CharField(source='subject.name', read_only=True)
+    percentage = serializers.FloatField(read_only=True)
+    grade = serializers.CharField(read_only=True)
+
+    # API field → model columns (only() / select_related ke liye)
+    FIELD_COLUMNS = {
+        'id': ('id',),
+        'student': ('student',),
+        'subject': ('subject',),
+        'exam_name': ('exam_name',),
+        'marks_obtained': ('marks_obtained',),
+        'total_marks': ('total_marks',),
+        'student_username': ('student__username',),
+        'subject_name': ('subject__name',),
+        'percentage': ('marks_obtained', 'total_marks'),
+        'grade': ('marks_obtained', 'total_marks'),
+        'updated_at': ('updated_at',),
+    }
+
     class Meta:
         model = StudentMark
         fields = [
@@ -12,11 +39,84 @@ class StudentMarkSerializer(serializers.ModelSerializer):
             'exam_name',
             'marks_obtained',
             'total_marks',
+            'student_username',
+            'subject_name',
+            'percentage',
+            'grade',
+            'updated_at',
         ]
+        read_only_fields = ['updated_at']
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
     def validate(self, data):
-        if data['marks_obtained'] > data['total_marks']:
+        # Partial update me missing values instance se
+        obtained = data.get('marks_obtained', getattr(self.instance, 'marks_obtained', None))
+        total = data.get('total_marks', getattr(self.instance, 'total_marks', None))
+
+        if obtained is not None and total is not None and obtained > total:
             raise serializers.ValidationError(
                 "Obtained marks total marks se zyada nahi ho sakte"
             )
         return data
+
+
+def selected_fields(requested):
+    """
+    ?fields=a,b,c → valid serializer field names (ya None = sab)
+    """
+    if not requested:
+        return None
+
+    names = [name.strip() for name in requested.split(',')]
+    return [name for name in names if name in StudentMarkSerializer.FIELD_COLUMNS] or None
+
+
+def optimize_queryset(queryset, fields=None):
+    """
+    Sirf requested fields ke columns load karo – select_related sirf
+    tab jab username / subject name chahiye (fixed queries per page)
+    """
+    fields = fields or list(StudentMarkSerializer.FIELD_COLUMNS)
+
+    columns = {'id'}
+    for name in fields:
+        columns.update(StudentMarkSerializer.FIELD_COLUMNS[name])
+
+    related = [
+        relation for relation in ('student', 'subject')
+        if any(column.startswith(f'{relation}__') for column in columns)
+    ]
+
+    # FK traverse ho raha ho to FK column bhi load hona chahiye
+    columns.update(related)
+
+    return queryset.select_related(*related).only(*columns)
+
+
+class StudentMarkBulkItemSerializer(StudentMarkSerializer):
+    """
+    Bulk POST ka ek item – student / subject sirf ids (bulk API
+    saare ids ek-ek query me resolve karta hai, per-item lookup nahi).
+    Unique validator nahi: existing (student, subject, exam) update hota hai.
+    """
+
+    student = serializers.IntegerField(min_value=1)
+    subject = serializers.IntegerField(min_value=1)
+    marks_obtained = serializers.IntegerField(min_value=0)
+    total_marks = serializers.IntegerField(min_value=1)
+
+    class Meta(StudentMarkSerializer.Meta):
+        fields = [
+            'student',
+            'subject',
+            'exam_name',
+            'marks_obtained',
+            'total_marks',
+        ]
+        validators = []
@@ -0,0 +1,173 @@
+from typing import NamedTuple
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from accounts.utils import is_ascii_digits
+from .models import StudentMark
+
+
+# bulk_create full_clean nahi chalata – model wali limit yahin check
+EXAM_NAME_MAX_LENGTH = StudentMark._meta.get_field('exam_name').max_length
+
+
+class MarkRowError(NamedTuple):
+    student_id: int
+    username: str
+    value: str
+    message: str
+
+
+class BulkMarksResult(NamedTuple):
+    inserted: list
+    updated: list
+    errors: list
+
+    @property
+    def saved_count(self):
+        return len(self.inserted) + len(self.updated)
+
+
+# ==================================================
+# 🔍 SHEET VALIDATION (IN MEMORY, NO QUERIES)
+# ==================================================
+def validate_marks_sheet(rows, total_marks):
+    """
+    rows: [(student_user, raw_marks_value), ...]
+
+    - Blank value = marks enter nahi kiye (skip, error nahi)
+    - Non-numeric / negative / total se zyada = per-row error
+    - Returns (valid {student: marks}, errors [MarkRowError])
+    """
+
+    valid = {}
+    errors = []
+
+    for student, raw_value in rows:
+        value = (raw_value or '').strip()
+
+        if not value:
+            continue
+
+        if getattr(student, 'role', None) != 'STUDENT':
+            message = "Marks can only be assigned to students."
+        elif not is_ascii_digits(value):
+            message = "Marks must be a whole number."
+        elif int(value) > total_marks:
+            message = "Obtained marks cannot be greater than total marks."
+        else:
+            valid[student] = int(value)
+            continue
+
+        errors.append(
+            MarkRowError(student.id, student.username, value, message)
+        )
+
+    return valid, errors
+
+
+def clean_exam_name(exam_name):
+    """
+    Blank / EXAM_NAME_MAX_LENGTH se lamba → ValidationError
+    """
+    exam_name = (exam_name or '').strip()
+
+    if not exam_name:
+        raise ValidationError("Exam name is required.")
+
+    if len(exam_name) > EXAM_NAME_MAX_LENGTH:
+        raise ValidationError(
+            f"Exam name cannot be longer than {EXAM_NAME_MAX_LENGTH} characters."
+        )
+
+    return exam_name
+
+
+# ==================================================
+# ⚡ BULK MARKS UPSERT (ONE STATEMENT, ONE TRANSACTION)
+# ==================================================
+def bulk_upsert_marks(uploaded_by, subject, exam_name, total_marks, rows):
+    """
+    Bulk Marks Ingestion
+    --------------------
+    - exam_name + poori sheet pehle memory me validate hoti hai
+    - Teacher role check sirf ek baar
+    - Valid rows ek INSERT ... ON CONFLICT (student, subject, exam_name)
+      DO UPDATE statement me save hote hain
+    - Invalid rows skip nahi, BulkMarksResult.errors me wapas aate hain
+    """
+
+    if getattr(uploaded_by, 'role', None) != 'TEACHER':
+        raise ValidationError("Marks can only be uploaded by a teacher.")
+
+    if not total_marks or total_marks <= 0:
+        raise ValidationError("Total marks must be a positive number.")
+
+    exam_name = clean_exam_name(exam_name)
+
+    valid, errors = validate_marks_sheet(rows, total_marks)
+
+    if not valid:
+        return BulkMarksResult(inserted=[], updated=[], errors=errors)
+
+    inserted, updated = upsert_marks([
+        StudentMark(
+            student=student,
+            subject=subject,
+            exam_name=exam_name,
+            marks_obtained=marks,
+            total_marks=total_marks,
+            uploaded_by=uploaded_by,
+        )
+        for student, marks in valid.items()
+    ])
+
+    return BulkMarksResult(
+        inserted=[student_id for student_id, _, _ in inserted],
+        updated=[student_id for student_id, _, _ in updated],
+        errors=errors,
+    )
+
+
+def mark_key(mark):
+    return (mark.student_id, mark.subject_id, mark.exam_name)
+
+
+def upsert_marks(marks):
+    """
+    Unsaved StudentMark objects (har (student, subject, exam) ek baar)
+    → ek INSERT ... ON CONFLICT (student, subject, exam_name) DO UPDATE
+
+    Returns (inserted keys, updated keys),
+    key = (student_id, subject_id, exam_name)
+    """
+
+    keys = [mark_key(mark) for mark in marks]
+    if not keys:
+        return [], []
+
+    with transaction.atomic():
+        # Superset filter (IN lists), exact key match Python me
+        candidates = StudentMark.objects.filter(
+            student_id__in={key[0] for key in keys},
+            subject_id__in={key[1] for key in keys},
+            exam_name__in={key[2] for key in keys},
+        ).values_list('student_id', 'subject_id', 'exam_name')
+        existing = set(candidates) & set(keys)
+
+        StudentMark.objects.bulk_create(
+            marks,
+            update_conflicts=True,
+            unique_fields=['student', 'subject', 'exam_name'],
+            update_fields=[
+                'marks_obtained',
+                'total_marks',
+                'uploaded_by',
+                'updated_at',
+            ],
+        )
+
+    return (
+        [key for key in keys if key not in existing],
+        [key for key in keys if key in existing],
+    )
@@ -1,3 +1,396 @@
+import io
+import zipfile
+
+from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.benchmarks import BenchmarkTestCase
+from accounts.models import StudentProfile, User
+from . import analytics
+from .models import GRADE_CHOICES, Subject, StudentMark
+from .report_cards import build_report_cards, build_report_cards_zip, card_filename
+from .services import bulk_upsert_marks, validate_marks_sheet
+
+
+class StudentMarkAnnotationEquivalenceTests(TestCase):
+    """
+    with_percentage() / with_grade() SQL annotations must agree with
+    the Python StudentMark.percentage() / grade() methods.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(
+            'teacher', password='x', role='TEACHER'
+        )
+        cls.student = User.objects.create_user(
+            'student', password='x', role='STUDENT'
+        )
+        cls.subject = Subject.objects.create(name='Maths', class_name='5')
+
+        # Every obtained / total combination for common paper sizes,
+        # including all grade boundaries (39/40, 59/60, 74/75, 89/90 %)
+        marks = []
+        for total in (1, 3, 7, 20, 25, 30, 32, 33, 40, 50, 70, 80, 90, 99, 100):
+            for obtained in range(total + 1):
+                marks.append(StudentMark(
+                    student=cls.student,
+                    subject=cls.subject,
+                    exam_name=f"T{total}-{obtained}",
+                    marks_obtained=obtained,
+                    total_marks=total,
+                    uploaded_by=cls.teacher,
+                ))
+
+        # Missing data → 0 % / Fail in Python
+        marks += [
+            StudentMark(student=cls.student, subject=cls.subject,
+                        exam_name='no-marks', marks_obtained=None, total_marks=50),
+            StudentMark(student=cls.student, subject=cls.subject,
+                        exam_name='no-total', marks_obtained=10, total_marks=None),
+            StudentMark(student=cls.student, subject=cls.subject,
+                        exam_name='zero-total', marks_obtained=0, total_marks=0),
+        ]
+        StudentMark.objects.bulk_create(marks)
+
+    def test_percentage_matches_python(self):
+        for mark in StudentMark.objects.with_percentage():
+            # SQL ROUND rounds exact binary ties (e.g. 3.125) half away
+            # from zero, Python half to even → at most one cent apart
+            self.assertAlmostEqual(
+                mark.percent_value, mark.percentage(), delta=0.01 + 1e-9,
+                msg=mark.exam_name
+            )
+
+    def test_grade_matches_python(self):
+        for mark in StudentMark.objects.with_grade():
+            self.assertEqual(mark.grade_value, mark.grade(), mark.exam_name)
+
+    def test_missing_marks_are_zero_and_fail(self):
+        marks = StudentMark.objects.with_grade().filter(
+            exam_name__in=['no-marks', 'no-total', 'zero-total']
+        )
+        self.assertEqual(len(marks), 3)
+        for mark in marks:
+            self.assertEqual(mark.percent_value, 0)
+            self.assertEqual(mark.grade_value, 'Fail')
+
+    def test_filter_by_grade_in_sql(self):
+        marks = list(StudentMark.objects.all())
+
+        for grade in GRADE_CHOICES:
+            expected = sorted(m.id for m in marks if m.grade() == grade)
+            actual = sorted(
+                StudentMark.objects.with_grade()
+                .filter(grade_value=grade)
+                .values_list('id', flat=True)
+            )
+            self.assertEqual(actual, expected, grade)
+
+    def test_filter_by_percentage_in_sql(self):
+        expected = sorted(
+            m.id for m in StudentMark.objects.all() if m.percentage() >= 75
+        )
+        actual = sorted(
+            StudentMark.objects.with_percentage()
+            .filter(percent_value__gte=75)
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(actual, expected)
+
+    def test_order_by_percentage_in_sql(self):
+        ordered = list(
+            StudentMark.objects.with_percentage()
+            .order_by('-percent_value', 'id')
+            .values_list('percent_value', flat=True)
+        )
+        self.assertEqual(ordered, sorted(ordered, reverse=True))
+
+    def test_with_grade_is_chainable(self):
+        qs = StudentMark.objects.with_percentage().with_grade().with_percentage()
+        self.assertEqual(qs.count(), StudentMark.objects.count())
+
+    def test_vectorized_analytics_match_python(self):
+        marks = list(StudentMark.objects.filter(
+            marks_obtained__isnull=False, total_marks__gt=0
+        ))
+        percent = analytics.percentages(
+            [m.marks_obtained for m in marks],
+            [m.total_marks for m in marks],
+        )
+
+        self.assertEqual(percent.tolist(), [m.percentage() for m in marks])
+        self.assertEqual(
+            analytics.grades(percent).tolist(), [m.grade() for m in marks]
+        )
+
+
+class MarksAPITests(TestCase):
+    """
+    /api/v1/marks/: bulk upsert, scoping, sparse fields, ETag
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user('teacher', password='x', role='TEACHER')
+        profile = cls.teacher.teacher_profile
+        profile.assigned_class = '8'
+        profile.assigned_section = 'A'
+        profile.save()
+
+        cls.subject = Subject.objects.create(name='Maths', class_name='8')
+        cls.students = []
+        for i in range(3):
+            student = User.objects.create_user(f's{i}', password='x', role='STUDENT')
+            student.student_profile.student_class = '8'
+            student.student_profile.section = 'A' if i < 2 else 'B'
+            student.student_profile.roll_no = i + 1
+            student.student_profile.save()
+            cls.students.append(student)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.teacher)
+
+    def item(self, student, marks):
+        return {
+            'student': student.id,
+            'subject': self.subject.id,
+            'exam_name': 'Final',
+            'marks_obtained': marks,
+            'total_marks': 100,
+        }
+
+    def test_bulk_post_upserts(self):
+        response = self.client.post(
+            '/api/v1/marks/bulk/',
+            [self.item(s, 50) for s in self.students[:2]],
+            format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {'inserted': 2, 'updated': 0})
+
+        response = self.client.post(
+            '/api/v1/marks/bulk/', [self.item(self.students[0], 70)], format='json'
+        )
+        self.assertEqual(response.json(), {'inserted': 0, 'updated': 1})
+        self.assertEqual(
+            StudentMark.objects.get(student=self.students[0]).marks_obtained, 70
+        )
+
+    def test_bulk_post_is_all_or_nothing(self):
+        response = self.client.post(
+            '/api/v1/marks/bulk/',
+            [self.item(self.students[0], 50), self.item(self.students[2], 50)],
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()[0], {})
+        self.assertIn('student', response.json()[1])
+        self.assertFalse(StudentMark.objects.exists())
+
+    def test_null_marks_do_not_crash_validation(self):
+        response = self.client.post('/api/v1/marks/', {
+            'student': self.students[0].id,
+            'subject': self.subject.id,
+            'exam_name': 'Mid',
+            'marks_obtained': None,
+            'total_marks': None,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+
+    def test_unicode_digit_filters_are_ignored(self):
+        response = self.client.get('/api/v1/marks/', {'subject': '²', 'student': '٣'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_sparse_fields_and_etag(self):
+        self.client.post(
+            '/api/v1/marks/bulk/',
+            [self.item(s, 50) for s in self.students[:2]],
+            format='json'
+        )
+
+        response = self.client.get('/api/v1/marks/?fields=id,marks_obtained')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.json()['results'][0]), {'id', 'marks_obtained'}
+        )
+
+        etag = response['ETag']
+        with self.assertNumQueries(1):
+            cached = self.client.get(
+                '/api/v1/marks/?fields=id,marks_obtained', HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(cached.status_code, 304)
+
+        self.client.post(
+            '/api/v1/marks/bulk/', [self.item(self.students[0], 90)], format='json'
+        )
+        changed = self.client.get(
+            '/api/v1/marks/?fields=id,marks_obtained', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(changed.status_code, 200)
+
+
+class UploadMarksBenchmarkTests(BenchmarkTestCase):
+    """
+    upload_marks: page + poore section ka submit fixed queries me
+    """
+
+    def test_upload_marks_page(self):
+        self.login(self.teacher)
+        with self.assertWithinBudget('upload_marks GET', queries=5, ms=1000):
+            response = self.client.get(reverse('marks:upload_marks'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_upload_marks_submit(self):
+        subject = Subject.objects.filter(class_name='1').first()
+        student_ids = list(
+            StudentProfile.objects
+            .filter(student_class='1', section='A')
+            .values_list('user_id', flat=True)
+        )
+
+        self.login(self.teacher)
+        with self.assertWithinBudget('upload_marks POST', queries=9, ms=1000):
+            response = self.client.post(reverse('marks:upload_marks'), {
+                'subject': subject.id,
+                'exam_name': 'Unit Test',
+                'total_marks': '100',
+                **{f"marks_{student_id}": '77' for student_id in student_ids},
+            })
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            StudentMark.objects.filter(
+                subject=subject, exam_name='Unit Test', marks_obtained=77
+            ).count(),
+            len(student_ids)
+        )
+
+
+class MarksSheetValidationTests(TestCase):
+    """
+    validate_marks_sheet(): unicode digits ('²', '٣') row error hain, crash nahi;
+    bulk_upsert_marks(): exam_name blank / bahut lamba → ValidationError
+    """
+
+    def test_unicode_digits_are_row_errors(self):
+        student = User.objects.create_user('student', password='x', role='STUDENT')
+
+        valid, errors = validate_marks_sheet([(student, '²')], 100)
+        self.assertEqual(valid, {})
+        self.assertEqual([error.message for error in errors], ["Marks must be a whole number."])
+
+        valid, errors = validate_marks_sheet([(student, '٣')], 100)
+        self.assertEqual(valid, {})
+        self.assertEqual(len(errors), 1)
+
+    def test_exam_name_is_validated_before_upsert(self):
+        teacher = User.objects.create_user('teacher', password='x', role='TEACHER')
+        profile = teacher.teacher_profile
+        profile.assigned_class = '8'
+        profile.assigned_section = 'A'
+        profile.save()
+        student = User.objects.create_user('student', password='x', role='STUDENT')
+        student.student_profile.student_class = '8'
+        student.student_profile.section = 'A'
+        student.student_profile.roll_no = 1
+        student.student_profile.save()
+        subject = Subject.objects.create(name='Maths', class_name='8')
+
+        for exam_name in ('', '   ', 'x' * 51):
+            with self.assertRaises(ValidationError):
+                bulk_upsert_marks(teacher, subject, exam_name, 100, [(student, '50')])
+
+        self.client.force_login(teacher)
+        response = self.client.post(reverse('marks:upload_marks'), {
+            'subject': subject.id,
+            'exam_name': 'x' * 51,
+            'total_marks': '100',
+            f'marks_{student.id}': '50',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(StudentMark.objects.exists())
+
+        result = bulk_upsert_marks(teacher, subject, ' Final ', 100, [(student, '50')])
+        self.assertEqual(result.inserted, [student.id])
+        self.assertEqual(StudentMark.objects.get().exam_name, 'Final')
+
+
+class ReportCardTests(TestCase):
+    """
+    build_report_cards(): RANK() ties (1, 2, 2, 4); zip me har student ka ek PDF
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user('teacher', password='x', role='TEACHER')
+        profile = cls.teacher.teacher_profile
+        profile.assigned_class = '8'
+        profile.assigned_section = 'A'
+        profile.save()
+
+        maths = Subject.objects.create(name='Maths', class_name='8')
+        cls.students = []
+        for roll_no, obtained in enumerate((80, 90, 70, 80), start=1):
+            student = User.objects.create_user(f's{roll_no}', password='x', role='STUDENT')
+            student.student_profile.student_class = '8'
+            student.student_profile.section = 'A'
+            student.student_profile.roll_no = roll_no
+            student.student_profile.save()
+            StudentMark.objects.create(
+                student=student, subject=maths, exam_name='Final',
+                marks_obtained=obtained, total_marks=100, uploaded_by=cls.teacher,
+            )
+            cls.students.append(student)
+
+    def test_equal_percentages_share_rank(self):
+        cards = build_report_cards('8', 'Final', section='A')
+
+        self.assertEqual(
+            [(card.username, card.percentage, card.rank) for card in cards],
+            [('s2', 90.0, 1), ('s1', 80.0, 2), ('s4', 80.0, 2), ('s3', 70.0, 4)]
+        )
+        self.assertEqual({card.section_size for card in cards}, {4})
+        self.assertEqual(cards[0].subjects[0].name, 'Maths')
+
+    def test_zip_has_one_pdf_per_student(self):
+        cards = build_report_cards('8', 'Final')
+
+        archive = build_report_cards_zip(cards, workers=1)
+        try:
+            with zipfile.ZipFile(archive) as bundle:
+                self.assertEqual(
+                    bundle.namelist(), [card_filename(card) for card in cards]
+                )
+                for name in bundle.namelist():
+                    self.assertTrue(bundle.read(name).startswith(b'%PDF'), name)
+        finally:
+            archive.close()
+
+        self.assertEqual(len(cards), len(self.students))
+        self.assertEqual(card_filename(cards[0]), '8A/002_s2.pdf')
+
+    def test_report_cards_view_streams_zip(self):
+        self.client.force_login(self.teacher)
+        response = self.client.get(
+            reverse('marks:report_cards'), {'exam': 'Final', 'output': 'zip'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+
+        with zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content))) as bundle:
+            self.assertEqual(len(bundle.namelist()), len(self.students))
+
+    def test_report_cards_scope(self):
+        student = self.students[0]
+        self.client.force_login(student)
+        self.assertEqual(self.client.get(reverse('marks:report_cards')).status_code, 403)
 
-# Create your tests here.
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse('marks:report_cards'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['exams']), ['Final'])
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import upload_marks, my_marks
+from .views import upload_marks, my_marks, class_analytics, report_cards
 
 app_name = 'marks'   # ✅ Namespacing (BEST PRACTICE)
 
@@ -17,4 +17,18 @@ urlpatterns = [
         my_marks,
         name='my_marks'
     ),
+
+    # 📈 TEACHER / ADMIN: Class marks analytics
+    path(
+        'class-analytics/',
+        class_analytics,
+        name='class_analytics'
+    ),
+
+    # 🧾 TEACHER / ADMIN: Batch report cards (PDF / ZIP)
+    path(
+        'report-cards/',
+        report_cards,
+        name='report_cards'
+    ),
 ]
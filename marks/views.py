@@ -1,10 +1,19 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.http import FileResponse, HttpResponseForbidden
 from django.contrib import messages
+from django.core.exceptions import ValidationError
 
-from accounts.models import StudentProfile
-from .models import Subject, StudentMark
+from accounts.models import StudentProfile, User
+from accounts.utils import is_ascii_digits
+from . import analytics
+from .report_cards import (
+    build_report_cards,
+    build_report_cards_pdf,
+    build_report_cards_zip,
+)
+from .models import GRADE_CHOICES, Subject, StudentMark
+from .services import bulk_upsert_marks
 
 
 # ==================================================
@@ -74,7 +83,11 @@ def upload_marks(request):
             messages.error(request, "Subject and total marks are required ❌")
             return redirect('marks:upload_marks')
 
-        if not total_marks.isdigit() or int(total_marks) <= 0:
+        if not is_ascii_digits(subject_id):
+            messages.error(request, "Invalid subject ❌")
+            return redirect('marks:upload_marks')
+
+        if not is_ascii_digits(total_marks) or int(total_marks) <= 0:
             messages.error(request, "Total marks must be a positive number ❌")
             return redirect('marks:upload_marks')
 
@@ -85,40 +98,37 @@ def upload_marks(request):
         )
 
         total_marks = int(total_marks)
-        saved_count = 0
 
         # -----------------------------
-        # 🔁 SAVE MARKS (ROLL WISE)
+        # ⚡ BULK SAVE (ONE UPSERT)
         # -----------------------------
-        for sp in student_profiles:
-            student = sp.user
-            marks_value = request.POST.get(f"marks_{student.id}")
-
-            if not marks_value or not marks_value.isdigit():
-                continue
-
-            marks_value = int(marks_value)
-
-            if marks_value < 0 or marks_value > total_marks:
-                continue
-
-            StudentMark.objects.update_or_create(
-                student=student,
-                subject=subject,
-                exam_name=exam_name,
-                defaults={
-                    'marks_obtained': marks_value,
-                    'total_marks': total_marks,
-                    'uploaded_by': request.user
-                }
+        rows = [
+            (sp.user, request.POST.get(f"marks_{sp.user.id}"))
+            for sp in student_profiles
+        ]
+
+        try:
+            result = bulk_upsert_marks(
+                request.user,
+                subject,
+                exam_name,
+                total_marks,
+                rows
             )
-
-            saved_count += 1
+        except ValidationError as exc:
+            messages.error(request, f"{exc.messages[0]} ❌")
+            return redirect('marks:upload_marks')
 
         # -----------------------------
         # ✅ FEEDBACK
         # -----------------------------
-        if saved_count == 0:
+        for error in result.errors:
+            messages.error(
+                request,
+                f"{error.username}: '{error.value}' – {error.message} ❌"
+            )
+
+        if result.saved_count == 0:
             messages.warning(
                 request,
                 "No marks were saved. Please enter valid marks ⚠️"
@@ -126,7 +136,7 @@ def upload_marks(request):
         else:
             messages.success(
                 request,
-                f"Marks uploaded successfully ✅ ({saved_count} students)"
+                f"Marks uploaded successfully ✅ ({result.saved_count} students)"
             )
 
         return redirect('marks:upload_marks')
@@ -153,24 +163,35 @@ def upload_marks(request):
 def my_marks(request):
     """
     Student apne hi marks dekhe
-    + Exam-wise filter
+    + Exam-wise / grade-wise filter
+    + Percentage sort
     """
 
     if getattr(request.user, 'role', None) != 'STUDENT':
         return HttpResponseForbidden("Access Denied")
 
     selected_exam = request.GET.get('exam')
+    selected_grade = request.GET.get('grade')
+    sort = request.GET.get('sort')
 
+    # ⚡ Percentage + grade SQL me (per-row method call nahi)
     marks_qs = (
         StudentMark.objects
         .filter(student=request.user)
         .select_related('subject')
+        .with_grade()
     )
 
     if selected_exam:
         marks_qs = marks_qs.filter(exam_name=selected_exam)
 
-    marks_qs = marks_qs.order_by('subject__name')
+    if selected_grade:
+        marks_qs = marks_qs.filter(grade_value=selected_grade)
+
+    if sort == 'percentage':
+        marks_qs = marks_qs.order_by('-percent_value', 'subject__name')
+    else:
+        marks_qs = marks_qs.order_by('subject__name')
 
     # Dropdown ke liye exam list
     exams = (
@@ -186,6 +207,161 @@ def my_marks(request):
         {
             'marks': marks_qs,
             'exams': exams,
-            'selected_exam': selected_exam
+            'grades': GRADE_CHOICES,
+            'selected_exam': selected_exam,
+            'selected_grade': selected_grade,
+            'sort': sort,
+        }
+    )
+
+
+# ==================================================
+# 🔐 TEACHER / ADMIN: CLASS SCOPE (analytics + report cards)
+# ==================================================
+def _class_scope(request):
+    """
+    ((class_name, section), None) ya (None, HttpResponseForbidden)
+
+    - TEACHER: apni assigned class + section
+    - ADMIN: ?class= & ?section= (dono optional)
+    """
+
+    role = getattr(request.user, 'role', None)
+
+    if role == 'TEACHER':
+        teacher_profile = getattr(request.user, 'teacher_profile', None)
+        if not teacher_profile:
+            return None, HttpResponseForbidden("Teacher profile not found")
+        return (teacher_profile.assigned_class, teacher_profile.assigned_section), None
+
+    if role == 'ADMIN':
+        return (
+            request.GET.get('class') or None,
+            request.GET.get('section') or None,
+        ), None
+
+    return None, HttpResponseForbidden("Access Denied")
+
+
+def _exam_choices(class_name=None):
+    """
+    Exam dropdown: class ke (ya saare) distinct exam names
+    """
+    exams = StudentMark.objects.all()
+    if class_name:
+        exams = exams.filter(subject__class_name=class_name)
+    return exams.order_by('exam_name').values_list('exam_name', flat=True).distinct()
+
+
+# ==================================================
+# 📈 TEACHER / ADMIN: CLASS MARKS ANALYTICS
+# ==================================================
+@login_required
+def class_analytics(request):
+    """
+    Class-wide marks analytics (NumPy)
+
+    - TEACHER: apni assigned class + section
+    - ADMIN: ?class= & ?section= se koi bhi class
+    - Exam / subject wise stats, grade distribution, toppers
+    """
+
+    scope, forbidden = _class_scope(request)
+    if forbidden:
+        return forbidden
+    class_name, section = scope
+
+    selected_exam = request.GET.get('exam') or None
+
+    frame = analytics.load_marks(
+        class_name=class_name,
+        section=section,
+        exam_name=selected_exam
+    )
+    toppers = analytics.toppers(analytics.exam_ranks(frame))
+
+    usernames = dict(
+        User.objects
+        .filter(id__in={row.student_id for rows in toppers.values() for row in rows})
+        .values_list('id', 'username')
+    )
+
+    # Dropdown ke liye exam list
+    exams = _exam_choices(class_name)
+
+    return render(
+        request,
+        'marks/class_analytics.html',
+        {
+            'stats': analytics.subject_stats(frame),
+            'toppers': {
+                exam_name: [(row, usernames.get(row.student_id)) for row in rows]
+                for exam_name, rows in toppers.items()
+            },
+            'exams': exams,
+            'selected_exam': selected_exam,
+            'class_name': class_name,
+            'section': section,
+        }
+    )
+
+
+# ==================================================
+# 🧾 TEACHER / ADMIN: BATCH REPORT CARDS (PDF / ZIP)
+# ==================================================
+@login_required
+def report_cards(request):
+    """
+    Exam ke report cards poori class / section ke liye
+
+    - TEACHER: apni assigned class + section
+    - ADMIN: ?class= (zaroori) & ?section= (optional → saare sections)
+    - ?exam= & ?output=pdf → ek merged PDF
+    - ?exam= & ?output=zip → har student ka alag PDF, zip me
+    """
+
+    scope, forbidden = _class_scope(request)
+    if forbidden:
+        return forbidden
+    class_name, section = scope
+
+    selected_exam = request.GET.get('exam') or None
+    output = request.GET.get('output')
+
+    if class_name and selected_exam and output in ('pdf', 'zip'):
+        cards = build_report_cards(class_name, selected_exam, section=section)
+
+        if not cards:
+            messages.warning(request, "No marks found for this exam ⚠️")
+        else:
+            name = f"report_cards_{class_name}{section or ''}_{selected_exam}"
+            name = name.replace(' ', '_')
+
+            if output == 'zip':
+                return FileResponse(
+                    build_report_cards_zip(cards),
+                    as_attachment=True,
+                    filename=f"{name}.zip",
+                    content_type='application/zip',
+                )
+
+            return FileResponse(
+                build_report_cards_pdf(cards),
+                as_attachment=True,
+                filename=f"{name}.pdf",
+                content_type='application/pdf',
+            )
+
+    # Dropdown ke liye exam list
+    exams = _exam_choices(class_name)
+
+    return render(
+        request,
+        'marks/report_cards.html',
+        {
+            'exams': exams,
+            'selected_exam': selected_exam,
+            'class_name': class_name,
+            'section': section,
         }
     )
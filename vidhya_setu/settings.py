@@ -57,6 +57,9 @@ MIDDLEWARE = [
 
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+
+    # Query / latency profiling (PERFORMANCE_PROFILING = True par hi active)
+    'dashboard.profiling.ProfilingMiddleware',
 ]
 
 
@@ -105,6 +108,75 @@ DATABASES = {
 }
 
 
+# --------------------
+# REST API
+# --------------------
+REST_FRAMEWORK = {
+    'DEFAULT_VERSIONING_CLASS': 'rest_framework.versioning.URLPathVersioning',
+    'DEFAULT_VERSION': 'v1',
+    'ALLOWED_VERSIONS': ('v1',),
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+    ),
+    'DEFAULT_PERMISSION_CLASSES': (
+        'rest_framework.permissions.IsAuthenticated',
+    ),
+}
+
+
+# --------------------
+# CACHE
+# --------------------
+# Local-memory by default; shared backend (Redis / Memcached) ke liye
+# sirf BACKEND + LOCATION badlo
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'vidhya-setu',
+    }
+}
+
+# Admin dashboard counters kis cache alias me rahenge
+DASHBOARD_CACHE_ALIAS = 'default'
+DASHBOARD_METRICS_TIMEOUT = 300  # seconds
+
+# Paid fee receipts ke rendered PDF bytes
+FEE_RECEIPT_CACHE_ALIAS = 'default'
+FEE_RECEIPT_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # seconds
+
+# Fees report ke month / class filter dropdowns
+FEE_SUMMARY_CACHE_ALIAS = 'default'
+
+# Attendance API ke last-modified stamps (multi-process deploy me
+# shared backend chahiye, warna dusre process ka stamp purana)
+ATTENDANCE_CACHE_ALIAS = 'default'
+
+# Notice / homework listing pages (versioned, signals se invalidate)
+LISTING_CACHE_ALIAS = 'default'
+LISTING_CACHE_TIMEOUT = 60 * 60  # seconds
+
+
+# --------------------
+# ATTENDANCE
+# --------------------
+# True → har Attendance write AttendanceBitmap (1 row per student-month)
+# me bhi mirror hoga. Pehli baar on karne se pehle:
+#   python manage.py build_attendance_bitmaps
+ATTENDANCE_BITMAP_STORE = False
+
+
+# --------------------
+# PERFORMANCE PROFILING
+# --------------------
+# True → har request ka query count, SQL / template time, duplicate
+# queries → Server-Timing header + /dashboard/performance/ (staff only)
+PERFORMANCE_PROFILING = False
+
+# Har view ke latest kitne requests ka histogram
+PERFORMANCE_PROFILING_WINDOW = 500
+
+
 # --------------------
 # PASSWORD VALIDATION
 # --------------------
@@ -116,6 +188,15 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Bulk account creation me password hashing processes
+# (None = saare CPU cores)
+PASSWORD_HASH_WORKERS = None
+
+# Batch report cards ke PDF render processes
+# (None = saare CPU cores)
+REPORT_CARD_WORKERS = None
+
+
 # --------------------
 # INTERNATIONALIZATION
 # --------------------
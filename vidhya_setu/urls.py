@@ -31,4 +31,10 @@ urlpatterns = [
     # Fees
     # ----------------------------
     path('fees/', include('fees.urls')),
+
+    # ----------------------------
+    # REST API (versioned: /api/v1/...)
+    # ----------------------------
+    path('api/<str:version>/marks/', include('marks.api_urls')),
+    path('api/<str:version>/attendance/', include('attendance.api_urls')),
 ]